@@ -52,6 +52,10 @@ from dotenv import load_dotenv
 SCRIPT_DIR = Path(__file__).parent
 CORE_DIR = SCRIPT_DIR.parent
 PROJECT_ROOT = CORE_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.auth.oauth import get_access_token as get_cached_access_token
+
 SNAPSHOTS_DIR = PROJECT_ROOT / "snapshots"
 PLANS_DIR = PROJECT_ROOT / "plans"
 
@@ -96,19 +100,8 @@ def load_env():
 
 
 def get_access_token():
-    """Get OAuth access token via refresh token."""
-    response = requests.post(
-        "https://oauth2.googleapis.com/token",
-        data={
-            "client_id": os.getenv("GOOGLE_ADS_CLIENT_ID"),
-            "client_secret": os.getenv("GOOGLE_ADS_CLIENT_SECRET"),
-            "refresh_token": os.getenv("GOOGLE_ADS_REFRESH_TOKEN"),
-            "grant_type": "refresh_token",
-        },
-    )
-    if response.status_code != 200:
-        raise Exception(f"Token refresh failed: {response.text}")
-    return response.json()["access_token"]
+    """Get OAuth access token (shared, cached across processes; see core/auth/oauth.py)."""
+    return get_cached_access_token()
 
 
 # =============================================================================
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Shared Google OAuth Access Token Provider
+
+Every script used to exchange the refresh token at startup. The provider
+here caches the access token in memory and in an on-disk file shared by all
+processes (bin/dump, bin/apply, diag and legacy scripts), so back-to-back
+invocations reuse one token until it nears expiry.
+
+    ~/.cache/hvac-ads-2026/google_oauth_{credential hash}.json   (mode 600)
+
+- The cache file is keyed by a hash of client ID + refresh token, so other
+  credentials never pick up the wrong token.
+- Refreshes take an exclusive file lock and re-read the cache first, so
+  processes starting together perform a single token exchange.
+- Tokens are treated as expired REFRESH_MARGIN_SECONDS before Google's
+  expires_in, so a caller never starts work with a token about to lapse.
+- start_background_refresh() keeps a long-running process's token fresh
+  shortly before expiry.
+
+Configuration (environment, optional):
+    OAUTH_TOKEN_CACHE_DIR   Cache directory (default: ~/.cache/hvac-ads-2026)
+    OAUTH_TOKEN_CACHE       Set to "off" to disable the on-disk cache
+
+Usage:
+    from core.auth.oauth import get_access_token
+    access_token = get_access_token()            # GOOGLE_ADS_* credentials from env
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # Windows: cache still works, without cross-process locking
+    fcntl = None
+
+TOKEN_URL = "https://oauth2.googleapis.com/token"
+
+# Refresh this long before expires_in runs out
+REFRESH_MARGIN_SECONDS = 300
+
+# Google access tokens last an hour; used if a response omits expires_in
+DEFAULT_EXPIRES_IN = 3600
+
+
+def default_cache_dir() -> Path:
+    return Path(os.getenv("OAUTH_TOKEN_CACHE_DIR") or Path.home() / ".cache" / "hvac-ads-2026")
+
+
+class TokenProvider:
+    """Cached access token for one (client ID, client secret, refresh token)."""
+
+    def __init__(self, client_id: str, client_secret: str, refresh_token: str, cache_dir: Path = None,
+                 refresh_margin: int = REFRESH_MARGIN_SECONDS):
+        if not (client_id and client_secret and refresh_token):
+            raise Exception("OAuth client ID, client secret and refresh token are required")
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self.refresh_margin = refresh_margin
+
+        use_disk = (os.getenv("OAUTH_TOKEN_CACHE") or "").lower() != "off"
+        digest = hashlib.sha256(f"{client_id}:{refresh_token}".encode("utf-8")).hexdigest()[:16]
+        cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_path = cache_dir / f"google_oauth_{digest}.json" if use_disk else None
+
+        self._token = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher = None
+        self.exchanges = 0  # token exchanges made by this process
+
+    # -- public ---------------------------------------------------------------
+
+    def get_token(self) -> str:
+        """Return a token valid for at least refresh_margin seconds."""
+        with self._lock:
+            if self._valid(self._expires_at):
+                return self._token
+            if self.cache_path is None:
+                self._store(*self._exchange())
+                return self._token
+            with self._file_lock():
+                cached = self._read_cache()
+                if cached and self._valid(cached["expires_at"]):
+                    self._store(cached["access_token"], cached["expires_at"])
+                else:
+                    self._store(*self._exchange())
+                    self._write_cache()
+            return self._token
+
+    __call__ = get_token
+
+    @property
+    def expires_at(self) -> float:
+        return self._expires_at
+
+    def start_background_refresh(self):
+        """Refresh in a daemon thread shortly before each token expires."""
+        if self._refresher is not None:
+            return
+        self.get_token()
+        self._refresher = threading.Thread(target=self._refresh_loop, name="oauth-refresh", daemon=True)
+        self._refresher.start()
+
+    def stop(self):
+        self._stop.set()
+
+    # -- internals ------------------------------------------------------------
+
+    def _valid(self, expires_at: float) -> bool:
+        return expires_at - self.refresh_margin > time.time()
+
+    def _store(self, token: str, expires_at: float):
+        self._token = token
+        self._expires_at = expires_at
+
+    def _exchange(self) -> tuple:
+        response = requests.post(
+            TOKEN_URL,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "refresh_token": self.refresh_token,
+                "grant_type": "refresh_token",
+            },
+            timeout=30,
+        )
+        if response.status_code != 200:
+            raise Exception(f"Token refresh failed: {response.text}")
+        data = response.json()
+        self.exchanges += 1
+        return data["access_token"], time.time() + int(data.get("expires_in") or DEFAULT_EXPIRES_IN)
+
+    @contextmanager
+    def _file_lock(self):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        with open(self.cache_path.with_suffix(".lock"), "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+            return {"access_token": data["access_token"], "expires_at": float(data["expires_at"])}
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_cache(self):
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_path.parent, prefix=".oauth-")
+        try:
+            os.chmod(tmp_name, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"access_token": self._token, "expires_at": self._expires_at}, f)
+            os.replace(tmp_name, self.cache_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            # Wake just after the token enters the refresh margin
+            wait = max(1.0, self._expires_at - self.refresh_margin - time.time() + 1)
+            if self._stop.wait(wait):
+                return
+            try:
+                self.get_token()
+            except Exception:
+                # Try again shortly; callers still refresh on demand
+                self._stop.wait(30)
+
+
+_providers = {}
+_providers_lock = threading.Lock()
+
+
+def get_token_provider(client_id: str = None, client_secret: str = None, refresh_token: str = None) -> TokenProvider:
+    """Process-wide provider for the given credentials (GOOGLE_ADS_* env by default)."""
+    client_id = client_id or os.getenv("GOOGLE_ADS_CLIENT_ID")
+    client_secret = client_secret or os.getenv("GOOGLE_ADS_CLIENT_SECRET")
+    refresh_token = refresh_token or os.getenv("GOOGLE_ADS_REFRESH_TOKEN")
+    key = (client_id, client_secret, refresh_token)
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            provider = _providers[key] = TokenProvider(client_id, client_secret, refresh_token)
+        return provider
+
+
+def get_access_token(client_id: str = None, client_secret: str = None, refresh_token: str = None) -> str:
+    """Cached access token (GOOGLE_ADS_* credentials from the environment by default)."""
+    return get_token_provider(client_id, client_secret, refresh_token).get_token()
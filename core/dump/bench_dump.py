@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Offline Dump Benchmark - Phase A (NO NETWORK)
+
+Replays a recorded cassette (see core/dump/cassette.py) through the full
+dump - fetch, normalize, index, manifest - and reports end-to-end and
+per-fetcher timings. Each run writes into a fresh temporary project root,
+so the performance store and blob store start cold and runs are
+comparable.
+
+Record a cassette once against the live APIs:
+    bin/dump --record cassettes/base
+
+Then benchmark anywhere, without credentials:
+    python core/dump/bench_dump.py --cassette cassettes/base
+    python core/dump/bench_dump.py --cassette cassettes/base --latency recorded
+    python core/dump/bench_dump.py --cassette cassettes/base --latency 0.05 --workers 1,6,12
+    python core/dump/bench_dump.py --cassette cassettes/base --runs 5 --json bench.json
+    python core/dump/bench_dump.py --cassette cassettes/base --check   # Replay is order-independent
+
+Options:
+    --cassette <dir>      Recorded cassette (required)
+    --runs N              Runs per configuration (default: 3)
+    --latency X           Per-request delay: seconds, or "recorded" (default: none)
+    --workers A,B,...     Fetch worker counts to compare (default: dump default)
+    --json <path>         Also write the results as JSON
+    --verbose             Show the dump's own output
+    --check               Instead of timing, replay once with one worker per
+                          change history / GSC pool and once with CHECK_POOL_WORKERS,
+                          and fail unless every raw file has the same records
+    Any other flags (--encoding gzip, --no-dedup, ...) are passed to the dump.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CORE_DIR = SCRIPT_DIR.parent
+PROJECT_ROOT = CORE_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.dump import dump_state
+from core.snapshot import codec as snapshot_codec
+
+OWN_OPTIONS = {"--cassette", "--runs", "--latency", "--workers", "--json"}
+OWN_FLAGS = {"--verbose", "--check"}
+
+# Pools whose requests run concurrently and differ only in their dates
+POOL_WORKER_VARIABLES = ("DUMP_CHANGE_HISTORY_WORKERS", "DUMP_GSC_WORKERS")
+CHECK_POOL_WORKERS = 4
+
+
+def parse_args(argv: list) -> dict:
+    args = {"cassette": None, "runs": 3, "latency": None, "workers": [None], "json": None,
+            "verbose": False, "check": False, "passthrough": []}
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg in OWN_OPTIONS and i + 1 < len(argv):
+            value = argv[i + 1]
+            if arg == "--cassette":
+                args["cassette"] = Path(value)
+            elif arg == "--runs":
+                args["runs"] = int(value)
+            elif arg == "--latency":
+                args["latency"] = value
+            elif arg == "--workers":
+                args["workers"] = [int(w) for w in value.split(",")]
+            elif arg == "--json":
+                args["json"] = Path(value)
+            i += 2
+            continue
+        if arg in OWN_FLAGS:
+            args[arg[2:]] = True
+        else:
+            args["passthrough"].append(arg)
+        i += 1
+    return args
+
+
+def raw_digests(snapshot_dir: Path) -> dict:
+    """{raw file: digest of its records} (extraction timestamps left out)."""
+    digests = {}
+    for path in sorted((snapshot_dir / "raw").rglob("*.json")):
+        records = snapshot_codec.read_json(path).get("records")
+        encoded = json.dumps(records, sort_keys=True, default=str).encode("utf-8")
+        digests[str(path.relative_to(snapshot_dir))] = hashlib.sha256(encoded).hexdigest()
+    return digests
+
+
+def run_once(cassette: Path, workers, latency, passthrough: list, verbose: bool, pool_workers: int = None) -> dict:
+    """Run one replayed dump in a throwaway project root; return its timings.
+
+    pool_workers sets the change history and GSC pool sizes for this run.
+    """
+    saved_env = {name: os.environ.get(name) for name in POOL_WORKER_VARIABLES}
+    if pool_workers is not None:
+        os.environ.update({name: str(pool_workers) for name in POOL_WORKER_VARIABLES})
+    with tempfile.TemporaryDirectory(prefix="bench-dump-") as root:
+        root = Path(root)
+        dump_state.SNAPSHOTS_DIR = root / "snapshots"
+        dump_state.PERF_STORE_DIR = root / "store" / "performance"
+        dump_state.BLOB_STORE_DIR = root / "store" / "blobs"
+
+        argv = ["dump_state.py", "--replay", str(cassette)] + passthrough
+        if workers is not None:
+            argv += ["--workers", str(workers)]
+        if latency is not None:
+            argv += ["--replay-latency", latency]
+
+        saved_argv = sys.argv
+        sys.argv = argv
+        output = io.StringIO()
+        started = time.perf_counter()
+        try:
+            if verbose:
+                dump_state.main()
+            else:
+                with contextlib.redirect_stdout(output):
+                    dump_state.main()
+        except SystemExit as e:
+            raise Exception(f"Dump exited with {e.code}:\n{output.getvalue()[-2000:]}")
+        finally:
+            sys.argv = saved_argv
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+        wall = time.perf_counter() - started
+
+        snapshot_dir = next((root / "snapshots").iterdir())
+        with open(snapshot_dir / "_manifest.json", "r") as f:
+            manifest = json.load(f)
+        digests = raw_digests(snapshot_dir)
+
+    timings = manifest.get("fetch_timings", {})
+    return {
+        "end_to_end_seconds": round(wall, 3),
+        "fetch_wall_seconds": timings.get("wall_seconds"),
+        "fetch_serial_seconds": timings.get("serial_seconds"),
+        "post_fetch_seconds": round(wall - (timings.get("wall_seconds") or 0), 3),
+        "critical_path": timings.get("critical_path", []),
+        "fetchers": {name: f["duration_seconds"] for name, f in timings.get("fetchers", {}).items()},
+        "errors": manifest.get("errors", []),
+        "raw_digests": digests,
+    }
+
+
+def check_replay(args: dict) -> bool:
+    """Replay serially and concurrently; True when both runs fetched the same records."""
+    print(f"Replaying with 1 and {CHECK_POOL_WORKERS} workers per change history / GSC pool...")
+    serial = run_once(args["cassette"], args["workers"][0], None, args["passthrough"], args["verbose"], pool_workers=1)
+    concurrent = run_once(args["cassette"], args["workers"][0], None, args["passthrough"], args["verbose"],
+                          pool_workers=CHECK_POOL_WORKERS)
+    ok = True
+    for run in (serial, concurrent):
+        for error in run["errors"]:
+            print(f"  ERROR {error['file']}: {error['error'][:100]}")
+            ok = False
+    for path in sorted(set(serial["raw_digests"]) | set(concurrent["raw_digests"])):
+        if serial["raw_digests"].get(path) != concurrent["raw_digests"].get(path):
+            print(f"  MISMATCH {path}")
+            ok = False
+    print(f"Replay check: {'OK' if ok else 'FAILED'} ({len(serial['raw_digests'])} raw files compared)")
+    return ok
+
+
+def summarize(runs: list) -> dict:
+    """Median (and min/max end-to-end) across runs of one configuration."""
+    def median(key):
+        return round(statistics.median(r[key] for r in runs), 3)
+
+    fetchers = {}
+    for name in runs[0]["fetchers"]:
+        fetchers[name] = round(statistics.median(r["fetchers"].get(name, 0) for r in runs), 3)
+
+    return {
+        "runs": len(runs),
+        "end_to_end_seconds": median("end_to_end_seconds"),
+        "end_to_end_min_seconds": min(r["end_to_end_seconds"] for r in runs),
+        "end_to_end_max_seconds": max(r["end_to_end_seconds"] for r in runs),
+        "fetch_wall_seconds": median("fetch_wall_seconds"),
+        "fetch_serial_seconds": median("fetch_serial_seconds"),
+        "post_fetch_seconds": median("post_fetch_seconds"),
+        "critical_path": runs[-1]["critical_path"],
+        "fetchers": dict(sorted(fetchers.items(), key=lambda item: item[1], reverse=True)),
+        "errors": runs[-1]["errors"],
+    }
+
+
+def main():
+    args = parse_args(sys.argv)
+    if not args["cassette"]:
+        print("ERROR: --cassette <dir> is required")
+        print(__doc__.split("Options:")[1])
+        sys.exit(1)
+    if not (args["cassette"] / "interactions.jsonl").exists():
+        print(f"ERROR: No cassette at {args['cassette']}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("DUMP BENCHMARK (cassette replay, no network)")
+    print("=" * 60)
+    print()
+    print(f"Cassette: {args['cassette']}")
+    if args["check"]:
+        print()
+        sys.exit(0 if check_replay(args) else 1)
+    print(f"Latency:  {args['latency'] or 'none'}")
+    print(f"Runs:     {args['runs']} per configuration")
+    if args["passthrough"]:
+        print(f"Dump flags: {' '.join(args['passthrough'])}")
+    print()
+
+    results = {}
+    for workers in args["workers"]:
+        label = f"workers={workers if workers is not None else dump_state.DEFAULT_MAX_WORKERS}"
+        runs = []
+        for n in range(args["runs"]):
+            run = run_once(args["cassette"], workers, args["latency"], args["passthrough"], args["verbose"])
+            print(f"  {label} run {n + 1}: {run['end_to_end_seconds']:.2f}s "
+                  f"(fetch {run['fetch_wall_seconds']:.2f}s)")
+            runs.append(run)
+        results[label] = summarize(runs)
+    print()
+
+    for label, summary in results.items():
+        print(f"{label}")
+        print(f"  End-to-end:  {summary['end_to_end_seconds']:.2f}s median "
+              f"({summary['end_to_end_min_seconds']:.2f}-{summary['end_to_end_max_seconds']:.2f}s)")
+        print(f"  Fetch:       {summary['fetch_wall_seconds']:.2f}s wall, "
+              f"{summary['fetch_serial_seconds']:.2f}s serial")
+        print(f"  Post-fetch:  {summary['post_fetch_seconds']:.2f}s (write, normalize, index, manifest)")
+        print(f"  Critical path: {' -> '.join(summary['critical_path'])}")
+        print("  Per fetcher (median):")
+        for name, seconds in summary["fetchers"].items():
+            print(f"    {name:<28} {seconds:8.3f}s")
+        if summary["errors"]:
+            print(f"  Errors: {len(summary['errors'])} (e.g. {summary['errors'][0]['file']}: "
+                  f"{summary['errors'][0]['error'][:60]})")
+        print()
+
+    if args["json"]:
+        with open(args["json"], "w") as f:
+            json.dump({"cassette": str(args["cassette"]), "latency": args["latency"], "results": results}, f, indent=2)
+        print(f"Results written to {args['json']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Phase A: Content-Addressed Blob Store for Snapshot Files
+
+Snapshot JSON files are written once into a shared blob store keyed by the
+SHA-256 of their bytes:
+
+    store/blobs/{digest[:2]}/{digest}
+
+and then hardlinked into the snapshot directory. A file that is identical to
+one in an earlier snapshot (Merchant products, assets, _index.bin on a quiet
+day) costs no additional disk space. Where hardlinks are unavailable (e.g.
+snapshots on another filesystem) the blob is copied instead.
+
+Every snapshot's _manifest.json also records a {relative path: digest} map,
+so a sync job can upload only blobs it has not seen plus the manifests.
+
+Blobs are made read-only: snapshot files are immutable, and because a
+hardlink shares its inode, an in-place edit of one snapshot file would
+otherwise silently change every snapshot that references the same blob.
+"""
+
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+import threading
+from pathlib import Path
+
+HASH_ALGORITHM = "sha256"
+
+
+class _HashingWriter:
+    """Binary file wrapper that hashes and counts bytes as they are written."""
+
+    def __init__(self, raw_file):
+        self._file = raw_file
+        self.hash = hashlib.new(HASH_ALGORITHM)
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.hash.update(data)
+        self.size += len(data)
+        return self._file.write(data)
+
+    def flush(self):
+        self._file.flush()
+
+
+class BlobStore:
+    """Shared content-addressed store that snapshot files are linked from."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.tmp_dir = self.root / "tmp"
+        self._lock = threading.Lock()
+        self._refs = {}  # absolute snapshot file path -> digest
+        self._outcomes = {}  # absolute snapshot file path -> ("new" | "reused", bytes, copied)
+        self.stats = {"files": 0, "new_blobs": 0, "new_bytes": 0, "reused_blobs": 0, "reused_bytes": 0,
+                      "copied": 0}
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def write(self, dest: Path, write_fn) -> str:
+        """Write a file through the store and link it at `dest`.
+
+        Args:
+            dest: Final snapshot file path
+            write_fn: Callable receiving a binary writable object; its
+                output is hashed while streaming
+
+        Returns:
+            Hex digest of the file content
+        """
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as raw_file:
+                writer = _HashingWriter(raw_file)
+                write_fn(writer)
+            digest = writer.hash.hexdigest()
+            blob = self.blob_path(digest)
+
+            with self._lock:
+                if blob.exists():
+                    os.unlink(tmp_name)
+                    outcome = "reused"
+                else:
+                    blob.parent.mkdir(parents=True, exist_ok=True)
+                    os.chmod(tmp_name, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+                    os.replace(tmp_name, blob)
+                    outcome = "new"
+                self.stats[f"{outcome}_blobs"] += 1
+                self.stats[f"{outcome}_bytes"] += writer.size
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        copied = self._link(blob, Path(dest))
+        with self._lock:
+            self._refs[str(Path(dest).resolve())] = digest
+            self._outcomes[str(Path(dest).resolve())] = (outcome, writer.size, copied)
+            self.stats["files"] += 1
+        return digest
+
+    def _link(self, blob: Path, dest: Path):
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists() and os.path.samefile(blob, dest):
+            return False  # already linked (e.g. rewritten by a resumed dump)
+        # Link (or copy) beside dest and rename over it, so dest is always
+        # either the old file or the complete new one
+        tmp_dest = dest.with_name(f".{dest.name}.{threading.get_ident()}.tmp")
+        if tmp_dest.exists() or tmp_dest.is_symlink():
+            tmp_dest.unlink()
+        try:
+            os.link(blob, tmp_dest)
+            copied = False
+        except OSError:
+            shutil.copyfile(blob, tmp_dest)
+            with self._lock:
+                self.stats["copied"] += 1
+            copied = True
+        os.replace(tmp_dest, dest)
+        return copied
+
+    def refs_under(self, snapshot_dir: Path) -> dict:
+        """{path relative to snapshot_dir: digest} for files written under it."""
+        prefix = str(Path(snapshot_dir).resolve()) + os.sep
+        with self._lock:
+            return {
+                path[len(prefix):].replace(os.sep, "/"): digest
+                for path, digest in sorted(self._refs.items())
+                if path.startswith(prefix)
+            }
+
+    def manifest_section(self, snapshot_dir: Path, project_root: Path = None) -> dict:
+        """Blob map and dedup stats for _manifest.json."""
+        root = self.root
+        if project_root is not None:
+            try:
+                root = self.root.resolve().relative_to(Path(project_root).resolve())
+            except ValueError:
+                pass
+        # Stats cover this snapshot's files only: one store may serve several
+        # concurrent snapshots (multi-account dumps)
+        prefix = str(Path(snapshot_dir).resolve()) + os.sep
+        stats = {"files": 0, "new_blobs": 0, "new_bytes": 0, "reused_blobs": 0, "reused_bytes": 0, "copied": 0}
+        with self._lock:
+            for path, (outcome, size, copied) in self._outcomes.items():
+                if path.startswith(prefix):
+                    stats["files"] += 1
+                    stats[f"{outcome}_blobs"] += 1
+                    stats[f"{outcome}_bytes"] += size
+                    stats["copied"] += 1 if copied else 0
+        return {
+            "store": str(root),
+            "algorithm": HASH_ALGORITHM,
+            "stats": stats,
+            "files": self.refs_under(snapshot_dir),
+        }
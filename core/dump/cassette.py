@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Phase A: Record/Replay HTTP Cassettes for the Dump
+
+A cassette is a directory capturing every HTTP exchange of one dump:
+
+    cassettes/{name}/
+        meta.json          # account IDs the dump ran against, recorded_utc
+        interactions.jsonl # one line per request: key, seq, method, url, status, elapsed
+        bodies/{key}-{seq} # raw response body (every page, every stream)
+
+RecordingTransport wraps the live HttpTransport and writes the cassette as
+the dump runs. ReplayTransport serves the cassette back with no network or
+credentials, optionally sleeping per request to simulate API latency, so
+concurrency, pooling and streaming changes can be timed offline.
+
+Requests are matched on method, URL, query params and JSON body, with
+pageToken kept (each page is its own entry). Dates move every day, so they
+are keyed by their day offset from the dump's date - recording day when
+recording, today when replaying:
+
+    GSC startDate/endDate               "2026-01-17"            -> <day-2>
+    GAQL segments.date literals         '2026-01-17'            -> '<day-2>'
+    GAQL change_date_time literals      '2026-01-17 12:00:00'   -> '<day-2> 12:00:00'
+
+so each GSC day partition and each change history time slice (including the
+halves of a split slice) keeps its own entries however many run at once.
+Any other date is masked. Identical requests are replayed in the order they
+were recorded.
+
+Only the final response of each request is recorded (after transport
+retries). Request headers - and so credentials - are never written.
+Response bodies contain account data: keep cassettes out of git.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# YYYY-MM-DD, optionally followed by a time (GAQL change_event filters)
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?)?")
+
+# A JSON value that is a date and nothing else (GSC startDate/endDate)
+DATE_VALUE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# A quoted date or datetime literal inside a GAQL query
+GAQL_DATE_LITERAL = re.compile(r"'(\d{4}-\d{2}-\d{2})( \d{2}:\d{2}:\d{2})?'")
+
+RECORDED_HEADERS = ("Content-Type",)
+
+
+def _day(value: str, reference: date) -> str:
+    return f"<day{(date.fromisoformat(value) - reference).days:+d}>"
+
+
+def _day_offsets(value, reference: date):
+    """Copy of a JSON body with dates replaced by "<day-N>" relative to reference.
+
+    Covers values that are exactly a date and quoted date(time) literals in
+    strings such as GAQL queries (the time of day is kept).
+    """
+    if isinstance(value, dict):
+        return {k: _day_offsets(v, reference) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_day_offsets(v, reference) for v in value]
+    if isinstance(value, str):
+        if DATE_VALUE.match(value):
+            return _day(value, reference)
+        return GAQL_DATE_LITERAL.sub(lambda m: f"'{_day(m.group(1), reference)}{m.group(2) or ''}'", value)
+    return value
+
+
+def request_key(method: str, url: str, params: dict = None, json_body=None, reference: date = None) -> str:
+    """Stable match key for a request, ignoring headers and dates.
+
+    With a reference date, dates in the JSON body (exact date values and
+    GAQL literals) are keyed by their offset from it, so requests that
+    differ only in those dates (one per partition or slice) stay distinct;
+    all other dates are masked.
+    """
+    if reference is not None and json_body is not None:
+        json_body = _day_offsets(json_body, reference)
+    canonical = json.dumps(
+        {"method": method.upper(), "url": url, "params": params or {}, "json": json_body},
+        sort_keys=True,
+        default=str,
+    )
+    canonical = DATE_PATTERN.sub("<date>", canonical)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:20]
+
+
+class Cassette:
+    """On-disk store of recorded interactions."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.bodies_dir = self.directory / "bodies"
+        self.index_path = self.directory / "interactions.jsonl"
+        self.meta_path = self.directory / "meta.json"
+        self._lock = threading.Lock()
+        self._next_seq = {}
+
+    @property
+    def meta(self) -> dict:
+        if not self.meta_path.exists():
+            return {}
+        with open(self.meta_path, "r") as f:
+            return json.load(f)
+
+    def start_recording(self, meta: dict):
+        """Create (or reset) the cassette directory."""
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        for body in self.bodies_dir.iterdir():
+            body.unlink()
+        self.index_path.write_text("")
+        with open(self.meta_path, "w") as f:
+            json.dump({"recorded_utc": datetime.utcnow().isoformat() + "Z", **meta}, f, indent=2)
+
+    def record(self, key: str, method: str, url: str, params, response: requests.Response, elapsed: float):
+        with self._lock:
+            seq = self._next_seq.get(key, 0)
+            self._next_seq[key] = seq + 1
+            body = response.content
+            (self.bodies_dir / f"{key}-{seq}").write_bytes(body)
+            entry = {
+                "key": key,
+                "seq": seq,
+                "method": method.upper(),
+                "url": url,
+                "params": params,
+                "status": response.status_code,
+                "headers": {h: response.headers[h] for h in RECORDED_HEADERS if h in response.headers},
+                "bytes": len(body),
+                "elapsed_seconds": round(elapsed, 4),
+            }
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def load(self) -> dict:
+        """{key: [entries in recorded order]}"""
+        if not self.index_path.exists():
+            raise Exception(f"No cassette at {self.directory} (missing interactions.jsonl)")
+        entries = {}
+        with open(self.index_path, "r") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries.setdefault(entry["key"], []).append(entry)
+        for recorded in entries.values():
+            recorded.sort(key=lambda e: e["seq"])
+        return entries
+
+    def body(self, entry: dict) -> bytes:
+        return (self.bodies_dir / f"{entry['key']}-{entry['seq']}").read_bytes()
+
+    def recorded_date(self) -> date:
+        """UTC day the cassette was recorded (today if unknown)."""
+        recorded = self.meta.get("recorded_utc")
+        return date.fromisoformat(recorded[:10]) if recorded else datetime.utcnow().date()
+
+
+class RecordingTransport:
+    """Transport wrapper that records every response into a cassette."""
+
+    def __init__(self, inner, cassette: Cassette):
+        self.inner = inner
+        self.cassette = cassette
+        self.reference = cassette.recorded_date()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        started = time.perf_counter()
+        response = self.inner.request(method, url, **kwargs)
+        # Reading .content buffers streamed bodies; iter_content() still
+        # works afterwards, so callers are unaffected.
+        response.content
+        elapsed = time.perf_counter() - started
+        key = request_key(method, url, kwargs.get("params"), kwargs.get("json"), self.reference)
+        self.cassette.record(key, method, url, kwargs.get("params"), response, elapsed)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.inner.close()
+
+
+class ReplayTransport:
+    """Transport that answers requests from a cassette, with no network."""
+
+    def __init__(self, cassette: Cassette, latency=None, latency_scale: float = 1.0):
+        """
+        Args:
+            cassette: Recorded cassette
+            latency: None (no delay), a number of seconds per request, or
+                "recorded" to sleep each request's recorded elapsed time
+            latency_scale: Multiplier applied to the recorded latency
+        """
+        self.cassette = cassette
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.entries = cassette.load()
+        self._cursor = {}
+        self._lock = threading.Lock()
+        self.requests_served = 0
+        # The replayed dump computes its date ranges from today, as the
+        # recorded one did from its recording day
+        self.reference = datetime.utcnow().date()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        key = request_key(method, url, kwargs.get("params"), kwargs.get("json"), self.reference)
+        with self._lock:
+            recorded = self.entries.get(key, [])
+            seq = self._cursor.get(key, 0)
+            if seq >= len(recorded):
+                raise Exception(f"No cassette entry for {method} {url} "
+                                f"(key {key}, request #{seq + 1}, {len(recorded)} recorded)")
+            self._cursor[key] = seq + 1
+            self.requests_served += 1
+        entry = recorded[seq]
+
+        if self.latency == "recorded":
+            time.sleep(entry["elapsed_seconds"] * self.latency_scale)
+        elif self.latency:
+            time.sleep(float(self.latency))
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = self.cassette.body(entry)
+        response._content_consumed = True
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        pass
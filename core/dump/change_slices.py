@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Phase A: Time-Sliced Change History Extraction
+
+A single change_event query is capped by its LIMIT, so during busy weeks
+(bulk listing-group edits, say) the oldest events of the lookback window
+were silently cut off. The window is instead split into time slices, one
+per day to start with, fetched concurrently:
+
+- A slice that returns a full LIMIT of rows is saturated: its rows are
+  dropped and it is refetched as two halves, repeatedly, until every slice
+  fits (down to MIN_SLICE_SECONDS; a slice that still saturates is kept and
+  reported as truncated).
+- Each finished slice streams to a JSONL spool file (core/dump/spool.py), so
+  at most one slice per worker is in memory.
+- Slices are merged newest first, matching the old ORDER BY ... DESC, as a
+  stream when the raw file is written.
+
+Concurrency is set with DUMP_CHANGE_HISTORY_WORKERS (default 4).
+"""
+
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+
+from core.dump.incremental import CHANGE_EVENT_LIMIT
+from core.dump.spool import PartitionSpool, SpooledRecords
+
+DEFAULT_CHANGE_HISTORY_WORKERS = 4
+INITIAL_SLICE = timedelta(days=1)
+MIN_SLICE_SECONDS = 1
+
+GAQL_DATETIME = "%Y-%m-%d %H:%M:%S"
+
+
+def build_slices(start: datetime, end: datetime, size: timedelta = INITIAL_SLICE) -> list:
+    """Half-open [lo, hi) slices covering [start, end), aligned to `size` from start."""
+    slices = []
+    lo = start
+    while lo < end:
+        hi = min(lo + size, end)
+        slices.append((lo, hi))
+        lo = hi
+    return slices
+
+
+def split_slice(lo: datetime, hi: datetime) -> list:
+    """Two halves of a saturated slice, on whole seconds."""
+    mid = lo + timedelta(seconds=int((hi - lo).total_seconds()) // 2)
+    return [(lo, mid), (mid, hi)]
+
+
+def slice_query(lo: datetime, hi: datetime, limit: int, select: str) -> str:
+    """change_event query for one slice; `select` is the SELECT list (see field_registry.py)."""
+    return f"""
+        SELECT
+            {select}
+        FROM change_event
+        WHERE change_event.change_date_time >= '{lo.strftime(GAQL_DATETIME)}'
+            AND change_event.change_date_time < '{hi.strftime(GAQL_DATETIME)}'
+        ORDER BY change_event.change_date_time DESC
+        LIMIT {limit}
+    """
+
+
+def slice_key(lo: datetime, hi: datetime) -> str:
+    return f"{lo:%Y%m%dT%H%M%S}_{hi:%Y%m%dT%H%M%S}"
+
+
+def extract_change_history(client, start: datetime, end: datetime, spool_dir=None, workers: int = None,
+                           limit: int = CHANGE_EVENT_LIMIT) -> tuple:
+    """Fetch every change event in [start, end), subdividing saturated slices.
+
+    Args:
+        client: GoogleAdsClient
+        start / end: Window bounds (naive datetimes, compared as change_date_time)
+        spool_dir: Folder for slice JSONL files; None keeps rows in memory
+        workers: Slices fetched at once (default: DUMP_CHANGE_HISTORY_WORKERS or 4)
+        limit: Row limit per slice query; a slice returning this many is split
+
+    Returns:
+        (records, slices, splits): change events newest first (a
+        SpooledRecords when spooling); slices as [{"start", "end", "rows",
+        "resumed", "truncated"}], newest first; number of saturated slices
+        that were split
+    """
+    workers = workers or int(os.getenv("DUMP_CHANGE_HISTORY_WORKERS") or DEFAULT_CHANGE_HISTORY_WORKERS)
+    select = client.select_fields("change_history")
+
+    def fetch(bounds):
+        lo, hi = bounds
+        status = {"start": lo.strftime(GAQL_DATETIME), "end": hi.strftime(GAQL_DATETIME),
+                  "rows": 0, "resumed": False, "truncated": False, "saturated": False}
+        spool = PartitionSpool(spool_dir, slice_key(lo, hi)) if spool_dir else None
+        if spool:
+            done_rows = spool.completed_rows()
+            if done_rows is not None:
+                status.update(rows=done_rows, resumed=True)
+                return status, None
+
+        results = client.search(slice_query(lo, hi, limit, select))
+        if len(results) >= limit:
+            if (hi - lo).total_seconds() > MIN_SLICE_SECONDS:
+                status["saturated"] = True
+                return status, None
+            status["truncated"] = True
+
+        records = [r.get("changeEvent", {}) for r in results]
+        status["rows"] = len(records)
+        if not spool:
+            return status, records
+        with spool.open() as out:
+            out.write("".join(json.dumps(record) + "\n" for record in records))
+        spool.commit()
+        return status, None
+
+    # Pool threads inherit the calling fetcher for telemetry attribution
+    fetch_bound = client.telemetry.bind(client.telemetry.current_fetcher(), fetch)
+    done_slices = {}
+    splits = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="change-history") as pool:
+        pending = {pool.submit(fetch_bound, bounds): bounds for bounds in build_slices(start, end)}
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                bounds = pending.pop(future)
+                status, records = future.result()
+                if status["saturated"]:
+                    splits += 1
+                    for half in split_slice(*bounds):
+                        pending[pool.submit(fetch_bound, half)] = half
+                else:
+                    done_slices[bounds] = (status, records)
+
+    # Merge newest first
+    ordered = sorted(done_slices, reverse=True)
+    statuses = [done_slices[b][0] for b in ordered]
+    for status in statuses:
+        del status["saturated"]
+    count = sum(s["rows"] for s in statuses)
+    if spool_dir:
+        records = SpooledRecords([PartitionSpool(spool_dir, slice_key(*b)).path for b in ordered], count)
+    else:
+        records = [record for b in ordered for record in done_slices[b][1]]
+    return records, statuses, splits
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Phase A: Crash-Safe, Resumable Dumps
+
+Each fetcher's raw file is committed (atomically) into the snapshot as soon
+as that fetcher completes, and recorded in the snapshot's checkpoint file.
+Paginated calls (GAQL search, Merchant list_*) also append every page to a
+partial file together with its nextPageToken. A dump that dies partway
+therefore leaves:
+
+    snapshots/{TIMESTAMP}/
+        _checkpoint.json          # options, account, completed fetchers, resume history
+        _partial/{unit}.jsonl     # pages of in-progress paginated calls
+        _partial/gsc/...          # GSC partitions (see gsc_extract.py)
+        _partial/records/...      # Merchant and normalized record files (see pipeline.py)
+        raw/...                   # raw files of every completed fetcher
+
+`bin/dump --resume snapshots/{TIMESTAMP}` reuses the recorded options, reads
+completed fetchers' raw files instead of refetching them, continues
+paginated calls from their last saved page token, and then normalizes and
+writes the manifest as usual. A run that finishes with fetch errors keeps its
+checkpoint, so --resume can retry just the failed fetchers later.
+
+Page tokens eventually expire; a call whose saved token is rejected starts
+over from its first page.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+CHECKPOINT_FILE = "_checkpoint.json"
+PARTIAL_DIR = "_partial"
+
+
+def write_json_atomic(path: Path, data: dict):
+    """Write a small JSON file so readers never see a half-written version."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+class PageCheckpoint:
+    """Saved pages of one paginated call; one JSONL line per page."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.resumed_pages = 0
+
+    def restore(self) -> tuple:
+        """(rows fetched so far, token of the next page); ([], None) if nothing saved."""
+        rows, token = [], None
+        if not self.path.exists():
+            return rows, token
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    page = json.loads(line)
+                except ValueError:
+                    break  # torn final line from a crash; resume from the page before it
+                rows.extend(page["rows"])
+                token = page["next_page_token"]
+                self.resumed_pages += 1
+        if token is None:
+            # Every saved page was final: nothing to continue
+            return [], None
+        return rows, token
+
+    def save_page(self, rows: list, next_page_token):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"rows": rows, "next_page_token": next_page_token}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def reset(self):
+        """Discard saved pages (e.g. the saved page token expired)."""
+        self.resumed_pages = 0
+        if self.path.exists():
+            self.path.unlink()
+
+    def finish(self):
+        self.reset()
+
+
+class DumpCheckpoint:
+    """Checkpoint state of one snapshot being written."""
+
+    def __init__(self, snapshot_dir: Path, state: dict):
+        self.snapshot_dir = Path(snapshot_dir)
+        self.path = self.snapshot_dir / CHECKPOINT_FILE
+        self.partial_dir = self.snapshot_dir / PARTIAL_DIR
+        self.state = state
+        self._lock = threading.Lock()
+
+    @classmethod
+    def start(cls, snapshot_dir: Path, account: dict, options: dict, started_utc: str):
+        checkpoint = cls(snapshot_dir, {
+            "snapshot_id": Path(snapshot_dir).name,
+            "started_utc": started_utc,
+            "account": account,
+            "options": options,
+            "completed": {},
+            "resumes": [],
+        })
+        checkpoint.save()
+        return checkpoint
+
+    @classmethod
+    def load(cls, snapshot_dir: Path):
+        """Checkpoint of an interrupted snapshot, or raise if it cannot be resumed."""
+        snapshot_dir = Path(snapshot_dir)
+        path = snapshot_dir / CHECKPOINT_FILE
+        if not path.exists():
+            if (snapshot_dir / "_manifest.json").exists():
+                raise Exception(f"{snapshot_dir} is complete (no {CHECKPOINT_FILE}); nothing to resume")
+            raise Exception(f"No {CHECKPOINT_FILE} in {snapshot_dir}")
+        with open(path, "r") as f:
+            state = json.load(f)
+        checkpoint = cls(snapshot_dir, state)
+        state["resumes"].append(datetime.utcnow().isoformat() + "Z")
+        checkpoint.save()
+        return checkpoint
+
+    def save(self):
+        with self._lock:
+            write_json_atomic(self.path, self.state)
+
+    @property
+    def completed(self) -> dict:
+        return self.state["completed"]
+
+    def mark_complete(self, fetcher: str, rel_path: str):
+        with self._lock:
+            self.state["completed"][fetcher] = {"raw_file": rel_path, "completed_utc": datetime.utcnow().isoformat() + "Z"}
+        self.save()
+
+    def pages(self, api: str, scope: str, request: str) -> PageCheckpoint:
+        """Page checkpoint for one paginated call, keyed by its exact request."""
+        digest = hashlib.sha1(f"{api}\n{scope}\n{request}".encode("utf-8")).hexdigest()[:16]
+        return PageCheckpoint(self.partial_dir / f"{api}-{digest}.jsonl")
+
+    def spool_dir(self, name: str) -> Path:
+        """Folder for a fetcher's partial record files (e.g. GSC partitions)."""
+        return self.partial_dir / name
+
+    def attach(self, scheduler, names, read_raw):
+        """Serve completed fetchers from their committed raw files instead of refetching."""
+        for name in names:
+            task = scheduler.tasks.get(name)
+            if task is None or name not in self.completed:
+                continue
+            path = self.snapshot_dir / self.completed[name]["raw_file"]
+            task.fn = lambda up, path=path: read_raw(path)
+            task.label = f"{task.label} (resumed)"
+
+    def manifest_section(self, carried: list) -> dict:
+        return {
+            "started_utc": self.state["started_utc"],
+            "resumed_utc": self.state["resumes"],
+            "fetchers_from_checkpoint": sorted(carried),
+        }
+
+    def close(self, keep: bool):
+        """Remove checkpoint files once the snapshot is complete (keep them to allow a retry)."""
+        if keep:
+            return
+        if self.partial_dir.exists():
+            shutil.rmtree(self.partial_dir)
+        if self.path.exists():
+            self.path.unlink()
@@ -12,15 +12,34 @@ Usage:
     python audit/dump_state.py --ads-only        # Google Ads only (default for A2)
     python audit/dump_state.py --merchant-only   # Merchant Center only (A3)
     python audit/dump_state.py --days 14         # Change history lookback (default: 14)
+    python audit/dump_state.py --workers 8       # Concurrent fetchers (default: 6)
+    python audit/dump_state.py --incremental     # Refetch only what changed since the last snapshot
+    python audit/dump_state.py --perf-days 90    # Performance window, served from store/performance
+    python audit/dump_state.py --lag-days 14     # Days of performance refetched for conversion lag
+    python audit/dump_state.py --no-perf-store   # Refetch the whole performance window from the API
+    python audit/dump_state.py --no-dedup        # Write plain files instead of hardlinks into store/blobs
+    python audit/dump_state.py --encoding gzip   # Compact, compressed snapshot files (json|gzip|zstd)
+    python audit/dump_state.py --profile lean    # Request only GAQL fields a consumer reads (field_registry.py)
+    python audit/dump_state.py --trace           # Also write a per-request _trace.jsonl into the snapshot
+    python audit/dump_state.py --record cassettes/base   # Record every API response into a cassette
+    python audit/dump_state.py --replay cassettes/base   # Serve API calls from a cassette (offline)
+    python audit/dump_state.py --replay cassettes/base --replay-latency recorded  # ...with recorded latency
+    python audit/dump_state.py --accounts 1234567890,2345678901  # Several accounts concurrently
+    python audit/dump_state.py --accounts all-under-mcc          # Every client under the login customer
+    python audit/dump_state.py --accounts ... --account-workers 2  # Accounts at once (default: all)
+    python audit/dump_state.py --accounts ... --max-in-flight 12   # Shared API request cap (default: 2 x workers)
+    python audit/dump_state.py --no-governor     # Disable per-API / per-customer rate pacing
+    python audit/dump_state.py --resume snapshots/2026-02-01T060000Z  # Finish an interrupted dump
 
 Output:
     snapshots/{TIMESTAMP}/
         _manifest.json
-        _index.json
+        _index.bin
         raw/ads/...
         normalized/ads/...
 """
 
+import codecs
 import json
 import os
 import sys
@@ -38,12 +57,37 @@ from dotenv import load_dotenv
 SCRIPT_DIR = Path(__file__).parent
 CORE_DIR = SCRIPT_DIR.parent
 PROJECT_ROOT = CORE_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.auth.oauth import get_token_provider
+from core.dump.blob_store import BlobStore
+from core.dump import change_slices
+from core.dump.checkpoint import DumpCheckpoint
+from core.dump.cassette import Cassette, RecordingTransport, ReplayTransport
+from core.dump import multi_account
+from core.dump import field_registry
+from core.dump import gsc_extract
+from core.dump import gsc_rollups
+from core.dump.governor import RateGovernor
+from core.dump.incremental import IncrementalDump
+from core.dump.perf_store import DEFAULT_LAG_DAYS, PerformanceStore
+from core.dump.pipeline import NormalizePipeline
+from core.dump.scheduler import DEFAULT_MAX_WORKERS, DumpScheduler
+from core.dump.spool import RecordFile, SpooledRecords, chain_records
+from core.dump.telemetry import Telemetry
+from core.dump.transport import HttpTransport, get_default_transport
+from core.snapshot import codec as snapshot_codec
+from core.snapshot import entity_index
 
 GOOGLE_ADS_API_VERSION = "v19"
 MERCHANT_CENTER_API_VERSION = "v2.1"
 CHANGE_HISTORY_DAYS = 14
 PERFORMANCE_DAYS = 30
 SNAPSHOT_VERSION = "A3.0"
+SNAPSHOTS_DIR = PROJECT_ROOT / "snapshots"
+PERF_STORE_DIR = PROJECT_ROOT / "store" / "performance"
+BLOB_STORE_DIR = PROJECT_ROOT / "store" / "blobs"
+STREAM_CHUNK_BYTES = 64 * 1024
 
 # =============================================================================
 # CREDENTIAL LOADING
@@ -65,19 +109,8 @@ def load_env():
 
 
 def get_access_token():
-    """Get OAuth access token via refresh token."""
-    response = requests.post(
-        "https://oauth2.googleapis.com/token",
-        data={
-            "client_id": os.getenv("GOOGLE_ADS_CLIENT_ID"),
-            "client_secret": os.getenv("GOOGLE_ADS_CLIENT_SECRET"),
-            "refresh_token": os.getenv("GOOGLE_ADS_REFRESH_TOKEN"),
-            "grant_type": "refresh_token",
-        },
-    )
-    if response.status_code != 200:
-        raise Exception(f"Token refresh failed: {response.text}")
-    return response.json()["access_token"]
+    """Get OAuth access token (shared, cached across processes; see core/auth/oauth.py)."""
+    return get_token_provider().get_token()
 
 
 # =============================================================================
@@ -88,21 +121,36 @@ def get_access_token():
 class GoogleAdsClient:
     """Minimal Google Ads API client for read-only operations."""
 
-    def __init__(self, customer_id: str, access_token: str, login_customer_id: str = None):
+    def __init__(self, customer_id: str, access_token, login_customer_id: str = None,
+                 transport: HttpTransport = None, telemetry: Telemetry = None):
         self.customer_id = customer_id.replace("-", "")
         self.access_token = access_token
         self.login_customer_id = login_customer_id.replace("-", "") if login_customer_id else None
         self.base_url = f"https://googleads.googleapis.com/{GOOGLE_ADS_API_VERSION}"
+        self.transport = transport or get_default_transport()
+        self.telemetry = telemetry or Telemetry()
+        self.checkpoint = None  # DumpCheckpoint for page-level resume (set by dump_account)
+        self.field_profile = field_registry.DEFAULT_PROFILE  # --profile (set by dump_account)
+        self._cached_headers = None
+        self._cached_token = None
+
+    def select_fields(self, query_name: str) -> str:
+        """SELECT list of a registered query under this client's field profile."""
+        return field_registry.select_clause(query_name, self.field_profile)
 
     def _headers(self):
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "developer-token": os.getenv("GOOGLE_ADS_DEVELOPER_TOKEN"),
-            "Content-Type": "application/json",
-        }
-        if self.login_customer_id:
-            headers["login-customer-id"] = self.login_customer_id
-        return headers
+        token = self.access_token() if callable(self.access_token) else self.access_token
+        if self._cached_headers is None or self._cached_token != token:
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "developer-token": os.getenv("GOOGLE_ADS_DEVELOPER_TOKEN"),
+                "Content-Type": "application/json",
+            }
+            if self.login_customer_id:
+                headers["login-customer-id"] = self.login_customer_id
+            self._cached_headers = headers
+            self._cached_token = token
+        return self._cached_headers
 
     def search(self, query: str) -> list:
         """Execute GAQL query and return all results (handles pagination)."""
@@ -110,26 +158,116 @@ class GoogleAdsClient:
         all_results = []
         page_token = None
 
-        while True:
-            payload = {"query": query}
-            if page_token:
-                payload["pageToken"] = page_token
+        # Resume from the last saved page of an interrupted dump (see checkpoint.py)
+        pages = self.checkpoint.pages("google_ads", self.customer_id, query) if self.checkpoint else None
+        if pages:
+            all_results, page_token = pages.restore()
+
+        with self.telemetry.call("google_ads", "search", query) as call:
+            while True:
+                payload = {"query": query}
+                if page_token:
+                    payload["pageToken"] = page_token
+
+                started = time.perf_counter()
+                response = self.transport.post(url, headers=self._headers(), json=payload)
+
+                if response.status_code == 400 and pages and pages.resumed_pages and "PAGE_TOKEN" in response.text:
+                    # Saved page token expired: start the call over
+                    pages.reset()
+                    all_results, page_token = [], None
+                    continue
+
+                if response.status_code != 200:
+                    error_detail = response.text
+                    raise Exception(f"API error {response.status_code}: {error_detail}")
+
+                data = response.json()
+                results = data.get("results", [])
+                all_results.extend(results)
+                call.page(len(response.content), len(results), time.perf_counter() - started)
+
+                page_token = data.get("nextPageToken")
+                if not page_token:
+                    break
+                if pages:
+                    pages.save_page(results, page_token)
+
+        if pages:
+            pages.finish()
+        return all_results
 
-            response = requests.post(url, headers=self._headers(), json=payload)
+    def search_stream(self, query: str):
+        """Execute GAQL query via googleAds:searchStream, yielding rows as they arrive.
 
-            if response.status_code != 200:
-                error_detail = response.text
-                raise Exception(f"API error {response.status_code}: {error_detail}")
+        The server streams a JSON array of response batches over a single
+        request (no page tokens). Batches are decoded incrementally so only
+        the batch in flight is held in memory, never the full result set.
+        """
+        url = f"{self.base_url}/customers/{self.customer_id}/googleAds:searchStream"
 
-            data = response.json()
-            results = data.get("results", [])
-            all_results.extend(results)
+        with self.telemetry.call("google_ads", "searchStream", query) as call:
+            started = time.perf_counter()
+            with self.transport.post(url, headers=self._headers(), json={"query": query}, stream=True) as response:
+                if response.status_code != 200:
+                    error_detail = response.text
+                    raise Exception(f"API error {response.status_code}: {error_detail}")
+
+                counted = {"bytes": 0, "rows": 0}
+
+                def chunks():
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                        counted["bytes"] += len(chunk)
+                        yield chunk
+
+                for batch in iter_json_array(chunks()):
+                    results = batch.get("results", [])
+                    counted["rows"] += len(results)
+                    yield from results
+                # The whole stream is one HTTP response
+                call.page(counted["bytes"], counted["rows"], time.perf_counter() - started)
+
+
+def iter_json_array(chunks):
+    """Incrementally decode a top-level JSON array from byte chunks.
 
-            page_token = data.get("nextPageToken")
-            if not page_token:
+    Yields each array element as soon as it is complete, so a streamed
+    response never has to be buffered whole. After a failed decode attempt
+    the buffer must double before the next attempt, which keeps decoding
+    linear even when a single element spans many chunks.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    state = {"buffer": "", "retry_at": 0}
+
+    def drain(final: bool):
+        buffer = state["buffer"]
+        pos = 0
+        while True:
+            # Skip whitespace, the opening bracket and element separators
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,[":
+                pos += 1
+            if pos >= len(buffer) or buffer[pos] == "]":
+                break
+            if not final and len(buffer) < state["retry_at"]:
                 break
+            try:
+                element, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise Exception(f"Truncated searchStream response: {buffer[pos:pos + 200]}")
+                state["retry_at"] = 2 * (len(buffer) - pos)
+                break
+            state["retry_at"] = 0
+            yield element
+        state["buffer"] = buffer[pos:]
 
-        return all_results
+    for chunk in chunks:
+        state["buffer"] += text_decoder.decode(chunk)
+        yield from drain(final=False)
+
+    state["buffer"] += text_decoder.decode(b"", final=True)
+    yield from drain(final=True)
 
 
 # =============================================================================
@@ -140,79 +278,99 @@ class GoogleAdsClient:
 class MerchantCenterClient:
     """Minimal Merchant Center API client for read-only operations."""
 
-    def __init__(self, merchant_id: str, access_token: str):
+    def __init__(self, merchant_id: str, access_token, transport: HttpTransport = None,
+                 telemetry: Telemetry = None):
         self.merchant_id = merchant_id
         self.access_token = access_token
         self.base_url = f"https://shoppingcontent.googleapis.com/content/{MERCHANT_CENTER_API_VERSION}"
+        self.transport = transport or get_default_transport()
+        self.telemetry = telemetry or Telemetry()
+        self.checkpoint = None  # DumpCheckpoint for page-level resume (set by dump_account)
+        self._cached_headers = None
+        self._cached_token = None
 
     def _headers(self):
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        token = self.access_token() if callable(self.access_token) else self.access_token
+        if self._cached_headers is None or self._cached_token != token:
+            self._cached_headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
+            self._cached_token = token
+        return self._cached_headers
 
-    def list_products(self, max_results: int = 250) -> list:
+    def list_products(self, max_results: int = 250, into: list = None) -> list:
         """List all products (handles pagination)."""
-        url = f"{self.base_url}/{self.merchant_id}/products"
-        all_products = []
-        page_token = None
-
-        while True:
-            params = {"maxResults": max_results}
-            if page_token:
-                params["pageToken"] = page_token
-
-            response = requests.get(url, headers=self._headers(), params=params)
+        return self._list_all("products", "products.list", max_results, into)
 
-            if response.status_code != 200:
-                raise Exception(f"Merchant API error {response.status_code}: {response.text}")
-
-            data = response.json()
-            products = data.get("resources", [])
-            all_products.extend(products)
-
-            page_token = data.get("nextPageToken")
-            if not page_token:
-                break
-
-        return all_products
-
-    def list_product_statuses(self, max_results: int = 250) -> list:
+    def list_product_statuses(self, max_results: int = 250, into: list = None) -> list:
         """List product statuses (includes disapproval reasons)."""
-        url = f"{self.base_url}/{self.merchant_id}/productstatuses"
-        all_statuses = []
-        page_token = None
-
-        while True:
-            params = {"maxResults": max_results}
-            if page_token:
-                params["pageToken"] = page_token
+        return self._list_all("productstatuses", "productstatuses.list", max_results, into)
 
-            response = requests.get(url, headers=self._headers(), params=params)
+    def _list_all(self, resource: str, operation: str, max_results: int, into: list = None) -> list:
+        """Fetch every page of a Content API list call.
 
-            if response.status_code != 200:
-                raise Exception(f"Merchant API error {response.status_code}: {response.text}")
-
-            data = response.json()
-            statuses = data.get("resources", [])
-            all_statuses.extend(statuses)
-
-            page_token = data.get("nextPageToken")
-            if not page_token:
-                break
+        Pages are appended to `into` (e.g. a spool.RecordFile that streams
+        them to disk) or to a new list, which is returned.
+        """
+        url = f"{self.base_url}/{self.merchant_id}/{resource}"
+        all_resources = into if into is not None else []
+        page_token = None
 
-        return all_statuses
+        # Resume from the last saved page of an interrupted dump (see checkpoint.py)
+        pages = (self.checkpoint.pages("merchant_center", self.merchant_id, f"{operation} {max_results}")
+                 if self.checkpoint else None)
+        if pages:
+            restored, page_token = pages.restore()
+            all_resources.extend(restored)
+
+        with self.telemetry.call("merchant_center", operation) as call:
+            while True:
+                params = {"maxResults": max_results}
+                if page_token:
+                    params["pageToken"] = page_token
+
+                started = time.perf_counter()
+                response = self.transport.get(url, headers=self._headers(), params=params)
+
+                if response.status_code == 400 and pages and pages.resumed_pages:
+                    # Saved page token no longer accepted: start the call over
+                    pages.reset()
+                    all_resources.clear()
+                    page_token = None
+                    continue
+
+                if response.status_code != 200:
+                    raise Exception(f"Merchant API error {response.status_code}: {response.text}")
+
+                data = response.json()
+                resources = data.get("resources", [])
+                all_resources.extend(resources)
+                call.page(len(response.content), len(resources), time.perf_counter() - started)
+
+                page_token = data.get("nextPageToken")
+                if not page_token:
+                    break
+                if pages:
+                    pages.save_page(resources, page_token)
+
+        if pages:
+            pages.finish()
+        return all_resources
 
     def get_account_status(self) -> dict:
         """Get account status including issues/warnings."""
         url = f"{self.base_url}/{self.merchant_id}/accountstatuses/{self.merchant_id}"
 
-        response = requests.get(url, headers=self._headers())
+        with self.telemetry.call("merchant_center", "accountstatuses.get") as call:
+            started = time.perf_counter()
+            response = self.transport.get(url, headers=self._headers())
 
-        if response.status_code != 200:
-            raise Exception(f"Merchant API error {response.status_code}: {response.text}")
+            if response.status_code != 200:
+                raise Exception(f"Merchant API error {response.status_code}: {response.text}")
 
-        return response.json()
+            call.page(len(response.content), 1, time.perf_counter() - started)
+            return response.json()
 
 
 # =============================================================================
@@ -223,47 +381,79 @@ class MerchantCenterClient:
 class GoogleSearchConsoleClient:
     """Minimal Google Search Console API client for read-only operations."""
 
-    def __init__(self, site_url: str, access_token: str):
+    def __init__(self, site_url: str, access_token, transport: HttpTransport = None,
+                 telemetry: Telemetry = None):
         self.site_url = site_url
         self.access_token = access_token
         self.base_url = "https://www.googleapis.com/webmasters/v3"
+        self.transport = transport or get_default_transport()
+        self.telemetry = telemetry or Telemetry()
+        self.checkpoint = None  # DumpCheckpoint for page-level resume (set by dump_account)
+        self._cached_headers = None
+        self._cached_token = None
 
     def _headers(self):
-        return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        token = self.access_token() if callable(self.access_token) else self.access_token
+        if self._cached_headers is None or self._cached_token != token:
+            self._cached_headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
+            self._cached_token = token
+        return self._cached_headers
 
     def list_sites(self) -> list:
         """List all verified sites for this account."""
         url = f"{self.base_url}/sites"
 
-        response = requests.get(url, headers=self._headers())
+        with self.telemetry.call("search_console", "sites.list") as call:
+            started = time.perf_counter()
+            response = self.transport.get(url, headers=self._headers())
 
-        if response.status_code != 200:
-            raise Exception(f"GSC API error {response.status_code}: {response.text}")
+            if response.status_code != 200:
+                raise Exception(f"GSC API error {response.status_code}: {response.text}")
 
-        data = response.json()
-        return data.get("siteEntry", [])
+            data = response.json()
+            sites = data.get("siteEntry", [])
+            call.page(len(response.content), len(sites), time.perf_counter() - started)
+            return sites
 
     def query_search_analytics(
         self,
         start_date: str,
         end_date: str,
         dimensions: list[str] = None,
-        row_limit: int = 25000
+        row_limit: int = 25000,
+        start_row: int = 0,
+        dimension_filter_groups: list = None,
     ) -> list:
-        """Query search analytics data.
+        """Query one page of search analytics data.
 
         Args:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             dimensions: List of dimensions (query, page, device, country, date)
             row_limit: Maximum rows to return (API max is 25,000)
+            start_row: Zero-based index of the first row (for paging)
+            dimension_filter_groups: Optional API dimensionFilterGroups
 
         Returns:
             List of search analytics rows
         """
+        rows = []
+        self.page_search_analytics(start_date, end_date, dimensions, rows.extend, row_limit=row_limit,
+                                   start_row=start_row, dimension_filter_groups=dimension_filter_groups,
+                                   max_pages=1)
+        return rows
+
+    def page_search_analytics(self, start_date: str, end_date: str, dimensions: list, on_page,
+                              row_limit: int = 25000, start_row: int = 0,
+                              dimension_filter_groups: list = None, max_pages: int = None) -> int:
+        """Fetch search analytics page by page (startRow) until a short page.
+
+        Each page's rows are handed to on_page(rows) as they arrive instead of
+        being accumulated. Returns the total row count.
+        """
         if dimensions is None:
             dimensions = ["query", "page", "device", "country", "date"]
 
@@ -275,14 +465,29 @@ class GoogleSearchConsoleClient:
             "dimensions": dimensions,
             "rowLimit": row_limit,
         }
-
-        response = requests.post(url, headers=self._headers(), json=payload)
-
-        if response.status_code != 200:
-            raise Exception(f"GSC API error {response.status_code}: {response.text}")
-
-        data = response.json()
-        return data.get("rows", [])
+        if dimension_filter_groups:
+            payload["dimensionFilterGroups"] = dimension_filter_groups
+
+        total = 0
+        pages = 0
+        with self.telemetry.call("search_console", "searchAnalytics.query") as call:
+            while True:
+                payload["startRow"] = start_row + total
+                started = time.perf_counter()
+                response = self.transport.post(url, headers=self._headers(), json=payload)
+
+                if response.status_code != 200:
+                    raise Exception(f"GSC API error {response.status_code}: {response.text}")
+
+                data = response.json()
+                rows = data.get("rows", [])
+                call.page(len(response.content), len(rows), time.perf_counter() - started)
+                on_page(rows)
+                total += len(rows)
+                pages += 1
+                if len(rows) < row_limit or (max_pages and pages >= max_pages):
+                    break
+        return total
 
 
 # =============================================================================
@@ -292,35 +497,9 @@ class GoogleSearchConsoleClient:
 
 def fetch_campaigns(client: GoogleAdsClient) -> dict:
     """Fetch all campaigns with full settings."""
-    query = """
+    query = f"""
         SELECT
-            campaign.resource_name,
-            campaign.id,
-            campaign.name,
-            campaign.status,
-            campaign.advertising_channel_type,
-            campaign.advertising_channel_sub_type,
-            campaign.bidding_strategy_type,
-            campaign.bidding_strategy,
-            campaign.target_roas.target_roas,
-            campaign.target_cpa.target_cpa_micros,
-            campaign.maximize_conversions.target_cpa_micros,
-            campaign.maximize_conversion_value.target_roas,
-            campaign.campaign_budget,
-            campaign.start_date,
-            campaign.end_date,
-            campaign.labels,
-            campaign.network_settings.target_google_search,
-            campaign.network_settings.target_search_network,
-            campaign.network_settings.target_content_network,
-            campaign.geo_target_type_setting.positive_geo_target_type,
-            campaign.geo_target_type_setting.negative_geo_target_type,
-            campaign.shopping_setting.merchant_id,
-            campaign.shopping_setting.feed_label,
-            campaign.url_expansion_opt_out,
-            campaign_budget.id,
-            campaign_budget.amount_micros,
-            campaign_budget.delivery_method
+            {client.select_fields("campaigns")}
         FROM campaign
         WHERE campaign.status != 'REMOVED'
         ORDER BY campaign.id
@@ -336,18 +515,9 @@ def fetch_campaigns(client: GoogleAdsClient) -> dict:
 
 def fetch_ad_groups(client: GoogleAdsClient) -> dict:
     """Fetch all ad groups."""
-    query = """
+    query = f"""
         SELECT
-            ad_group.resource_name,
-            ad_group.id,
-            ad_group.name,
-            ad_group.campaign,
-            ad_group.status,
-            ad_group.type,
-            ad_group.cpc_bid_micros,
-            ad_group.target_cpa_micros,
-            ad_group.target_roas,
-            ad_group.labels
+            {client.select_fields("ad_groups")}
         FROM ad_group
         WHERE ad_group.status != 'REMOVED'
         ORDER BY ad_group.id
@@ -361,45 +531,30 @@ def fetch_ad_groups(client: GoogleAdsClient) -> dict:
 
 
 def fetch_keywords(client: GoogleAdsClient) -> dict:
-    """Fetch all keywords (positive)."""
-    query = """
+    """Fetch all keywords (positive), streamed to a record file."""
+    query = f"""
         SELECT
-            ad_group_criterion.resource_name,
-            ad_group_criterion.criterion_id,
-            ad_group_criterion.ad_group,
-            ad_group_criterion.keyword.text,
-            ad_group_criterion.keyword.match_type,
-            ad_group_criterion.status,
-            ad_group_criterion.cpc_bid_micros,
-            ad_group_criterion.quality_info.quality_score,
-            ad_group_criterion.quality_info.creative_quality_score,
-            ad_group_criterion.quality_info.post_click_quality_score,
-            ad_group_criterion.quality_info.search_predicted_ctr,
-            ad_group_criterion.labels
+            {client.select_fields("keywords")}
         FROM ad_group_criterion
         WHERE ad_group_criterion.type = 'KEYWORD'
             AND ad_group_criterion.status != 'REMOVED'
             AND ad_group_criterion.negative = FALSE
         ORDER BY ad_group_criterion.criterion_id
     """
-    results = client.search(query)
+    records = new_record_list(client.checkpoint, "raw_keywords")
+    records.extend(r.get("adGroupCriterion", {}) for r in client.search_stream(query))
     return {
         "extracted_at": datetime.utcnow().isoformat() + "Z",
-        "count": len(results),
-        "records": [r.get("adGroupCriterion", {}) for r in results],
+        "count": len(records),
+        "records": records,
     }
 
 
 def fetch_campaign_negatives(client: GoogleAdsClient) -> dict:
     """Fetch campaign-level negative keywords."""
-    query = """
+    query = f"""
         SELECT
-            campaign_criterion.resource_name,
-            campaign_criterion.criterion_id,
-            campaign_criterion.campaign,
-            campaign_criterion.keyword.text,
-            campaign_criterion.keyword.match_type,
-            campaign_criterion.negative
+            {client.select_fields("campaign_negatives")}
         FROM campaign_criterion
         WHERE campaign_criterion.type = 'KEYWORD'
             AND campaign_criterion.negative = TRUE
@@ -415,14 +570,9 @@ def fetch_campaign_negatives(client: GoogleAdsClient) -> dict:
 
 def fetch_adgroup_negatives(client: GoogleAdsClient) -> dict:
     """Fetch ad group-level negative keywords."""
-    query = """
+    query = f"""
         SELECT
-            ad_group_criterion.resource_name,
-            ad_group_criterion.criterion_id,
-            ad_group_criterion.ad_group,
-            ad_group_criterion.keyword.text,
-            ad_group_criterion.keyword.match_type,
-            ad_group_criterion.negative
+            {client.select_fields("adgroup_negatives")}
         FROM ad_group_criterion
         WHERE ad_group_criterion.type = 'KEYWORD'
             AND ad_group_criterion.negative = TRUE
@@ -438,18 +588,9 @@ def fetch_adgroup_negatives(client: GoogleAdsClient) -> dict:
 
 def fetch_ads(client: GoogleAdsClient) -> dict:
     """Fetch all ads (RSA focus)."""
-    query = """
+    query = f"""
         SELECT
-            ad_group_ad.resource_name,
-            ad_group_ad.ad.id,
-            ad_group_ad.ad_group,
-            ad_group_ad.ad.type,
-            ad_group_ad.status,
-            ad_group_ad.ad.final_urls,
-            ad_group_ad.ad.responsive_search_ad.headlines,
-            ad_group_ad.ad.responsive_search_ad.descriptions,
-            ad_group_ad.policy_summary.approval_status,
-            ad_group_ad.policy_summary.review_status
+            {client.select_fields("ads")}
         FROM ad_group_ad
         WHERE ad_group_ad.status != 'REMOVED'
         ORDER BY ad_group_ad.ad.id
@@ -463,55 +604,37 @@ def fetch_ads(client: GoogleAdsClient) -> dict:
 
 
 def fetch_assets(client: GoogleAdsClient) -> dict:
-    """Fetch account-level assets."""
-    query = """
+    """Fetch account-level assets, streamed to a record file."""
+    query = f"""
         SELECT
-            asset.resource_name,
-            asset.id,
-            asset.type,
-            asset.name,
-            asset.sitelink_asset.link_text,
-            asset.sitelink_asset.description1,
-            asset.sitelink_asset.description2,
-            asset.callout_asset.callout_text,
-            asset.structured_snippet_asset.header,
-            asset.structured_snippet_asset.values,
-            asset.call_asset.phone_number,
-            asset.policy_summary.approval_status
+            {client.select_fields("assets")}
         FROM asset
         ORDER BY asset.id
     """
-    results = client.search(query)
+    records = new_record_list(client.checkpoint, "raw_assets")
+    records.extend(r.get("asset", {}) for r in client.search_stream(query))
     return {
         "extracted_at": datetime.utcnow().isoformat() + "Z",
-        "count": len(results),
-        "records": [r.get("asset", {}) for r in results],
+        "count": len(records),
+        "records": records,
     }
 
 
 def fetch_asset_links(client: GoogleAdsClient) -> dict:
     """Fetch asset → campaign/adgroup bindings."""
     # Campaign assets
-    campaign_query = """
+    campaign_query = f"""
         SELECT
-            campaign_asset.resource_name,
-            campaign_asset.asset,
-            campaign_asset.campaign,
-            campaign_asset.field_type,
-            campaign_asset.status
+            {client.select_fields("campaign_asset_links")}
         FROM campaign_asset
         WHERE campaign_asset.status != 'REMOVED'
     """
     campaign_results = client.search(campaign_query)
 
     # Ad group assets
-    adgroup_query = """
+    adgroup_query = f"""
         SELECT
-            ad_group_asset.resource_name,
-            ad_group_asset.asset,
-            ad_group_asset.ad_group,
-            ad_group_asset.field_type,
-            ad_group_asset.status
+            {client.select_fields("ad_group_asset_links")}
         FROM ad_group_asset
         WHERE ad_group_asset.status != 'REMOVED'
     """
@@ -535,54 +658,45 @@ def fetch_asset_links(client: GoogleAdsClient) -> dict:
 
 
 def fetch_change_history(client: GoogleAdsClient, days: int = 14) -> dict:
-    """Fetch change history for last N days."""
-    start_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-    end_date = datetime.utcnow().strftime("%Y-%m-%d")
+    """Fetch change history for last N days.
 
-    query = f"""
-        SELECT
-            change_event.change_date_time,
-            change_event.change_resource_type,
-            change_event.change_resource_name,
-            change_event.resource_change_operation,
-            change_event.changed_fields,
-            change_event.old_resource,
-            change_event.new_resource,
-            change_event.user_email,
-            change_event.client_type
-        FROM change_event
-        WHERE change_event.change_date_time >= '{start_date}'
-            AND change_event.change_date_time <= '{end_date}'
-        ORDER BY change_event.change_date_time DESC
-        LIMIT 5000
+    The window is fetched as concurrent time slices, split further wherever
+    a slice hits the change_event row limit; see core/dump/change_slices.py.
     """
-    results = client.search(query)
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    window_start = today - timedelta(days=days)
+    # Ending at the next midnight covers every event so far and keeps every
+    # slice bound on the day grid, so recorded cassettes replay slice by slice
+    window_end = today + timedelta(days=1)
+
+    spool_dir = client.checkpoint.spool_dir("change_history") if client.checkpoint else None
+    records, slices, splits = change_slices.extract_change_history(client, window_start, window_end,
+                                                                   spool_dir=spool_dir)
     return {
         "extracted_at": datetime.utcnow().isoformat() + "Z",
         "lookback_days": days,
-        "count": len(results),
-        "records": [r.get("changeEvent", {}) for r in results],
+        "count": len(records),
+        "records": records,
+        "window": {
+            "start": window_start.strftime(change_slices.GAQL_DATETIME),
+            "end": window_end.strftime(change_slices.GAQL_DATETIME),
+        },
+        "slices": slices,
+        "saturated_splits": splits,
+        "truncated_slices": [s["start"] for s in slices if s["truncated"]],
     }
 
 
-def fetch_performance(client: GoogleAdsClient, days: int = 30) -> dict:
-    """Fetch performance metrics by campaign and ad group."""
-    start_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-    end_date = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
+def fetch_performance_range(client: GoogleAdsClient, start_date: str, end_date: str) -> tuple:
+    """Fetch daily campaign and ad group metrics for an inclusive date range.
 
+    Returns:
+        (by_campaign, by_ad_group) row lists
+    """
     # By campaign
     campaign_query = f"""
         SELECT
-            segments.date,
-            campaign.id,
-            campaign.name,
-            metrics.impressions,
-            metrics.clicks,
-            metrics.cost_micros,
-            metrics.conversions,
-            metrics.conversions_value,
-            metrics.all_conversions,
-            metrics.all_conversions_value
+            {client.select_fields("performance_by_campaign")}
         FROM campaign
         WHERE segments.date >= '{start_date}'
             AND segments.date <= '{end_date}'
@@ -593,15 +707,7 @@ def fetch_performance(client: GoogleAdsClient, days: int = 30) -> dict:
     # By ad group
     adgroup_query = f"""
         SELECT
-            segments.date,
-            campaign.id,
-            ad_group.id,
-            ad_group.name,
-            metrics.impressions,
-            metrics.clicks,
-            metrics.cost_micros,
-            metrics.conversions,
-            metrics.conversions_value
+            {client.select_fields("performance_by_ad_group")}
         FROM ad_group
         WHERE segments.date >= '{start_date}'
             AND segments.date <= '{end_date}'
@@ -630,11 +736,48 @@ def fetch_performance(client: GoogleAdsClient, days: int = 30) -> dict:
         }
         by_ad_group.append(rec)
 
+    return by_campaign, by_ad_group
+
+
+def fetch_performance(client: GoogleAdsClient, days: int = 30, store: PerformanceStore = None) -> dict:
+    """Fetch performance metrics by campaign and ad group.
+
+    Without a store, all `days` are fetched from the API. With a store, only
+    days inside the conversion-lag window or missing from the store are
+    fetched (one query pair per contiguous run of days); those partitions
+    are replaced and the full window is then read back from the store.
+    """
+    start_date = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+    end_date = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    if store is None:
+        by_campaign, by_ad_group = fetch_performance_range(client, start_date, end_date)
+        return {
+            "extracted_at": datetime.utcnow().isoformat() + "Z",
+            "date_range": {"start": start_date, "end": end_date},
+            "by_campaign": by_campaign,
+            "by_ad_group": by_ad_group,
+        }
+
+    fetched_ranges = []
+    for fetch_start, fetch_end in store.ranges_to_fetch(start_date, end_date):
+        by_campaign, by_ad_group = fetch_performance_range(client, fetch_start, fetch_end)
+        store.write_partitions(fetch_start, fetch_end, by_campaign, by_ad_group,
+                               fetched_at=datetime.utcnow().isoformat() + "Z")
+        fetched_ranges.append({"start": fetch_start, "end": fetch_end})
+
+    window = store.read_window(start_date, end_date)
     return {
         "extracted_at": datetime.utcnow().isoformat() + "Z",
-        "date_range": {"start": start_date, "end": end_date},
-        "by_campaign": by_campaign,
-        "by_ad_group": by_ad_group,
+        "date_range": window["date_range"],
+        "by_campaign": window["by_campaign"],
+        "by_ad_group": window["by_ad_group"],
+        "store": {
+            "customer_id": store.customer_id,
+            "lag_days": store.lag_days,
+            "fetched_ranges": fetched_ranges,
+            "missing_dates": window["missing_dates"],
+        },
     }
 
 
@@ -645,20 +788,9 @@ def fetch_performance(client: GoogleAdsClient, days: int = 30) -> dict:
 
 def fetch_pmax_campaigns(client: GoogleAdsClient) -> dict:
     """Fetch Performance Max campaigns."""
-    query = """
+    query = f"""
         SELECT
-            campaign.resource_name,
-            campaign.id,
-            campaign.name,
-            campaign.status,
-            campaign.bidding_strategy_type,
-            campaign.target_roas.target_roas,
-            campaign.maximize_conversion_value.target_roas,
-            campaign.campaign_budget,
-            campaign.shopping_setting.merchant_id,
-            campaign.shopping_setting.feed_label,
-            campaign.url_expansion_opt_out,
-            campaign_budget.amount_micros
+            {client.select_fields("pmax_campaigns")}
         FROM campaign
         WHERE campaign.advertising_channel_type = 'PERFORMANCE_MAX'
             AND campaign.status != 'REMOVED'
@@ -674,18 +806,9 @@ def fetch_pmax_campaigns(client: GoogleAdsClient) -> dict:
 
 def fetch_asset_groups(client: GoogleAdsClient) -> dict:
     """Fetch PMax asset groups."""
-    query = """
+    query = f"""
         SELECT
-            asset_group.resource_name,
-            asset_group.id,
-            asset_group.campaign,
-            asset_group.name,
-            asset_group.status,
-            asset_group.final_urls,
-            asset_group.final_mobile_urls,
-            asset_group.path1,
-            asset_group.path2,
-            asset_group.ad_strength
+            {client.select_fields("asset_groups")}
         FROM asset_group
         WHERE asset_group.status != 'REMOVED'
         ORDER BY asset_group.id
@@ -700,13 +823,9 @@ def fetch_asset_groups(client: GoogleAdsClient) -> dict:
 
 def fetch_asset_group_assets(client: GoogleAdsClient) -> dict:
     """Fetch assets assigned to asset groups."""
-    query = """
+    query = f"""
         SELECT
-            asset_group_asset.resource_name,
-            asset_group_asset.asset_group,
-            asset_group_asset.asset,
-            asset_group_asset.field_type,
-            asset_group_asset.status
+            {client.select_fields("asset_group_assets")}
         FROM asset_group_asset
         WHERE asset_group_asset.status != 'REMOVED'
     """
@@ -719,38 +838,26 @@ def fetch_asset_group_assets(client: GoogleAdsClient) -> dict:
 
 
 def fetch_listing_groups(client: GoogleAdsClient) -> dict:
-    """Fetch PMax listing group filters."""
-    query = """
+    """Fetch PMax listing group filters, streamed to a record file."""
+    query = f"""
         SELECT
-            asset_group_listing_group_filter.resource_name,
-            asset_group_listing_group_filter.asset_group,
-            asset_group_listing_group_filter.id,
-            asset_group_listing_group_filter.type,
-            asset_group_listing_group_filter.case_value.product_brand.value,
-            asset_group_listing_group_filter.case_value.product_category.category_id,
-            asset_group_listing_group_filter.case_value.product_custom_attribute.value,
-            asset_group_listing_group_filter.case_value.product_type.value,
-            asset_group_listing_group_filter.parent_listing_group_filter
+            {client.select_fields("listing_groups")}
         FROM asset_group_listing_group_filter
     """
-    results = client.search(query)
+    records = new_record_list(client.checkpoint, "raw_listing_groups")
+    records.extend(r.get("assetGroupListingGroupFilter", {}) for r in client.search_stream(query))
     return {
         "extracted_at": datetime.utcnow().isoformat() + "Z",
-        "count": len(results),
-        "records": [r.get("assetGroupListingGroupFilter", {}) for r in results],
+        "count": len(records),
+        "records": records,
     }
 
 
 def fetch_pmax_campaign_assets(client: GoogleAdsClient) -> dict:
     """Fetch campaign-level assets for PMax."""
-    query = """
+    query = f"""
         SELECT
-            campaign_asset.resource_name,
-            campaign_asset.asset,
-            campaign_asset.campaign,
-            campaign_asset.field_type,
-            campaign_asset.status,
-            campaign.advertising_channel_type
+            {client.select_fields("pmax_campaign_assets")}
         FROM campaign_asset
         WHERE campaign.advertising_channel_type = 'PERFORMANCE_MAX'
             AND campaign_asset.status != 'REMOVED'
@@ -765,12 +872,9 @@ def fetch_pmax_campaign_assets(client: GoogleAdsClient) -> dict:
 
 def fetch_url_expansion(client: GoogleAdsClient) -> dict:
     """Fetch URL expansion settings for PMax campaigns."""
-    query = """
+    query = f"""
         SELECT
-            campaign.resource_name,
-            campaign.id,
-            campaign.name,
-            campaign.url_expansion_opt_out
+            {client.select_fields("url_expansion")}
         FROM campaign
         WHERE campaign.advertising_channel_type = 'PERFORMANCE_MAX'
             AND campaign.status != 'REMOVED'
@@ -798,14 +902,9 @@ def fetch_brand_lists(client: GoogleAdsClient) -> dict:
 
     API Resource: customers/{customer_id}/brandLists/{brand_list_id}
     """
-    query = """
+    query = f"""
         SELECT
-            shared_set.resource_name,
-            shared_set.id,
-            shared_set.name,
-            shared_set.type,
-            shared_set.status,
-            shared_set.member_count
+            {client.select_fields("brand_lists")}
         FROM shared_set
         WHERE shared_set.type = 'NEGATIVE_KEYWORDS'
         ORDER BY shared_set.id
@@ -841,16 +940,9 @@ def fetch_pmax_brand_exclusions(client: GoogleAdsClient) -> dict:
     We attempt to fetch any negative campaign criteria that might indicate
     brand exclusions.
     """
-    query = """
+    query = f"""
         SELECT
-            campaign_criterion.resource_name,
-            campaign_criterion.campaign,
-            campaign_criterion.criterion_id,
-            campaign_criterion.negative,
-            campaign_criterion.type,
-            campaign.id,
-            campaign.name,
-            campaign.advertising_channel_type
+            {client.select_fields("pmax_brand_exclusions")}
         FROM campaign_criterion
         WHERE campaign.advertising_channel_type = 'PERFORMANCE_MAX'
             AND campaign_criterion.negative = true
@@ -890,9 +982,20 @@ def fetch_pmax_brand_exclusions(client: GoogleAdsClient) -> dict:
 # =============================================================================
 
 
+def new_record_list(checkpoint, name: str) -> list:
+    """Record list for a large fetch or normalize output.
+
+    An append-only JSONL file in the snapshot's checkpoint folder (see
+    core/dump/spool.py) when there is one, otherwise a plain list.
+    """
+    if checkpoint is None:
+        return []
+    return RecordFile(checkpoint.spool_dir("records") / f"{name}.jsonl")
+
+
 def fetch_merchant_products(client: MerchantCenterClient) -> dict:
-    """Fetch all products from Merchant Center."""
-    products = client.list_products()
+    """Fetch all products from Merchant Center (streamed to a record file)."""
+    products = client.list_products(into=new_record_list(client.checkpoint, "raw_merchant_products"))
     return {
         "extracted_at": datetime.utcnow().isoformat() + "Z",
         "merchant_id": client.merchant_id,
@@ -902,8 +1005,8 @@ def fetch_merchant_products(client: MerchantCenterClient) -> dict:
 
 
 def fetch_merchant_product_statuses(client: MerchantCenterClient) -> dict:
-    """Fetch product statuses (approval, disapproval, warnings)."""
-    statuses = client.list_product_statuses()
+    """Fetch product statuses (approval, disapproval, warnings), streamed to a record file."""
+    statuses = client.list_product_statuses(into=new_record_list(client.checkpoint, "raw_merchant_product_statuses"))
     return {
         "extracted_at": datetime.utcnow().isoformat() + "Z",
         "merchant_id": client.merchant_id,
@@ -953,6 +1056,10 @@ def fetch_gsc_sites(client: GoogleSearchConsoleClient) -> dict:
 def fetch_gsc_search_analytics(client: GoogleSearchConsoleClient, days: int = 30) -> dict:
     """Fetch search analytics data from Google Search Console.
 
+    The range is fetched as concurrent per-day (or per-day-and-device)
+    partitions, each paged past the 25,000-row request cap; see
+    core/dump/gsc_extract.py.
+
     Args:
         client: GSC client
         days: Number of days to fetch (default: 30)
@@ -961,6 +1068,7 @@ def fetch_gsc_search_analytics(client: GoogleSearchConsoleClient, days: int = 30
         Dict with search analytics rows including:
         - keys: [query, page, device, country, date]
         - clicks, impressions, ctr, position
+        and a "partitions" list with each partition's completeness
     """
     try:
         # Calculate date range (last N days)
@@ -970,15 +1078,13 @@ def fetch_gsc_search_analytics(client: GoogleSearchConsoleClient, days: int = 30
         start_date_str = start_date.strftime("%Y-%m-%d")
         end_date_str = end_date.strftime("%Y-%m-%d")
 
-        # Query with all dimensions for maximum granularity
-        rows = client.query_search_analytics(
-            start_date=start_date_str,
-            end_date=end_date_str,
-            dimensions=["query", "page", "device", "country", "date"],
-            row_limit=25000
-        )
+        # Partitions stream to the snapshot's checkpoint folder when there is one
+        partition_by = os.getenv("DUMP_GSC_PARTITION") or gsc_extract.DEFAULT_PARTITION
+        spool_dir = client.checkpoint.spool_dir("gsc") if client.checkpoint else None
+        rows, partitions = gsc_extract.extract_search_analytics(
+            client, start_date_str, end_date_str, spool_dir=spool_dir, partition_by=partition_by)
 
-        return {
+        result = {
             "extracted_at": datetime.utcnow().isoformat() + "Z",
             "site_url": client.site_url,
             "date_range": {
@@ -987,8 +1093,17 @@ def fetch_gsc_search_analytics(client: GoogleSearchConsoleClient, days: int = 30
             },
             "count": len(rows),
             "records": rows,
+            "partition_by": partition_by,
+            "partitions": partitions,
             "note": "Daily-level data with all dimensions. No aggregation applied.",
         }
+        failed = [p for p in partitions if not p["complete"]]
+        if failed and len(failed) == len(partitions):
+            raise Exception(failed[0]["error"])
+        if failed:
+            result["error"] = (f"{len(failed)} of {len(partitions)} partitions incomplete: "
+                               f"{failed[0]['key']}: {failed[0]['error']}")
+        return result
     except Exception as e:
         # If GSC permissions missing, return empty data with error note
         return {
@@ -1071,13 +1186,15 @@ def normalize_ad_groups(raw: dict) -> dict:
     }
 
 
-def normalize_keywords(raw: dict, ad_groups_raw: dict, validation_errors: list = None) -> dict:
+def normalize_keywords(raw: dict, ad_groups_raw: dict, validation_errors: list = None,
+                       records: list = None) -> dict:
     """Normalize keywords data.
 
     Args:
         raw: Raw keywords data from API
         ad_groups_raw: Raw ad groups data for campaign_id lookup
         validation_errors: List to append validation errors to (optional)
+        records: List to append normalized keywords to (e.g. a spool.RecordFile)
 
     Returns:
         Normalized keywords dict with campaign_id populated (null if unmapped)
@@ -1090,7 +1207,7 @@ def normalize_keywords(raw: dict, ad_groups_raw: dict, validation_errors: list =
         if ag_id:
             ag_to_campaign[str(ag_id)] = campaign_id
 
-    records = []
+    records = records if records is not None else []
     null_campaign_count = 0
 
     for r in raw.get("records", []):
@@ -1204,8 +1321,8 @@ def normalize_ads(raw: dict, ad_groups_raw: dict) -> dict:
     }
 
 
-def normalize_assets(raw: dict, links_raw: dict) -> dict:
-    """Normalize assets data."""
+def normalize_assets(raw: dict, links_raw: dict, records: list = None) -> dict:
+    """Normalize assets data (appended to `records` when given, e.g. a spool.RecordFile)."""
     # Build asset -> linked entities map
     asset_campaigns = {}
     asset_adgroups = {}
@@ -1218,7 +1335,7 @@ def normalize_assets(raw: dict, links_raw: dict) -> dict:
             adgroup_id = extract_id(link.get("adGroup", ""))
             asset_adgroups.setdefault(asset_id, []).append(adgroup_id)
 
-    records = []
+    records = records if records is not None else []
     for r in raw.get("records", []):
         asset_id = str(r.get("id"))
         asset_type = r.get("type", "UNKNOWN")
@@ -1396,9 +1513,9 @@ def normalize_asset_groups(raw: dict, assets_raw: dict) -> dict:
     }
 
 
-def normalize_listing_groups(raw: dict) -> dict:
-    """Normalize listing groups."""
-    records = []
+def normalize_listing_groups(raw: dict, records: list = None) -> dict:
+    """Normalize listing groups (appended to `records` when given, e.g. a spool.RecordFile)."""
+    records = records if records is not None else []
     for r in raw.get("records", []):
         case_value = r.get("caseValue", {})
         records.append({
@@ -1466,25 +1583,54 @@ def normalize_brand_exclusions(raw_brand_lists: dict, raw_brand_exclusions: dict
 # =============================================================================
 
 
-def normalize_merchant_products(raw: dict, statuses_raw: dict, validation_errors: list = None) -> dict:
+def product_approval(status_info: dict) -> tuple:
+    """(approval_status, disapproval issues or None) from one product status."""
+    approval_status = "UNKNOWN"
+    for dest in status_info.get("destinationStatuses", []):
+        dest_status = dest.get("status", "").upper()
+        if dest_status == "DISAPPROVED":
+            approval_status = "DISAPPROVED"
+            break
+        elif dest_status == "APPROVED":
+            approval_status = "APPROVED"
+        elif dest_status == "PENDING":
+            if approval_status != "APPROVED":
+                approval_status = "PENDING"
+
+    disapproval_issues = [
+        {
+            "code": issue.get("code"),
+            "description": issue.get("description"),
+            "detail": issue.get("detail"),
+        }
+        for issue in status_info.get("itemLevelIssues", [])
+        if issue.get("servability") == "disapproved"
+    ]
+    return approval_status, disapproval_issues or None
+
+
+def normalize_merchant_products(raw: dict, statuses_raw: dict, validation_errors: list = None,
+                                records: list = None) -> dict:
     """Normalize merchant products with status information.
 
     Args:
         raw: Raw products data from API
         statuses_raw: Raw product statuses for approval info
         validation_errors: List to append validation errors to (optional)
+        records: List to append normalized products to (e.g. a spool.RecordFile)
 
     Returns:
         Normalized products with approval status and issues
     """
-    # Build product_id -> status map
-    status_by_product = {}
+    # product_id -> (approval_status, disapproval issues); only the derived
+    # fields are kept so the map stays small for very large catalogs
+    approval_by_product = {}
     for s in statuses_raw.get("records", []):
         product_id = s.get("productId")
         if product_id:
-            status_by_product[product_id] = s
+            approval_by_product[product_id] = product_approval(s)
 
-    records = []
+    records = records if records is not None else []
     disapproved_count = 0
     missing_status_count = 0
 
@@ -1494,36 +1640,12 @@ def normalize_merchant_products(raw: dict, statuses_raw: dict, validation_errors
         sku = r.get("mpn") or r.get("gtin") or offer_id
 
         # Get status info
-        status_info = status_by_product.get(product_id, {})
-        destinations = status_info.get("destinationStatuses", [])
-
-        # Determine overall approval status
-        approval_status = "UNKNOWN"
-        disapproval_issues = []
+        has_status = product_id in approval_by_product
+        approval_status, disapproval_issues = approval_by_product.get(product_id, ("UNKNOWN", None))
+        if approval_status == "DISAPPROVED":
+            disapproved_count += 1
 
-        for dest in destinations:
-            dest_status = dest.get("status", "").upper()
-            if dest_status == "DISAPPROVED":
-                approval_status = "DISAPPROVED"
-                disapproved_count += 1
-                break
-            elif dest_status == "APPROVED":
-                approval_status = "APPROVED"
-            elif dest_status == "PENDING":
-                if approval_status != "APPROVED":
-                    approval_status = "PENDING"
-
-        # Collect issues
-        item_issues = status_info.get("itemLevelIssues", [])
-        for issue in item_issues:
-            if issue.get("servability") == "disapproved":
-                disapproval_issues.append({
-                    "code": issue.get("code"),
-                    "description": issue.get("description"),
-                    "detail": issue.get("detail"),
-                })
-
-        if not status_info and validation_errors is not None:
+        if not has_status and validation_errors is not None:
             missing_status_count += 1
             validation_errors.append({
                 "type": "MISSING_PRODUCT_STATUS",
@@ -1556,7 +1678,7 @@ def normalize_merchant_products(raw: dict, statuses_raw: dict, validation_errors
             "product_type": r.get("productTypes", [None])[0] if r.get("productTypes") else None,
             "google_product_category": r.get("googleProductCategory"),
             "approval_status": approval_status,
-            "disapproval_issues": disapproval_issues if disapproval_issues else None,
+            "disapproval_issues": disapproval_issues,
             "channel": r.get("channel"),
             "content_language": r.get("contentLanguage"),
             "target_country": r.get("targetCountry"),
@@ -1572,9 +1694,9 @@ def normalize_merchant_products(raw: dict, statuses_raw: dict, validation_errors
     }
 
 
-def normalize_merchant_product_status(statuses_raw: dict) -> dict:
+def normalize_merchant_product_status(statuses_raw: dict, records: list = None) -> dict:
     """Normalize product status summary for quick lookups."""
-    records = []
+    records = records if records is not None else []
 
     for s in statuses_raw.get("records", []):
         product_id = s.get("productId")
@@ -1620,137 +1742,26 @@ def normalize_merchant_product_status(statuses_raw: dict) -> dict:
 
 
 def normalize_gsc_search_analytics(raw: dict) -> dict:
-    """Normalize GSC search analytics into separate queries and pages views.
+    """Normalize GSC search analytics into rollups (see core/dump/gsc_rollups.py).
 
     Returns:
         Dict with:
-        - queries: Top queries by impressions
-        - pages: Top pages by impressions
+        - queries, pages, devices, countries, dates, query_pages: Rollups
+          ({count, records}), one pass over the raw rows
         - summary: Overall stats
     """
     rows = raw.get("records", [])
+    rollups = gsc_rollups.aggregate_rows(rows) if rows else {name: [] for name in gsc_rollups.ROLLUPS}
 
-    if not rows:
-        return {
-            "extracted_at": raw.get("extracted_at"),
-            "site_url": raw.get("site_url"),
-            "date_range": raw.get("date_range", {}),
-            "queries": {"count": 0, "records": []},
-            "pages": {"count": 0, "records": []},
-            "summary": {
-                "total_clicks": 0,
-                "total_impressions": 0,
-                "avg_ctr": 0,
-                "avg_position": 0,
-            },
-        }
-
-    # Aggregate by query (sum across all pages/devices/countries/dates)
-    queries_agg = {}
-    for row in rows:
-        keys = row.get("keys", [])
-        if len(keys) < 5:
-            continue  # Skip malformed rows
-
-        query = keys[0]  # First dimension is query
-        clicks = row.get("clicks", 0)
-        impressions = row.get("impressions", 0)
-        position = row.get("position", 0)
-
-        if query not in queries_agg:
-            queries_agg[query] = {
-                "query": query,
-                "clicks": 0,
-                "impressions": 0,
-                "position_sum": 0,
-                "position_count": 0,
-            }
-
-        queries_agg[query]["clicks"] += clicks
-        queries_agg[query]["impressions"] += impressions
-        queries_agg[query]["position_sum"] += position * impressions
-        queries_agg[query]["position_count"] += impressions
-
-    # Aggregate by page (sum across all queries/devices/countries/dates)
-    pages_agg = {}
-    for row in rows:
-        keys = row.get("keys", [])
-        if len(keys) < 5:
-            continue
-
-        page = keys[1]  # Second dimension is page
-        clicks = row.get("clicks", 0)
-        impressions = row.get("impressions", 0)
-        position = row.get("position", 0)
-
-        if page not in pages_agg:
-            pages_agg[page] = {
-                "page": page,
-                "clicks": 0,
-                "impressions": 0,
-                "position_sum": 0,
-                "position_count": 0,
-            }
-
-        pages_agg[page]["clicks"] += clicks
-        pages_agg[page]["impressions"] += impressions
-        pages_agg[page]["position_sum"] += position * impressions
-        pages_agg[page]["position_count"] += impressions
-
-    # Compute averages and format records
-    queries_records = []
-    for q in queries_agg.values():
-        avg_position = q["position_sum"] / q["position_count"] if q["position_count"] > 0 else 0
-        ctr = q["clicks"] / q["impressions"] if q["impressions"] > 0 else 0
-        queries_records.append({
-            "query": q["query"],
-            "clicks": q["clicks"],
-            "impressions": q["impressions"],
-            "ctr": round(ctr, 4),
-            "position": round(avg_position, 1),
-        })
-
-    pages_records = []
-    for p in pages_agg.values():
-        avg_position = p["position_sum"] / p["position_count"] if p["position_count"] > 0 else 0
-        ctr = p["clicks"] / p["impressions"] if p["impressions"] > 0 else 0
-        pages_records.append({
-            "page": p["page"],
-            "clicks": p["clicks"],
-            "impressions": p["impressions"],
-            "ctr": round(ctr, 4),
-            "position": round(avg_position, 1),
-        })
-
-    # Sort by impressions descending
-    queries_records.sort(key=lambda x: x["impressions"], reverse=True)
-    pages_records.sort(key=lambda x: x["impressions"], reverse=True)
-
-    # Compute summary stats
-    total_clicks = sum(q["clicks"] for q in queries_records)
-    total_impressions = sum(q["impressions"] for q in queries_records)
-    avg_ctr = total_clicks / total_impressions if total_impressions > 0 else 0
-    avg_position = sum(q["position"] * q["impressions"] for q in queries_records) / total_impressions if total_impressions > 0 else 0
-
-    return {
+    norm = {
         "extracted_at": raw.get("extracted_at"),
         "site_url": raw.get("site_url"),
         "date_range": raw.get("date_range", {}),
-        "queries": {
-            "count": len(queries_records),
-            "records": queries_records,
-        },
-        "pages": {
-            "count": len(pages_records),
-            "records": pages_records,
-        },
-        "summary": {
-            "total_clicks": total_clicks,
-            "total_impressions": total_impressions,
-            "avg_ctr": round(avg_ctr, 4),
-            "avg_position": round(avg_position, 1),
-        },
     }
+    for name, records in rollups.items():
+        norm[name] = {"count": len(records), "records": records}
+    norm["summary"] = gsc_rollups.summarize(rollups["queries"])
+    return norm
 
 
 # =============================================================================
@@ -1767,487 +1778,621 @@ def build_index(
     ads_norm: dict = None,
     merchant_products_norm: dict = None,
 ) -> dict:
-    """Build quick-lookup index with join-friendly lookups.
-
-    Index structure:
-        campaigns.by_id: {campaign_id: name}
-        campaigns.by_type: {type: [campaign_ids]}
-        campaigns.by_status: {status: [campaign_ids]}
-        ads.campaigns_by_id: {campaign_id: {name, type, status}}
-        ads.ad_groups_by_id: {ad_group_id: {name, campaign_id}}
-        ads.keywords_by_id: {keyword_id: {text, ad_group_id, campaign_id}}
-        totals: {campaigns, ad_groups, keywords, negatives}
-    """
-    # Campaigns by ID (simple name lookup)
-    campaigns_by_id = {}
-    campaigns_by_type = {}
-    campaigns_by_status = {}
-
-    # Join-friendly campaign lookup
-    campaigns_full_by_id = {}
-
-    for c in campaigns_norm.get("records", []):
-        cid = str(c.get("id"))
-        campaigns_by_id[cid] = c.get("name")
-        ctype = c.get("type", "UNKNOWN")
-        campaigns_by_type.setdefault(ctype, []).append(cid)
-        status = c.get("status", "UNKNOWN")
-        campaigns_by_status.setdefault(status, []).append(cid)
-        # Full lookup
-        campaigns_full_by_id[cid] = {
-            "name": c.get("name"),
-            "type": ctype,
-            "status": status,
-        }
+    """Build the entity index tables (written to _index.bin by write_index).
 
-    # PMax campaigns
-    for c in pmax_campaigns_norm.get("records", []):
-        cid = str(c.get("id"))
-        campaigns_by_id[cid] = c.get("name")
-        campaigns_by_type.setdefault("PMAX", []).append(cid)
-        status = c.get("status", "UNKNOWN")
-        campaigns_by_status.setdefault(status, []).append(cid)
-        # Full lookup
-        campaigns_full_by_id[cid] = {
-            "name": c.get("name"),
-            "type": "PERFORMANCE_MAX",
-            "status": status,
-        }
-
-    # Ad groups by ID (join-friendly)
-    ad_groups_by_id = {}
-    for ag in ad_groups_norm.get("records", []):
-        ag_id = str(ag.get("id"))
-        ad_groups_by_id[ag_id] = {
-            "name": ag.get("name"),
-            "campaign_id": ag.get("campaign_id"),
-        }
+    Tables (see core/snapshot/entity_index.py for the stored fields):
+        campaigns: Normalized campaigns plus PMax campaigns (type
+            PERFORMANCE_MAX); secondary indexes on status and type
+        ad_groups: secondary indexes on campaign_id and status
+        keywords: secondary indexes on campaign_id, ad_group_id and status
+        products: Merchant products (if available); secondary indexes on
+            brand, approval_status, offer_id and sku
 
-    # Keywords by ID (join-friendly)
-    keywords_by_id = {}
-    for kw in keywords_norm.get("records", []):
-        kw_id = str(kw.get("id"))
-        keywords_by_id[kw_id] = {
-            "text": kw.get("text"),
-            "ad_group_id": kw.get("ad_group_id"),
-            "campaign_id": kw.get("campaign_id"),
-        }
-
-    # Merchant products lookups (if available)
-    products_by_offer_id = {}
-    products_by_sku = {}
-    merchant_totals = {}
-
-    if merchant_products_norm:
-        for p in merchant_products_norm.get("records", []):
-            offer_id = p.get("offer_id")
-            sku = p.get("sku")
-            product_info = {
-                "id": p.get("id"),
-                "title": p.get("title"),
-                "brand": p.get("brand"),
-                "price": p.get("price"),
-                "approval_status": p.get("approval_status"),
-            }
-            if offer_id:
-                products_by_offer_id[offer_id] = product_info
-            if sku:
-                products_by_sku[sku] = product_info
-
-        merchant_totals = {
-            "products": merchant_products_norm.get("count", 0),
-            "disapproved": merchant_products_norm.get("disapproved_count", 0),
-        }
+    Returns:
+        {"tables": {table: [records]}, "totals": {campaigns, ad_groups, keywords, negatives, ...}}
+    """
+    campaigns = list(campaigns_norm.get("records", []))
+    known_ids = {str(c.get("id")) for c in campaigns}
+    campaigns.extend(
+        {**c, "type": "PERFORMANCE_MAX"}
+        for c in pmax_campaigns_norm.get("records", [])
+        if str(c.get("id")) not in known_ids
+    )
 
-    result = {
-        "campaigns": {
-            "by_id": campaigns_by_id,
-            "by_type": campaigns_by_type,
-            "by_status": campaigns_by_status,
-        },
-        "ads": {
-            "campaigns_by_id": campaigns_full_by_id,
-            "ad_groups_by_id": ad_groups_by_id,
-            "keywords_by_id": keywords_by_id,
-        },
-        "totals": {
-            "campaigns": campaigns_norm.get("count", 0) + pmax_campaigns_norm.get("count", 0),
-            "ad_groups": ad_groups_norm.get("count", 0),
-            "keywords": keywords_norm.get("count", 0),
-            "negatives": negatives_norm.get("count", 0),
-        },
+    tables = {
+        "campaigns": campaigns,
+        "ad_groups": ad_groups_norm.get("records", []),
+        "keywords": keywords_norm.get("records", []),
+    }
+    totals = {
+        "campaigns": campaigns_norm.get("count", 0) + pmax_campaigns_norm.get("count", 0),
+        "ad_groups": ad_groups_norm.get("count", 0),
+        "keywords": keywords_norm.get("count", 0),
+        "negatives": negatives_norm.get("count", 0),
     }
 
-    # Add merchant section if data available
+    # Add merchant table if data available
     if merchant_products_norm:
-        result["merchant"] = {
-            "products_by_offer_id": products_by_offer_id,
-            "products_by_sku": products_by_sku,
-        }
-        result["totals"]["merchant_products"] = merchant_totals.get("products", 0)
-        result["totals"]["merchant_disapproved"] = merchant_totals.get("disapproved", 0)
+        tables["products"] = merchant_products_norm.get("records", [])
+        totals["merchant_products"] = merchant_products_norm.get("count", 0)
+        totals["merchant_disapproved"] = merchant_products_norm.get("disapproved_count", 0)
 
-    return result
+    return {"tables": tables, "totals": totals}
 
 
 # =============================================================================
-# MAIN
+# NORMALIZE PIPELINE
 # =============================================================================
 
 
-def write_json(path: Path, data: dict):
-    """Write JSON file with pretty formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
-
-
-def main():
-    start_time = time.time()
-    extraction_started_utc = datetime.utcnow().isoformat() + "Z"
-
-    print("=" * 60)
-    print(f"STATE DUMP - ADS + MERCHANT + GSC  [v{SNAPSHOT_VERSION}]")
-    print("=" * 60)
-    print()
-
-    # Parse args
-    days = CHANGE_HISTORY_DAYS
-    for i, arg in enumerate(sys.argv):
-        if arg == "--days" and i + 1 < len(sys.argv):
-            days = int(sys.argv[i + 1])
-
-    # Load credentials
-    if not load_env():
-        print("ERROR: No .env file found")
-        sys.exit(1)
-
-    customer_id = os.getenv("GOOGLE_ADS_CUSTOMER_ID")
-    login_customer_id = os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID")
-    merchant_id = os.getenv("MERCHANT_CENTER_ID")
-
-    if not customer_id:
-        print("ERROR: GOOGLE_ADS_CUSTOMER_ID not set")
-        sys.exit(1)
-
-    gsc_site_url = os.getenv("GSC_SITE_URL")
+def normalize_pmax_assets(raw_asset_group_assets: dict) -> dict:
+    """Normalize asset group asset links (PMax assets share raw assets)."""
+    return {
+        "extracted_at": raw_asset_group_assets.get("extracted_at"),
+        "count": raw_asset_group_assets.get("count", 0),
+        "records": [
+            {
+                "asset_group_id": extract_id(r.get("assetGroup", "")),
+                "asset_id": extract_id(r.get("asset", "")),
+                "field_type": r.get("fieldType"),
+                "status": r.get("status"),
+            }
+            for r in raw_asset_group_assets.get("records", [])
+        ],
+    }
 
-    print(f"Google Ads Customer ID: {customer_id}")
-    print(f"Google Ads Login Customer ID: {login_customer_id or '(none)'}")
-    print(f"Merchant Center ID: {merchant_id or '(none)'}")
-    print(f"GSC Site URL: {gsc_site_url or '(none)'}")
-    print(f"Change history: {days} days")
-    print()
 
-    # Authenticate
-    print("Authenticating...")
-    access_token = get_access_token()
-    ads_client = GoogleAdsClient(customer_id, access_token, login_customer_id)
-    merchant_client = MerchantCenterClient(merchant_id, access_token) if merchant_id else None
-    gsc_client = GoogleSearchConsoleClient(gsc_site_url, access_token) if gsc_site_url else None
-    print("OK")
-    print()
+def normalize_gsc_files(raw_analytics: dict) -> dict:
+    """Split normalized GSC analytics into its rollup and summary files (empty when no rows)."""
+    norm = normalize_gsc_search_analytics(raw_analytics if raw_analytics.get("count", 0) > 0 else {})
+    files = {f"normalized/gsc/{name}.json": norm[name] for name in gsc_rollups.ROLLUPS}
+    files["normalized/gsc/summary.json"] = {
+        "extracted_at": norm["extracted_at"],
+        "site_url": norm["site_url"],
+        "date_range": norm["date_range"],
+        "summary": norm["summary"],
+    }
+    return files
+
+
+# Job name -> (raw inputs by fetcher name, fn(raw, validation_errors, new_records) -> {normalized path: data}).
+# Jobs only read raw data, so they can run in any order or in separate processes.
+# A job runs only when all of its raw inputs exist (Merchant / GSC are optional).
+# new_records(name) returns a list to append output records to; during a dump it
+# is an append-only record file, so catalog-sized outputs stay on disk.
+NORMALIZE_JOBS = {
+    "campaigns": (["campaigns"], lambda raw, errs, new_records: {
+        "normalized/ads/campaigns.json": normalize_campaigns(raw["campaigns"])}),
+    "ad_groups": (["ad_groups"], lambda raw, errs, new_records: {
+        "normalized/ads/ad_groups.json": normalize_ad_groups(raw["ad_groups"])}),
+    "keywords": (["keywords", "ad_groups"], lambda raw, errs, new_records: {
+        "normalized/ads/keywords.json": normalize_keywords(raw["keywords"], raw["ad_groups"], errs,
+                                                           records=new_records("normalized_keywords"))}),
+    "negatives": (["campaign_negatives", "adgroup_negatives"], lambda raw, errs, new_records: {
+        "normalized/ads/negatives.json": normalize_negatives(raw["campaign_negatives"], raw["adgroup_negatives"])}),
+    "ads": (["ads", "ad_groups"], lambda raw, errs, new_records: {
+        "normalized/ads/ads.json": normalize_ads(raw["ads"], raw["ad_groups"])}),
+    "assets": (["assets", "asset_links"], lambda raw, errs, new_records: {
+        "normalized/ads/assets.json": normalize_assets(raw["assets"], raw["asset_links"],
+                                                       records=new_records("normalized_assets"))}),
+    "change_history": (["change_history"], lambda raw, errs, new_records: {
+        "normalized/ads/change_history.json": normalize_change_history(raw["change_history"])}),
+    "performance": (["performance"], lambda raw, errs, new_records: {
+        "normalized/ads/performance.json": normalize_performance(raw["performance"])}),
+    "pmax_campaigns": (["pmax_campaigns"], lambda raw, errs, new_records: {
+        "normalized/pmax/campaigns.json": normalize_pmax_campaigns(raw["pmax_campaigns"])}),
+    "asset_groups": (["asset_groups", "asset_group_assets"], lambda raw, errs, new_records: {
+        "normalized/pmax/asset_groups.json": normalize_asset_groups(raw["asset_groups"], raw["asset_group_assets"])}),
+    "listing_groups": (["listing_groups"], lambda raw, errs, new_records: {
+        "normalized/pmax/listing_groups.json": normalize_listing_groups(raw["listing_groups"],
+                                                                        records=new_records("normalized_listing_groups"))}),
+    "pmax_assets": (["asset_group_assets"], lambda raw, errs, new_records: {
+        "normalized/pmax/assets.json": normalize_pmax_assets(raw["asset_group_assets"])}),
+    "brand_exclusions": (["brand_lists", "pmax_brand_exclusions"], lambda raw, errs, new_records: {
+        "normalized/pmax/brand_exclusions.json": normalize_brand_exclusions(raw["brand_lists"], raw["pmax_brand_exclusions"])}),
+    "merchant": (["merchant_products", "merchant_product_statuses"], lambda raw, errs, new_records: {
+        "normalized/merchant/products.json": normalize_merchant_products(
+            raw["merchant_products"], raw["merchant_product_statuses"], errs,
+            records=new_records("normalized_merchant_products")),
+        "normalized/merchant/product_status.json": normalize_merchant_product_status(
+            raw["merchant_product_statuses"], records=new_records("normalized_merchant_product_status"))}),
+    "gsc": (["gsc_search_analytics"], lambda raw, errs, new_records: normalize_gsc_files(raw["gsc_search_analytics"])),
+}
+
+# Normalized files build_index reads (keyword name -> path)
+INDEX_INPUTS = {
+    "campaigns_norm": "normalized/ads/campaigns.json",
+    "ad_groups_norm": "normalized/ads/ad_groups.json",
+    "keywords_norm": "normalized/ads/keywords.json",
+    "negatives_norm": "normalized/ads/negatives.json",
+    "pmax_campaigns_norm": "normalized/pmax/campaigns.json",
+    "merchant_products_norm": "normalized/merchant/products.json",
+}
+
+
+def normalize_jobs_for(available_raw) -> list:
+    """Names of normalize jobs whose raw inputs are all available."""
+    return [
+        name for name, (inputs, _) in NORMALIZE_JOBS.items()
+        if all(i in available_raw for i in inputs)
+    ]
 
-    # Create snapshot directory
-    timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H%M%SZ")
-    snapshot_dir = PROJECT_ROOT / "snapshots" / timestamp
-    raw_ads_dir = snapshot_dir / "raw" / "ads"
-    raw_pmax_dir = snapshot_dir / "raw" / "pmax"
-    raw_merchant_dir = snapshot_dir / "raw" / "merchant"
-    raw_gsc_dir = snapshot_dir / "raw" / "gsc"
-    norm_ads_dir = snapshot_dir / "normalized" / "ads"
-    norm_pmax_dir = snapshot_dir / "normalized" / "pmax"
-    norm_merchant_dir = snapshot_dir / "normalized" / "merchant"
-    norm_gsc_dir = snapshot_dir / "normalized" / "gsc"
 
-    errors = []
+def run_normalize_job(name: str, raw: dict, new_records=None) -> tuple:
+    """Run one normalize job. Returns ({normalized path: data}, validation_errors).
 
-    # ==========================================================================
-    # FETCH RAW DATA - SEARCH
-    # ==========================================================================
-    print("Fetching Google Ads data...")
+    new_records(name) makes the lists large outputs and validation errors are
+    appended to (default: plain lists).
+    """
+    inputs, fn = NORMALIZE_JOBS[name]
+    new_records = new_records or (lambda record_name: [])
+    validation_errors = new_records(f"errors_{name}")
+    outputs = fn({i: raw[i] for i in inputs}, validation_errors, new_records)
+    return outputs, validation_errors
 
-    print("  Campaigns...", end=" ", flush=True)
-    try:
-        raw_campaigns = fetch_campaigns(ads_client)
-        print(f"{raw_campaigns['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "campaigns", "error": str(e)})
-        raw_campaigns = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
 
-    print("  Ad Groups...", end=" ", flush=True)
-    try:
-        raw_ad_groups = fetch_ad_groups(ads_client)
-        print(f"{raw_ad_groups['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "ad_groups", "error": str(e)})
-        raw_ad_groups = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
+def summarize_normalized(outputs: dict) -> dict:
+    """Top-level scalar fields (counts etc.) of each normalized file."""
+    return {
+        path: {k: v for k, v in data.items() if not isinstance(v, (list, dict, SpooledRecords))}
+        for path, data in outputs.items()
+    }
 
-    print("  Keywords...", end=" ", flush=True)
-    try:
-        raw_keywords = fetch_keywords(ads_client)
-        print(f"{raw_keywords['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "keywords", "error": str(e)})
-        raw_keywords = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
 
-    print("  Campaign Negatives...", end=" ", flush=True)
-    try:
-        raw_campaign_negatives = fetch_campaign_negatives(ads_client)
-        print(f"{raw_campaign_negatives['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "campaign_negatives", "error": str(e)})
-        raw_campaign_negatives = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
+def build_index_from(normalized: dict) -> dict:
+    """build_index over {normalized path: data}; missing files count as empty."""
+    kwargs = {key: normalized.get(path) or {} for key, path in INDEX_INPUTS.items()}
+    if kwargs["merchant_products_norm"].get("count", 0) == 0:
+        kwargs["merchant_products_norm"] = None
+    return build_index(**kwargs)
+
+
+def normalized_manifest_counts(summary: dict) -> tuple:
+    """(record_counts.normalized, validation counters) for _manifest.json."""
+    def get(path, key):
+        return summary.get(path, {}).get(key, 0)
+
+    counts = {
+        "campaigns": get("normalized/ads/campaigns.json", "count"),
+        "pmax_campaigns": get("normalized/pmax/campaigns.json", "count"),
+        "ad_groups": get("normalized/ads/ad_groups.json", "count"),
+        "keywords": get("normalized/ads/keywords.json", "count"),
+        "negatives": get("normalized/ads/negatives.json", "count"),
+        "ads": get("normalized/ads/ads.json", "count"),
+        "assets": get("normalized/ads/assets.json", "count"),
+        "asset_groups": get("normalized/pmax/asset_groups.json", "count"),
+        "listing_groups": get("normalized/pmax/listing_groups.json", "count"),
+        "brand_exclusions": get("normalized/pmax/brand_exclusions.json", "pmax_negative_criteria_count"),
+        "brand_lists": get("normalized/pmax/brand_exclusions.json", "brand_lists_count"),
+        "change_events": get("normalized/ads/change_history.json", "count"),
+        "merchant_products": get("normalized/merchant/products.json", "count"),
+        "merchant_disapproved": get("normalized/merchant/products.json", "disapproved_count"),
+        "gsc_queries": get("normalized/gsc/queries.json", "count"),
+        "gsc_pages": get("normalized/gsc/pages.json", "count"),
+        "gsc_devices": get("normalized/gsc/devices.json", "count"),
+        "gsc_countries": get("normalized/gsc/countries.json", "count"),
+        "gsc_dates": get("normalized/gsc/dates.json", "count"),
+        "gsc_query_pages": get("normalized/gsc/query_pages.json", "count"),
+    }
+    validation = {
+        "keywords_null_campaign_ids": get("normalized/ads/keywords.json", "null_campaign_ids"),
+        "merchant_missing_status": get("normalized/merchant/products.json", "missing_status_count"),
+    }
+    return counts, validation
 
-    print("  Ad Group Negatives...", end=" ", flush=True)
-    try:
-        raw_adgroup_negatives = fetch_adgroup_negatives(ads_client)
-        print(f"{raw_adgroup_negatives['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "adgroup_negatives", "error": str(e)})
-        raw_adgroup_negatives = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
 
-    print("  Ads...", end=" ", flush=True)
-    try:
-        raw_ads = fetch_ads(ads_client)
-        print(f"{raw_ads['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "ads", "error": str(e)})
-        raw_ads = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
+def write_errors_jsonl(snapshot_dir: Path, validation_errors: list):
+    """Write errors.jsonl (or remove a stale one when there are no errors)."""
+    errors_file = snapshot_dir / "errors.jsonl"
+    if errors_file.exists():
+        errors_file.unlink()
+    if validation_errors:
+        with open(errors_file, "w", encoding="utf-8") as f:
+            for err in validation_errors:
+                f.write(json.dumps(err) + "\n")
 
-    print("  Assets...", end=" ", flush=True)
-    try:
-        raw_assets = fetch_assets(ads_client)
-        print(f"{raw_assets['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "assets", "error": str(e)})
-        raw_assets = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
 
-    print("  Asset Links...", end=" ", flush=True)
-    try:
-        raw_asset_links = fetch_asset_links(ads_client)
-        print(f"{raw_asset_links['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "asset_links", "error": str(e)})
-        raw_asset_links = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
+# =============================================================================
+# FETCH REGISTRY
+# =============================================================================
 
-    print("  Change History...", end=" ", flush=True)
-    try:
-        raw_change_history = fetch_change_history(ads_client, days)
-        print(f"{raw_change_history['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "change_history", "error": str(e)})
-        raw_change_history = {"extracted_at": datetime.utcnow().isoformat() + "Z", "lookback_days": days, "count": 0, "records": []}
 
-    print("  Performance...", end=" ", flush=True)
-    try:
-        raw_performance = fetch_performance(ads_client, PERFORMANCE_DAYS)
-        print(f"{len(raw_performance.get('by_campaign', []))} campaign days, {len(raw_performance.get('by_ad_group', []))} ad group days")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "performance", "error": str(e)})
-        raw_performance = {"extracted_at": datetime.utcnow().isoformat() + "Z", "date_range": {}, "by_campaign": [], "by_ad_group": []}
+def empty_raw(**extra) -> dict:
+    """Empty raw payload used when a fetcher fails or its source is not configured."""
+    return {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": [], **extra}
+
+
+def describe_fetch_result(name: str, result: dict) -> str:
+    """One-line progress summary for a completed fetcher."""
+    if name == "performance":
+        summary = (f"{len(result.get('by_campaign', []))} campaign days, "
+                   f"{len(result.get('by_ad_group', []))} ad group days")
+        store = result.get("store")
+        if store:
+            fetched = ", ".join(f"{r['start']}..{r['end']}" for r in store.get("fetched_ranges", []))
+            summary += f" (fetched {fetched}, rest from store)" if fetched else " (all from store)"
+        return summary
+    if name == "change_scan":
+        if result.get("full_refresh_reason"):
+            return f"full refetch: {result['full_refresh_reason']}"
+        return f"{result.get('count', 0)} change events, refreshing {', '.join(result.get('refresh', [])) or 'nothing'}"
+    if name == "change_history" and "slices" in result:
+        summary = (f"{result.get('count', 0)} records, {len(result['slices'])} slices "
+                   f"({result['saturated_splits']} saturated slices split)")
+        if result["truncated_slices"]:
+            summary += f" TRUNCATED at {', '.join(result['truncated_slices'])}"
+        return summary
+    if name == "gsc_search_analytics" and result.get("partitions"):
+        partitions = result["partitions"]
+        complete = sum(1 for p in partitions if p["complete"])
+        summary = f"{result.get('count', 0)} rows, {complete}/{len(partitions)} partitions"
+        return f"{summary} (INCOMPLETE: {result['error']})" if result.get("error") else summary
+    if name.startswith("gsc_") and result.get("error"):
+        return f"SKIPPED: {result.get('note', 'No access')}"
+    unit = {"merchant_account_issues": "issues", "gsc_sites": "sites", "gsc_search_analytics": "rows"}
+    return f"{result.get('count', 0)} {unit.get(name, 'records')}"
+
+
+# Fetcher name -> raw file path relative to the snapshot root
+RAW_FILE_PATHS = {
+    "campaigns": "raw/ads/campaigns.json",
+    "ad_groups": "raw/ads/ad_groups.json",
+    "keywords": "raw/ads/keywords.json",
+    "campaign_negatives": "raw/ads/campaign_negatives.json",
+    "adgroup_negatives": "raw/ads/adgroup_negatives.json",
+    "ads": "raw/ads/ads.json",
+    "assets": "raw/ads/assets.json",
+    "asset_links": "raw/ads/asset_links.json",
+    "change_history": "raw/ads/change_history.json",
+    "performance": "raw/ads/performance.json",
+    "pmax_campaigns": "raw/pmax/campaigns.json",
+    "asset_groups": "raw/pmax/asset_groups.json",
+    "asset_group_assets": "raw/pmax/asset_group_assets.json",
+    "listing_groups": "raw/pmax/listing_groups.json",
+    "pmax_campaign_assets": "raw/pmax/campaign_assets.json",
+    "url_expansion": "raw/pmax/url_expansion.json",
+    "brand_lists": "raw/pmax/brand_lists.json",
+    "pmax_brand_exclusions": "raw/pmax/brand_exclusions.json",
+    "merchant_products": "raw/merchant/products.json",
+    "merchant_product_statuses": "raw/merchant/product_statuses.json",
+    "merchant_account_issues": "raw/merchant/account_issues.json",
+    "gsc_sites": "raw/gsc/sites.json",
+    "gsc_search_analytics": "raw/gsc/search_analytics.json",
+}
+
+
+def expected_raw_fetchers(merchant_client, gsc_client) -> list:
+    """Raw fetcher names register_fetchers adds for these clients (Merchant and GSC are optional)."""
+    return [name for name in RAW_FILE_PATHS
+            if not (name.startswith("merchant_") and not merchant_client)
+            and not (name.startswith("gsc_") and not gsc_client)]
+
+
+def register_fetchers(scheduler, ads_client, merchant_client, gsc_client, days: int,
+                      perf_days: int = PERFORMANCE_DAYS, perf_store: PerformanceStore = None):
+    """Declare every dump fetcher and its dependencies on the scheduler.
+
+    Task names match the raw record_counts keys in _manifest.json. Fetchers
+    receive a dict of their dependencies' results; none of the current
+    fetchers consume upstream data, so all of them are roots of the graph
+    and run concurrently up to the worker limit.
+    """
+    ads = ads_client
+
+    # Google Ads - Search
+    scheduler.add("campaigns", lambda up: fetch_campaigns(ads), deps=[],
+                  label="Campaigns", default=empty_raw)
+    scheduler.add("ad_groups", lambda up: fetch_ad_groups(ads), deps=[],
+                  label="Ad Groups", default=empty_raw)
+    scheduler.add("keywords", lambda up: fetch_keywords(ads), deps=[],
+                  label="Keywords", default=empty_raw)
+    scheduler.add("campaign_negatives", lambda up: fetch_campaign_negatives(ads), deps=[],
+                  label="Campaign Negatives", default=empty_raw)
+    scheduler.add("adgroup_negatives", lambda up: fetch_adgroup_negatives(ads), deps=[],
+                  label="Ad Group Negatives", default=empty_raw)
+    scheduler.add("ads", lambda up: fetch_ads(ads), deps=[],
+                  label="Ads", default=empty_raw)
+    scheduler.add("assets", lambda up: fetch_assets(ads), deps=[],
+                  label="Assets", default=empty_raw)
+    scheduler.add("asset_links", lambda up: fetch_asset_links(ads), deps=[],
+                  label="Asset Links", default=empty_raw)
+    scheduler.add("change_history", lambda up: fetch_change_history(ads, days), deps=[],
+                  label="Change History", default=lambda: empty_raw(lookback_days=days))
+    scheduler.add("performance", lambda up: fetch_performance(ads, perf_days, perf_store), deps=[],
+                  label="Performance",
+                  default=lambda: {"extracted_at": datetime.utcnow().isoformat() + "Z",
+                                   "date_range": {}, "by_campaign": [], "by_ad_group": []})
+
+    # Google Ads - Performance Max
+    scheduler.add("pmax_campaigns", lambda up: fetch_pmax_campaigns(ads), deps=[],
+                  label="PMax Campaigns", default=empty_raw)
+    scheduler.add("asset_groups", lambda up: fetch_asset_groups(ads), deps=[],
+                  label="Asset Groups", default=empty_raw)
+    scheduler.add("asset_group_assets", lambda up: fetch_asset_group_assets(ads), deps=[],
+                  label="Asset Group Assets", default=empty_raw)
+    scheduler.add("listing_groups", lambda up: fetch_listing_groups(ads), deps=[],
+                  label="Listing Groups", default=empty_raw)
+    scheduler.add("pmax_campaign_assets", lambda up: fetch_pmax_campaign_assets(ads), deps=[],
+                  label="PMax Campaign Assets", default=empty_raw)
+    scheduler.add("url_expansion", lambda up: fetch_url_expansion(ads), deps=[],
+                  label="URL Expansion", default=empty_raw)
+    scheduler.add("brand_lists", lambda up: fetch_brand_lists(ads), deps=[],
+                  label="Brand Lists", default=empty_raw)
+    scheduler.add("pmax_brand_exclusions", lambda up: fetch_pmax_brand_exclusions(ads), deps=[],
+                  label="PMax Brand Exclusions", default=empty_raw)
+
+    # Merchant Center
+    if merchant_client:
+        scheduler.add("merchant_products", lambda up: fetch_merchant_products(merchant_client), deps=[],
+                      label="Merchant Products", default=empty_raw)
+        scheduler.add("merchant_product_statuses", lambda up: fetch_merchant_product_statuses(merchant_client),
+                      deps=[], label="Merchant Product Statuses", default=empty_raw)
+        scheduler.add("merchant_account_issues", lambda up: fetch_merchant_account_issues(merchant_client),
+                      deps=[], label="Merchant Account Issues", default=empty_raw)
+
+    # Google Search Console
+    if gsc_client:
+        scheduler.add("gsc_sites", lambda up: fetch_gsc_sites(gsc_client), deps=[],
+                      label="GSC Sites", default=empty_raw)
+        scheduler.add("gsc_search_analytics", lambda up: fetch_gsc_search_analytics(gsc_client, days=30),
+                      deps=[], label="GSC Search Analytics (30 days)", default=empty_raw)
 
-    print()
 
-    # ==========================================================================
-    # FETCH RAW DATA - PMAX
-    # ==========================================================================
-    print("Fetching Performance Max data...")
+# =============================================================================
+# MAIN
+# =============================================================================
 
-    print("  PMax Campaigns...", end=" ", flush=True)
-    try:
-        raw_pmax_campaigns = fetch_pmax_campaigns(ads_client)
-        print(f"{raw_pmax_campaigns['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "pmax_campaigns", "error": str(e)})
-        raw_pmax_campaigns = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
 
-    print("  Asset Groups...", end=" ", flush=True)
-    try:
-        raw_asset_groups = fetch_asset_groups(ads_client)
-        print(f"{raw_asset_groups['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "asset_groups", "error": str(e)})
-        raw_asset_groups = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
+# Set by main() unless --no-dedup; snapshot files are then hardlinked from it
+BLOB_STORE = None
 
-    print("  Asset Group Assets...", end=" ", flush=True)
-    try:
-        raw_asset_group_assets = fetch_asset_group_assets(ads_client)
-        print(f"{raw_asset_group_assets['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "asset_group_assets", "error": str(e)})
-        raw_asset_group_assets = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
+# Set by main() from --encoding; see core/snapshot/codec.py
+SNAPSHOT_ENCODING = "json"
 
-    print("  Listing Groups...", end=" ", flush=True)
-    try:
-        raw_listing_groups = fetch_listing_groups(ads_client)
-        print(f"{raw_listing_groups['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "listing_groups", "error": str(e)})
-        raw_listing_groups = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
 
-    print("  PMax Campaign Assets...", end=" ", flush=True)
-    try:
-        raw_pmax_campaign_assets = fetch_pmax_campaign_assets(ads_client)
-        print(f"{raw_pmax_campaign_assets['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "pmax_campaign_assets", "error": str(e)})
-        raw_pmax_campaign_assets = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
+def write_file(path: Path, write_fn, dedup: bool = True):
+    """Write a snapshot file; write_fn receives a binary writable object.
 
-    print("  URL Expansion...", end=" ", flush=True)
-    try:
-        raw_url_expansion = fetch_url_expansion(ads_client)
-        print(f"{raw_url_expansion['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "url_expansion", "error": str(e)})
-        raw_url_expansion = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
+    With a blob store configured the file is stored once by content hash and
+    hardlinked into place, so unchanged files cost no extra disk.
+    """
+    if BLOB_STORE is not None and dedup:
+        BLOB_STORE.write(path, write_fn)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write beside the target and rename over it: a crash never leaves a
+    # truncated file, and never writes through a hardlink into a shared blob
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        write_fn(f)
+    os.replace(tmp_path, path)
 
-    print("  Brand Lists...", end=" ", flush=True)
-    try:
-        raw_brand_lists = fetch_brand_lists(ads_client)
-        print(f"{raw_brand_lists['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "brand_lists", "error": str(e)})
-        raw_brand_lists = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": [], "api_note": str(e)}
 
-    print("  PMax Brand Exclusions...", end=" ", flush=True)
-    try:
-        raw_pmax_brand_exclusions = fetch_pmax_brand_exclusions(ads_client)
-        print(f"{raw_pmax_brand_exclusions['count']} records")
-    except Exception as e:
-        print(f"ERROR: {e}")
-        errors.append({"file": "pmax_brand_exclusions", "error": str(e)})
-        raw_pmax_brand_exclusions = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": [], "api_note": str(e)}
+def write_json(path: Path, data: dict, dedup: bool = True, encoding: str = None):
+    """Write a snapshot JSON file (pretty-printed unless --encoding compresses it)."""
+    encoding = encoding or SNAPSHOT_ENCODING
+    write_file(path, lambda f: snapshot_codec.dump_json(data, f, encoding), dedup=dedup)
 
-    print()
 
-    # ==========================================================================
-    # FETCH RAW DATA - MERCHANT CENTER
-    # ==========================================================================
-    raw_merchant_products = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
-    raw_merchant_product_statuses = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
-    raw_merchant_account_issues = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
+def write_index(snapshot_dir: Path, index: dict):
+    """Write build_index output as the snapshot's binary _index.bin.
 
-    if merchant_client:
-        print("Fetching Merchant Center data...")
+    Always uncompressed whatever --encoding says: readers memory-map it.
+    """
+    data = entity_index.encode_index(index["tables"], index["totals"])
+    write_file(snapshot_dir / entity_index.INDEX_FILE, lambda f: f.write(data))
 
-        print("  Products...", end=" ", flush=True)
-        try:
-            raw_merchant_products = fetch_merchant_products(merchant_client)
-            print(f"{raw_merchant_products['count']} records")
-        except Exception as e:
-            print(f"ERROR: {e}")
-            errors.append({"file": "merchant_products", "error": str(e)})
 
-        print("  Product Statuses...", end=" ", flush=True)
-        try:
-            raw_merchant_product_statuses = fetch_merchant_product_statuses(merchant_client)
-            print(f"{raw_merchant_product_statuses['count']} records")
-        except Exception as e:
-            print(f"ERROR: {e}")
-            errors.append({"file": "merchant_product_statuses", "error": str(e)})
+def dump_account(account: dict, options: dict, transport, access_token, telemetry: Telemetry,
+                 snapshots_dir: Path = None, governor: RateGovernor = None,
+                 resume: DumpCheckpoint = None) -> dict:
+    """Fetch, normalize and write one account's snapshot.
 
-        print("  Account Issues...", end=" ", flush=True)
-        try:
-            raw_merchant_account_issues = fetch_merchant_account_issues(merchant_client)
-            print(f"{raw_merchant_account_issues['count']} issues")
-        except Exception as e:
-            print(f"ERROR: {e}")
-            errors.append({"file": "merchant_account_issues", "error": str(e)})
+    Args:
+        account: {"customer_id", "login_customer_id", "merchant_id", "gsc_site_url"}
+        options: Parsed dump flags (see main)
+        transport: HTTP transport shared by the run
+        access_token: Token string or token provider callable
+        telemetry: Collector for this account's API calls
+        snapshots_dir: Parent folder of the snapshot (default: SNAPSHOTS_DIR)
+        governor: Rate governor of the run's transport (quota use goes in the manifest)
+        resume: Checkpoint of an interrupted snapshot to complete instead of starting a new one
 
-        print()
+    Returns:
+        Summary of the written snapshot (for the multi-account run manifest)
+    """
+    start_time = time.time()
+    extraction_started_utc = datetime.utcnow().isoformat() + "Z"
+    snapshots_dir = snapshots_dir or SNAPSHOTS_DIR
+    customer_id = account["customer_id"]
+    login_customer_id = account.get("login_customer_id")
+    merchant_id = account.get("merchant_id")
+    gsc_site_url = account.get("gsc_site_url")
+    workers = options["workers"]
+
+    ads_client = GoogleAdsClient(customer_id, access_token, login_customer_id, transport=transport,
+                                 telemetry=telemetry)
+    ads_client.field_profile = options["profile"]
+    merchant_client = MerchantCenterClient(merchant_id, access_token, transport=transport,
+                                           telemetry=telemetry) if merchant_id else None
+    gsc_client = GoogleSearchConsoleClient(gsc_site_url, access_token, transport=transport,
+                                           telemetry=telemetry) if gsc_site_url else None
+
+    # Create snapshot directory (or continue an interrupted one)
+    if resume:
+        checkpoint = resume
+        snapshot_dir = checkpoint.snapshot_dir
+        timestamp = snapshot_dir.name
+        extraction_started_utc = checkpoint.state["started_utc"]
     else:
-        print("Skipping Merchant Center (no MERCHANT_CENTER_ID)")
-        print()
+        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H%M%SZ")
+        snapshot_dir = snapshots_dir / timestamp
+        checkpoint = DumpCheckpoint.start(snapshot_dir, account, options, extraction_started_utc)
+    ads_client.checkpoint = checkpoint
+    if merchant_client:
+        merchant_client.checkpoint = checkpoint
+    if gsc_client:
+        gsc_client.checkpoint = checkpoint
+    raw_ads_dir = snapshot_dir / "raw" / "ads"
+    raw_pmax_dir = snapshot_dir / "raw" / "pmax"
+    raw_merchant_dir = snapshot_dir / "raw" / "merchant"
+    raw_gsc_dir = snapshot_dir / "raw" / "gsc"
+    norm_ads_dir = snapshot_dir / "normalized" / "ads"
+    norm_pmax_dir = snapshot_dir / "normalized" / "pmax"
+    norm_merchant_dir = snapshot_dir / "normalized" / "merchant"
+    norm_gsc_dir = snapshot_dir / "normalized" / "gsc"
+    if options["trace"]:
+        telemetry.trace_path = snapshot_dir / "_trace.jsonl"
 
     # ==========================================================================
-    # FETCH RAW DATA - GOOGLE SEARCH CONSOLE
+    # FETCH RAW DATA (concurrent, dependency-ordered)
     # ==========================================================================
-    raw_gsc_sites = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
-    raw_gsc_search_analytics = {"extracted_at": datetime.utcnow().isoformat() + "Z", "count": 0, "records": []}
-
-    if gsc_client:
-        print("Fetching Google Search Console data...")
-
-        print("  Sites...", end=" ", flush=True)
-        try:
-            raw_gsc_sites = fetch_gsc_sites(gsc_client)
-            if raw_gsc_sites.get("error"):
-                print(f"SKIPPED: {raw_gsc_sites.get('note', 'No access')}")
-            else:
-                print(f"{raw_gsc_sites['count']} sites")
-        except Exception as e:
-            print(f"ERROR: {e}")
-            errors.append({"file": "gsc_sites", "error": str(e)})
+    print(f"Fetching data ({workers} workers)...")
+
+    # Raw files committed by an earlier, interrupted run of this snapshot
+    from_checkpoint = {name for name, info in checkpoint.completed.items()
+                       if (snapshot_dir / info["raw_file"]).exists()}
+    committed = set()
+
+    # Normalize jobs run while the remaining fetchers are still going. Merchant
+    # jobs are skipped when there are no products (no Merchant files are written).
+    expected_raw = expected_raw_fetchers(merchant_client, gsc_client)
+    pipeline = NormalizePipeline(
+        NORMALIZE_JOBS, run_normalize_job,
+        expected_raw=expected_raw,
+        write_fn=lambda rel_path, data: write_json(snapshot_dir / rel_path, data),
+        new_records=lambda name: new_record_list(checkpoint, name),
+        skip_fn=lambda job, fed: (any(i.startswith("merchant_") for i in NORMALIZE_JOBS[job][0])
+                                  and fed["merchant_products"].get("count", 0) == 0),
+        summarize_fn=summarize_normalized,
+        chain_fn=chain_records,
+    )
 
-        print("  Search Analytics (30 days)...", end=" ", flush=True)
-        try:
-            raw_gsc_search_analytics = fetch_gsc_search_analytics(gsc_client, days=30)
-            if raw_gsc_search_analytics.get("error"):
-                print(f"SKIPPED: {raw_gsc_search_analytics.get('note', 'No access')}")
-            else:
-                print(f"{raw_gsc_search_analytics['count']} rows")
-        except Exception as e:
-            print(f"ERROR: {e}")
-            errors.append({"file": "gsc_search_analytics", "error": str(e)})
+    def report_progress(task, result):
+        if task.error:
+            print(f"  {task.label}... ERROR: {task.error}")
+            if task.name in RAW_FILE_PATHS:
+                pipeline.feed(task.name, result)  # normalize its empty default
+            return
+        elapsed = task.finished_at - task.started_at
+        print(f"  {task.label}... {describe_fetch_result(task.name, result)} ({elapsed:.1f}s)")
+        # Commit the raw file now, so a crash later in the dump never refetches it.
+        # A result that reports its own error (e.g. GSC partitions that failed)
+        # is written but left incomplete, so --resume fetches it again.
+        rel_path = RAW_FILE_PATHS.get(task.name)
+        if rel_path and task.name not in from_checkpoint:
+            write_json(snapshot_dir / rel_path, result)
+            committed.add(task.name)
+            if not result.get("error"):
+                checkpoint.mark_complete(task.name, rel_path)
+        if rel_path:
+            # Start any normalize job this raw file completes
+            pipeline.feed(task.name, result)
+
+    scheduler = DumpScheduler(max_workers=workers, on_complete=report_progress)
+    perf_store = PerformanceStore(PERF_STORE_DIR, customer_id, options["lag_days"]) if options["perf_store"] else None
+    register_fetchers(scheduler, ads_client, merchant_client, gsc_client, options["days"],
+                      perf_days=options["perf_days"], perf_store=perf_store)
+    registered_raw = {name for name in scheduler.tasks if name in RAW_FILE_PATHS}
+    if registered_raw != set(expected_raw):
+        raise Exception(f"expected_raw_fetchers() is out of date: registered {sorted(registered_raw)}, "
+                        f"expected {sorted(expected_raw)}")
+
+    incremental = None
+    if options["incremental"]:
+        incremental = IncrementalDump.from_previous(snapshots_dir, customer_id, RAW_FILE_PATHS, exclude=snapshot_dir,
+                                                    field_profile=options["profile"])
+        incremental.attach(scheduler, ads_client)
+        print(f"  Incremental base: {incremental.base_snapshot_id or '(none)'}")
+
+    if from_checkpoint:
+        checkpoint.attach(scheduler, from_checkpoint, snapshot_codec.read_json)
+        print(f"  Resuming {snapshot_dir.name}: {len(from_checkpoint)} fetchers already committed")
+
+    telemetry.instrument(scheduler)
+    raw = scheduler.run()
+    pipeline.fetch_finished()
+    errors = list(scheduler.errors)
+    fetch_timings = scheduler.timings()
+    telemetry.close()
+    api_telemetry = telemetry.summary(fetch_timings)
+
+    if not merchant_client:
+        print("  Skipping Merchant Center (no MERCHANT_CENTER_ID)")
+    if not gsc_client:
+        print("  Skipping Google Search Console (no GSC_SITE_URL)")
+    if incremental:
+        if incremental.full_refresh_reason:
+            print(f"  Incremental: full refetch ({incremental.full_refresh_reason})")
+        else:
+            print(f"  Incremental: {len(incremental.carried_over)} raw files carried over from "
+                  f"{incremental.base_snapshot_id}, {len(incremental.refresh)} tracked fetchers refreshed, "
+                  f"{len(incremental.carry_expired)} carried files too old and refetched")
+    print(f"  Wall time {fetch_timings['wall_seconds']:.1f}s "
+          f"(serial {fetch_timings['serial_seconds']:.1f}s, "
+          f"critical path: {' -> '.join(fetch_timings['critical_path'])})")
+    totals = api_telemetry["totals"]
+    print(f"  API: {totals['calls']} calls, {totals['pages']} pages, "
+          f"{totals['bytes'] / 1e6:.1f} MB, {totals['rows']} rows, {totals['retries']} retries")
+    for key, q in list(api_telemetry["queries"].items())[:3]:
+        print(f"    slowest: {key} ({q['fetcher']}) {q['seconds']:.1f}s, "
+              f"{q['pages']} pages, {q['rows']} rows")
+    quota = None
+    if governor is not None:
+        # Only this account's keys: the governor may be shared by a multi-account run
+        quota = governor.summary({customer_id.replace("-", ""), merchant_id, gsc_site_url})
+        for api, used in quota["apis"].items():
+            print(f"  Quota {api}: {used['requests']} requests, {used['throttled']} throttled, "
+                  f"{used['wait_seconds']:.1f}s paced")
+    print()
 
-        print()
-    else:
-        print("Skipping Google Search Console (no GSC_SITE_URL)")
-        print()
+    raw_campaigns = raw["campaigns"]
+    raw_ad_groups = raw["ad_groups"]
+    raw_keywords = raw["keywords"]
+    raw_campaign_negatives = raw["campaign_negatives"]
+    raw_adgroup_negatives = raw["adgroup_negatives"]
+    raw_ads = raw["ads"]
+    raw_assets = raw["assets"]
+    raw_asset_links = raw["asset_links"]
+    raw_change_history = raw["change_history"]
+    raw_performance = raw["performance"]
+
+    raw_pmax_campaigns = raw["pmax_campaigns"]
+    raw_asset_groups = raw["asset_groups"]
+    raw_asset_group_assets = raw["asset_group_assets"]
+    raw_listing_groups = raw["listing_groups"]
+    raw_pmax_campaign_assets = raw["pmax_campaign_assets"]
+    raw_url_expansion = raw["url_expansion"]
+    raw_brand_lists = raw["brand_lists"]
+    raw_pmax_brand_exclusions = raw["pmax_brand_exclusions"]
+
+    raw_merchant_products = raw.get("merchant_products", empty_raw())
+    raw_merchant_product_statuses = raw.get("merchant_product_statuses", empty_raw())
+    raw_merchant_account_issues = raw.get("merchant_account_issues", empty_raw())
+
+    raw_gsc_sites = raw.get("gsc_sites", empty_raw())
+    raw_gsc_search_analytics = raw.get("gsc_search_analytics", empty_raw())
 
     # ==========================================================================
     # WRITE RAW FILES
     # ==========================================================================
     print("Writing raw files...")
 
-    write_json(raw_ads_dir / "campaigns.json", raw_campaigns)
-    write_json(raw_ads_dir / "ad_groups.json", raw_ad_groups)
-    write_json(raw_ads_dir / "keywords.json", raw_keywords)
-    write_json(raw_ads_dir / "campaign_negatives.json", raw_campaign_negatives)
-    write_json(raw_ads_dir / "adgroup_negatives.json", raw_adgroup_negatives)
-    write_json(raw_ads_dir / "ads.json", raw_ads)
-    write_json(raw_ads_dir / "assets.json", raw_assets)
-    write_json(raw_ads_dir / "asset_links.json", raw_asset_links)
-    write_json(raw_ads_dir / "change_history.json", raw_change_history)
-    write_json(raw_ads_dir / "performance.json", raw_performance)
-
-    write_json(raw_pmax_dir / "campaigns.json", raw_pmax_campaigns)
-    write_json(raw_pmax_dir / "asset_groups.json", raw_asset_groups)
-    write_json(raw_pmax_dir / "asset_group_assets.json", raw_asset_group_assets)
-    write_json(raw_pmax_dir / "listing_groups.json", raw_listing_groups)
-    write_json(raw_pmax_dir / "campaign_assets.json", raw_pmax_campaign_assets)
-    write_json(raw_pmax_dir / "url_expansion.json", raw_url_expansion)
-    write_json(raw_pmax_dir / "brand_lists.json", raw_brand_lists)
-    write_json(raw_pmax_dir / "brand_exclusions.json", raw_pmax_brand_exclusions)
-
-    # Write merchant files (if data available)
-    if merchant_client and raw_merchant_products.get("count", 0) > 0:
-        write_json(raw_merchant_dir / "products.json", raw_merchant_products)
-        write_json(raw_merchant_dir / "product_statuses.json", raw_merchant_product_statuses)
-        write_json(raw_merchant_dir / "account_issues.json", raw_merchant_account_issues)
-
-    # Write GSC files (always write, even if empty, to maintain structure)
-    if gsc_client:
-        write_json(raw_gsc_dir / "sites.json", raw_gsc_sites)
-        write_json(raw_gsc_dir / "search_analytics.json", raw_gsc_search_analytics)
+    has_merchant_data = bool(merchant_client) and raw_merchant_products.get("count", 0) > 0
+    written_raw_files = []
+    for name, rel_path in RAW_FILE_PATHS.items():
+        # Merchant files only if data available; GSC files always (even if empty) when configured
+        if name.startswith("merchant_") and not has_merchant_data:
+            if name in committed or name in from_checkpoint:
+                (snapshot_dir / rel_path).unlink(missing_ok=True)
+            continue
+        if name.startswith("gsc_") and not gsc_client:
+            continue
+        if name not in committed:
+            # Failed fetchers get their empty default; resumed files are
+            # rewritten so the blob map covers them
+            write_json(snapshot_dir / rel_path, raw[name])
+        written_raw_files.append(name)
 
     print(f"  Written to {raw_ads_dir}")
     print(f"  Written to {raw_pmax_dir}")
@@ -2262,98 +2407,13 @@ def main():
     # ==========================================================================
     print("Normalizing data...")
 
-    validation_errors = []  # Track validation issues
-
-    norm_campaigns = normalize_campaigns(raw_campaigns)
-    norm_ad_groups = normalize_ad_groups(raw_ad_groups)
-    norm_keywords = normalize_keywords(raw_keywords, raw_ad_groups, validation_errors)
-    norm_negatives = normalize_negatives(raw_campaign_negatives, raw_adgroup_negatives)
-    norm_ads = normalize_ads(raw_ads, raw_ad_groups)
-    norm_assets = normalize_assets(raw_assets, raw_asset_links)
-    norm_change_history = normalize_change_history(raw_change_history)
-    norm_performance = normalize_performance(raw_performance)
-
-    norm_pmax_campaigns = normalize_pmax_campaigns(raw_pmax_campaigns)
-    norm_asset_groups = normalize_asset_groups(raw_asset_groups, raw_asset_group_assets)
-    norm_listing_groups = normalize_listing_groups(raw_listing_groups)
-    norm_brand_exclusions = normalize_brand_exclusions(raw_brand_lists, raw_pmax_brand_exclusions)
-
-    # Normalize Merchant Center data
-    norm_merchant_products = {"extracted_at": None, "count": 0, "records": []}
-    norm_merchant_product_status = {"extracted_at": None, "count": 0, "records": []}
-
-    if merchant_client and raw_merchant_products.get("count", 0) > 0:
-        norm_merchant_products = normalize_merchant_products(
-            raw_merchant_products, raw_merchant_product_statuses, validation_errors
-        )
-        norm_merchant_product_status = normalize_merchant_product_status(raw_merchant_product_statuses)
-
-    # Normalize Google Search Console data
-    norm_gsc_analytics = {
-        "extracted_at": None,
-        "site_url": None,
-        "date_range": {},
-        "queries": {"count": 0, "records": []},
-        "pages": {"count": 0, "records": []},
-        "summary": {"total_clicks": 0, "total_impressions": 0, "avg_ctr": 0, "avg_position": 0},
-    }
-
-    if gsc_client and raw_gsc_search_analytics.get("count", 0) > 0:
-        norm_gsc_analytics = normalize_gsc_search_analytics(raw_gsc_search_analytics)
-
-    print("  Done")
-    print()
-
-    # ==========================================================================
-    # WRITE NORMALIZED FILES
-    # ==========================================================================
-    print("Writing normalized files...")
-
-    write_json(norm_ads_dir / "campaigns.json", norm_campaigns)
-    write_json(norm_ads_dir / "ad_groups.json", norm_ad_groups)
-    write_json(norm_ads_dir / "keywords.json", norm_keywords)
-    write_json(norm_ads_dir / "negatives.json", norm_negatives)
-    write_json(norm_ads_dir / "ads.json", norm_ads)
-    write_json(norm_ads_dir / "assets.json", norm_assets)
-    write_json(norm_ads_dir / "change_history.json", norm_change_history)
-    write_json(norm_ads_dir / "performance.json", norm_performance)
-
-    write_json(norm_pmax_dir / "campaigns.json", norm_pmax_campaigns)
-    write_json(norm_pmax_dir / "asset_groups.json", norm_asset_groups)
-    write_json(norm_pmax_dir / "listing_groups.json", norm_listing_groups)
-
-    # Combine pmax assets into normalized (they share raw assets)
-    norm_pmax_assets = {
-        "extracted_at": raw_asset_group_assets.get("extracted_at"),
-        "count": raw_asset_group_assets.get("count", 0),
-        "records": [
-            {
-                "asset_group_id": extract_id(r.get("assetGroup", "")),
-                "asset_id": extract_id(r.get("asset", "")),
-                "field_type": r.get("fieldType"),
-                "status": r.get("status"),
-            }
-            for r in raw_asset_group_assets.get("records", [])
-        ],
-    }
-    write_json(norm_pmax_dir / "assets.json", norm_pmax_assets)
-    write_json(norm_pmax_dir / "brand_exclusions.json", norm_brand_exclusions)
-
-    # Write normalized merchant files (if data available)
-    if merchant_client and norm_merchant_products.get("count", 0) > 0:
-        write_json(norm_merchant_dir / "products.json", norm_merchant_products)
-        write_json(norm_merchant_dir / "product_status.json", norm_merchant_product_status)
-
-    # Write normalized GSC files (always write, even if empty)
-    if gsc_client:
-        write_json(norm_gsc_dir / "queries.json", norm_gsc_analytics["queries"])
-        write_json(norm_gsc_dir / "pages.json", norm_gsc_analytics["pages"])
-        write_json(norm_gsc_dir / "summary.json", {
-            "extracted_at": norm_gsc_analytics["extracted_at"],
-            "site_url": norm_gsc_analytics["site_url"],
-            "date_range": norm_gsc_analytics["date_range"],
-            "summary": norm_gsc_analytics["summary"],
-        })
+    # Jobs started during the fetch as their raw inputs arrived, and wrote
+    # their normalized files as they finished; wait for the rest
+    normalized, validation_errors = pipeline.finish()
+    normalized_summary = pipeline.summary
+    normalize_timings = pipeline.manifest_section()
+    print(f"  {len(normalize_timings['jobs'])} jobs, {normalize_timings['finished_during_fetch']} "
+          f"finished while fetching")
 
     print(f"  Written to {norm_ads_dir}")
     print(f"  Written to {norm_pmax_dir}")
@@ -2367,11 +2427,7 @@ def main():
     # BUILD INDEX
     # ==========================================================================
     print("Building index...")
-    index = build_index(
-        norm_campaigns, norm_ad_groups, norm_keywords, norm_negatives, norm_pmax_campaigns,
-        merchant_products_norm=norm_merchant_products if norm_merchant_products.get("count", 0) > 0 else None
-    )
-    write_json(snapshot_dir / "_index.json", index)
+    write_index(snapshot_dir, build_index_from(normalized))
     print("  Done")
     print()
 
@@ -2381,15 +2437,11 @@ def main():
     extraction_finished_utc = datetime.utcnow().isoformat() + "Z"
     duration = time.time() - start_time
 
-    # Calculate file counts based on what was written
-    raw_file_count = 18  # Ads + PMax base (including brand_lists + brand_exclusions)
-    norm_file_count = 13  # Ads + PMax base (including brand_exclusions)
-    if merchant_client and raw_merchant_products.get("count", 0) > 0:
-        raw_file_count += 3  # products, product_statuses, account_issues
-        norm_file_count += 2  # products, product_status
-    if gsc_client:
-        raw_file_count += 2  # sites, search_analytics
-        norm_file_count += 3  # queries, pages, summary
+    # File counts from what was actually written
+    raw_file_count = len(written_raw_files)
+    norm_file_count = len(normalized)
+
+    normalized_counts, normalized_validation = normalized_manifest_counts(normalized_summary)
 
     manifest = {
         "snapshot_id": timestamp,
@@ -2441,43 +2493,49 @@ def main():
                 "gsc_sites": raw_gsc_sites.get("count", 0),
                 "gsc_search_analytics": raw_gsc_search_analytics.get("count", 0),
             },
-            "normalized": {
-                "campaigns": norm_campaigns.get("count", 0),
-                "pmax_campaigns": norm_pmax_campaigns.get("count", 0),
-                "ad_groups": norm_ad_groups.get("count", 0),
-                "keywords": norm_keywords.get("count", 0),
-                "negatives": norm_negatives.get("count", 0),
-                "ads": norm_ads.get("count", 0),
-                "assets": norm_assets.get("count", 0),
-                "asset_groups": norm_asset_groups.get("count", 0),
-                "listing_groups": norm_listing_groups.get("count", 0),
-                "brand_exclusions": norm_brand_exclusions.get("pmax_negative_criteria_count", 0),
-                "brand_lists": norm_brand_exclusions.get("brand_lists_count", 0),
-                "change_events": norm_change_history.get("count", 0),
-                "merchant_products": norm_merchant_products.get("count", 0),
-                "merchant_disapproved": norm_merchant_products.get("disapproved_count", 0),
-                "gsc_queries": norm_gsc_analytics["queries"].get("count", 0),
-                "gsc_pages": norm_gsc_analytics["pages"].get("count", 0),
-            },
+            "normalized": normalized_counts,
         },
         "validation": {
-            "keywords_null_campaign_ids": norm_keywords.get("null_campaign_ids", 0),
-            "merchant_missing_status": norm_merchant_products.get("missing_status_count", 0),
+            **normalized_validation,
             "total_validation_errors": len(validation_errors),
         },
         "errors": errors,
+        "fetch_timings": fetch_timings,
+        "normalize_timings": normalize_timings,
+        "telemetry": api_telemetry,
+        "encoding": snapshot_codec.manifest_section(SNAPSHOT_ENCODING),
+        "field_profile": field_registry.manifest_section(options["profile"]),
     }
 
-    write_json(snapshot_dir / "_manifest.json", manifest)
+    if quota is not None:
+        manifest["quota"] = quota
+
+    if incremental:
+        manifest["incremental"] = incremental.manifest_section(written_raw_files)
+
+    if resume:
+        manifest["resumed"] = checkpoint.manifest_section(from_checkpoint)
+
+    gsc_partitions = gsc_extract.manifest_section(raw_gsc_search_analytics) if gsc_client else None
+    if gsc_partitions:
+        manifest["gsc_partitions"] = gsc_partitions
+
+    if BLOB_STORE is not None:
+        manifest["blobs"] = BLOB_STORE.manifest_section(snapshot_dir, PROJECT_ROOT)
+
+    # The manifest lists the blobs, so it is never deduplicated, and stays
+    # plain JSON so any tool can read it without the snapshot codec
+    write_json(snapshot_dir / "_manifest.json", manifest, dedup=False, encoding="json")
 
     # ==========================================================================
     # WRITE ERRORS.JSONL (if any validation errors)
     # ==========================================================================
-    if validation_errors:
-        errors_file = snapshot_dir / "errors.jsonl"
-        with open(errors_file, "w", encoding="utf-8") as f:
-            for err in validation_errors:
-                f.write(json.dumps(err) + "\n")
+    write_errors_jsonl(snapshot_dir, validation_errors)
+
+    # A snapshot with fetch errors (or incomplete GSC partitions) keeps its
+    # checkpoint so --resume can retry them. The record files live in the
+    # checkpoint folder, so this comes after everything read from them.
+    checkpoint.close(keep=bool(errors) or bool(gsc_partitions and gsc_partitions["incomplete"]))
 
     # ==========================================================================
     # SUMMARY
@@ -2498,8 +2556,8 @@ def main():
 
     # Validation summary
     print("Validation:")
-    null_campaign_count = norm_keywords.get("null_campaign_ids", 0)
-    total_keywords = norm_keywords.get("count", 0)
+    null_campaign_count = normalized_validation["keywords_null_campaign_ids"]
+    total_keywords = normalized_counts["keywords"]
     if null_campaign_count > 0:
         print(f"  ⚠ Keywords with null campaign_id: {null_campaign_count}/{total_keywords}")
     else:
@@ -2507,8 +2565,8 @@ def main():
 
     # Merchant validation
     if merchant_client:
-        merchant_count = norm_merchant_products.get("count", 0)
-        disapproved_count = norm_merchant_products.get("disapproved_count", 0)
+        merchant_count = normalized_counts["merchant_products"]
+        disapproved_count = normalized_counts["merchant_disapproved"]
         if merchant_count > 0:
             if disapproved_count > 0:
                 print(f"  ⚠ Merchant products disapproved: {disapproved_count}/{merchant_count}")
@@ -2529,7 +2587,7 @@ def main():
     print()
     print("Files written:")
     print(f"  {snapshot_dir}/_manifest.json")
-    print(f"  {snapshot_dir}/_index.json")
+    print(f"  {snapshot_dir}/{entity_index.INDEX_FILE}")
     if validation_errors:
         print(f"  {snapshot_dir}/errors.jsonl")
     print(f"  {snapshot_dir}/raw/ads/ (10 files)")
@@ -2538,9 +2596,319 @@ def main():
         print(f"  {snapshot_dir}/raw/merchant/ (3 files)")
     print(f"  {snapshot_dir}/normalized/ads/ (8 files)")
     print(f"  {snapshot_dir}/normalized/pmax/ (5 files)")
-    if merchant_client and norm_merchant_products.get("count", 0) > 0:
+    if merchant_client and normalized_counts["merchant_products"] > 0:
         print(f"  {snapshot_dir}/normalized/merchant/ (2 files)")
 
+    return {
+        "customer_id": customer_id.replace("-", ""),
+        "snapshot_id": timestamp,
+        "snapshot_dir": snapshot_dir,
+        "duration_seconds": manifest["duration_seconds"],
+        "errors": errors,
+        "record_counts": normalized_counts,
+        "telemetry_totals": api_telemetry["totals"],
+    }
+
+
+def dump_accounts(accounts: list, options: dict, transport, access_token, account_workers: int,
+                  governor: RateGovernor = None) -> Path:
+    """Dump several accounts concurrently and write the combined run manifest.
+
+    Each account gets a regular snapshot under snapshots/customers/{id}/;
+    see core/dump/multi_account.py.
+    """
+    run_started = time.perf_counter()
+    run_started_utc = datetime.utcnow().isoformat() + "Z"
+    run_id = datetime.utcnow().strftime("%Y-%m-%dT%H%M%SZ")
+
+    # One telemetry per account; a retry on the shared transport is counted by
+    # whichever account's call is active on the retrying thread
+    telemetries = {a["customer_id"]: Telemetry() for a in accounts}
+    transport.on_retry = lambda *args: [t.note_retry(*args) for t in telemetries.values()]
+
+    def run(account):
+        customer_id = account["customer_id"]
+        return dump_account(account, options, transport, access_token, telemetries[customer_id],
+                            snapshots_dir=SNAPSHOTS_DIR / "customers" / customer_id, governor=governor)
+
+    results = multi_account.run_accounts(accounts, run, account_workers)
+    wall_seconds = time.perf_counter() - run_started
+
+    run_manifest = multi_account.build_run_manifest(
+        run_id, accounts, results, run_started_utc, wall_seconds,
+        settings={
+            "account_workers": account_workers,
+            "fetch_workers": options["workers"],
+            "max_in_flight": getattr(transport, "max_in_flight", None),
+            "governor": governor is not None,
+            "incremental": options["incremental"],
+            "encoding": SNAPSHOT_ENCODING,
+            "snapshot_version": SNAPSHOT_VERSION,
+        },
+        snapshots_dir=SNAPSHOTS_DIR,
+        project_root=PROJECT_ROOT,
+    )
+    if governor is not None:
+        run_manifest["quota"] = governor.summary()
+    run_path = SNAPSHOTS_DIR / "runs" / f"{run_id}.json"
+    write_json(run_path, run_manifest, dedup=False, encoding="json")
+
+    print("=" * 60)
+    print("MULTI-ACCOUNT DUMP COMPLETE")
+    print("=" * 60)
+    print()
+    for entry in run_manifest["accounts"]:
+        detail = entry.get("snapshot_dir") or entry.get("error", "")
+        print(f"  {entry['customer_id']}  {entry['status']:<6} {entry['seconds']:7.1f}s  {detail}")
+    print()
+    print(f"Wall time: {run_manifest['wall_seconds']:.1f}s "
+          f"(sum of accounts {run_manifest['serial_seconds']:.1f}s, "
+          f"slowest {run_manifest['slowest_account']})")
+    print(f"Run manifest: {run_path}")
+    return run_path
+
+
+def main():
+    global BLOB_STORE, SNAPSHOT_ENCODING
+
+    print("=" * 60)
+    print(f"STATE DUMP - ADS + MERCHANT + GSC  [v{SNAPSHOT_VERSION}]")
+    print("=" * 60)
+    print()
+
+    # Parse args
+    days = CHANGE_HISTORY_DAYS
+    workers = DEFAULT_MAX_WORKERS
+    incremental_mode = "--incremental" in sys.argv
+    use_perf_store = "--no-perf-store" not in sys.argv
+    use_blob_store = "--no-dedup" not in sys.argv
+    trace_mode = "--trace" in sys.argv
+    use_governor = "--no-governor" not in sys.argv
+    perf_days = PERFORMANCE_DAYS
+    lag_days = DEFAULT_LAG_DAYS
+    record_dir = None
+    replay_dir = None
+    replay_latency = None
+    accounts_spec = None
+    account_workers = None
+    max_in_flight = None
+    resume_dir = None
+    field_profile = field_registry.DEFAULT_PROFILE
+    for i, arg in enumerate(sys.argv):
+        if arg == "--days" and i + 1 < len(sys.argv):
+            days = int(sys.argv[i + 1])
+        if arg == "--workers" and i + 1 < len(sys.argv):
+            workers = int(sys.argv[i + 1])
+        if arg == "--perf-days" and i + 1 < len(sys.argv):
+            perf_days = int(sys.argv[i + 1])
+        if arg == "--lag-days" and i + 1 < len(sys.argv):
+            lag_days = int(sys.argv[i + 1])
+        if arg == "--encoding" and i + 1 < len(sys.argv):
+            SNAPSHOT_ENCODING = sys.argv[i + 1]
+        if arg == "--record" and i + 1 < len(sys.argv):
+            record_dir = Path(sys.argv[i + 1])
+        if arg == "--replay" and i + 1 < len(sys.argv):
+            replay_dir = Path(sys.argv[i + 1])
+        if arg == "--replay-latency" and i + 1 < len(sys.argv):
+            replay_latency = sys.argv[i + 1]
+        if arg == "--accounts" and i + 1 < len(sys.argv):
+            accounts_spec = sys.argv[i + 1]
+        if arg == "--account-workers" and i + 1 < len(sys.argv):
+            account_workers = int(sys.argv[i + 1])
+        if arg == "--max-in-flight" and i + 1 < len(sys.argv):
+            max_in_flight = int(sys.argv[i + 1])
+        if arg == "--resume" and i + 1 < len(sys.argv):
+            resume_dir = Path(sys.argv[i + 1])
+        if arg == "--profile" and i + 1 < len(sys.argv):
+            field_profile = sys.argv[i + 1]
+
+    checkpoint = None
+    if resume_dir:
+        if accounts_spec or record_dir or replay_dir:
+            print("ERROR: --resume cannot be combined with --accounts, --record or --replay")
+            sys.exit(1)
+        if not resume_dir.is_absolute() and not resume_dir.exists():
+            resume_dir = PROJECT_ROOT / resume_dir
+        try:
+            checkpoint = DumpCheckpoint.load(resume_dir)
+        except Exception as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        # The snapshot keeps the settings it was started with; only the
+        # worker count may change between attempts
+        saved = checkpoint.state["options"]
+        days, incremental_mode, trace_mode = saved["days"], saved["incremental"], saved["trace"]
+        use_perf_store, perf_days, lag_days = saved["perf_store"], saved["perf_days"], saved["lag_days"]
+        SNAPSHOT_ENCODING, use_blob_store = saved["encoding"], saved["dedup"]
+        field_profile = saved.get("profile", field_registry.DEFAULT_PROFILE)
+
+    if SNAPSHOT_ENCODING not in snapshot_codec.SNAPSHOT_ENCODINGS:
+        print(f"ERROR: --encoding must be one of: {', '.join(snapshot_codec.SNAPSHOT_ENCODINGS)}")
+        sys.exit(1)
+
+    if field_profile not in field_registry.PROFILES:
+        print(f"ERROR: --profile must be one of: {', '.join(field_registry.PROFILES)}")
+        sys.exit(1)
+
+    if record_dir and replay_dir:
+        print("ERROR: --record and --replay are mutually exclusive")
+        sys.exit(1)
+
+    if accounts_spec and (record_dir or replay_dir):
+        print("ERROR: --accounts cannot be combined with --record or --replay")
+        sys.exit(1)
+
+    if replay_dir:
+        # Offline: account IDs come from the cassette, no credentials needed
+        cassette_meta = Cassette(replay_dir).meta
+        customer_id = cassette_meta.get("customer_id")
+        login_customer_id = cassette_meta.get("login_customer_id")
+        merchant_id = cassette_meta.get("merchant_id")
+        gsc_site_url = cassette_meta.get("gsc_site_url")
+    else:
+        # Load credentials
+        if not load_env():
+            print("ERROR: No .env file found")
+            sys.exit(1)
+
+        customer_id = os.getenv("GOOGLE_ADS_CUSTOMER_ID")
+        login_customer_id = os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID")
+        merchant_id = os.getenv("MERCHANT_CENTER_ID")
+        gsc_site_url = os.getenv("GSC_SITE_URL")
+
+    if checkpoint:
+        account = checkpoint.state["account"]
+        customer_id = account["customer_id"]
+        login_customer_id = account.get("login_customer_id")
+        merchant_id = account.get("merchant_id")
+        gsc_site_url = account.get("gsc_site_url")
+
+    if not customer_id and not accounts_spec:
+        print("ERROR: GOOGLE_ADS_CUSTOMER_ID not set")
+        sys.exit(1)
+
+    options = {
+        "days": days,
+        "workers": workers,
+        "incremental": incremental_mode,
+        "perf_store": use_perf_store,
+        "perf_days": perf_days,
+        "lag_days": lag_days,
+        "trace": trace_mode,
+        "encoding": SNAPSHOT_ENCODING,
+        "dedup": use_blob_store,
+        "profile": field_profile,
+    }
+
+    if accounts_spec:
+        print(f"Accounts: {accounts_spec}")
+        print(f"Account workers: {account_workers or '(all accounts)'}")
+        print(f"Max requests in flight: {max_in_flight or 2 * workers} (shared by all accounts)")
+    else:
+        print(f"Google Ads Customer ID: {customer_id}")
+    print(f"Google Ads Login Customer ID: {login_customer_id or '(none)'}")
+    if not accounts_spec:
+        print(f"Merchant Center ID: {merchant_id or '(none)'}")
+        print(f"GSC Site URL: {gsc_site_url or '(none)'}")
+    print(f"Change history: {days} days")
+    print(f"Fetch workers: {workers}{' per account' if accounts_spec else ''}")
+    print(f"Mode: {'incremental' if incremental_mode else 'full'}")
+    print(f"Performance: {perf_days} days "
+          f"({'store, ' + str(lag_days) + '-day lag window' if use_perf_store else 'full refetch'})")
+    print(f"Blob store: {BLOB_STORE_DIR if use_blob_store else '(disabled)'}")
+    print(f"Encoding: {SNAPSHOT_ENCODING}")
+    print(f"Field profile: {field_profile}")
+    print(f"Rate governor: {'on' if use_governor and not replay_dir else 'off'}")
+    if record_dir:
+        print(f"Recording cassette: {record_dir}")
+    if replay_dir:
+        print(f"Replaying cassette: {replay_dir} (latency: {replay_latency or 'none'})")
+    if checkpoint:
+        print(f"Resuming: {checkpoint.snapshot_dir} ({len(checkpoint.completed)} fetchers committed, "
+              f"started {checkpoint.state['started_utc']})")
+    print()
+
+    # Authenticate
+    print("Authenticating...")
+    governor = None
+    if replay_dir:
+        access_token = "replay"
+        transport = ReplayTransport(
+            Cassette(replay_dir),
+            latency=replay_latency if replay_latency in (None, "recorded") else float(replay_latency),
+        )
+    else:
+        # Shared cached token; refreshed in the background so long dumps never
+        # send an expired one. Clients call the provider for each request.
+        access_token = get_token_provider()
+        access_token.start_background_refresh()
+        # Paces requests per API and per customer; shared by all accounts
+        governor = RateGovernor.from_config() if use_governor else None
+        if accounts_spec:
+            # All accounts share one pool and one cap on requests in flight
+            max_in_flight = max_in_flight or 2 * workers
+            transport = HttpTransport(pool_size=int(os.getenv("DUMP_HTTP_POOL_SIZE") or max_in_flight),
+                                      max_in_flight=max_in_flight, governor=governor)
+        else:
+            # One warm connection pool per API host, sized to the fetch worker count
+            transport = HttpTransport(pool_size=int(os.getenv("DUMP_HTTP_POOL_SIZE") or max(workers, 1)),
+                                      max_in_flight=max_in_flight, governor=governor)
+    telemetry = None
+    if not accounts_spec:
+        telemetry = Telemetry()
+        transport.on_retry = telemetry.note_retry
+    if record_dir:
+        cassette = Cassette(record_dir)
+        cassette.start_recording({
+            "customer_id": customer_id,
+            "login_customer_id": login_customer_id,
+            "merchant_id": merchant_id,
+            "gsc_site_url": gsc_site_url,
+        })
+        transport = RecordingTransport(transport, cassette)
+
+    accounts = None
+    if accounts_spec:
+        manager_client = None
+        if accounts_spec == multi_account.ALL_UNDER_MCC and login_customer_id:
+            manager_client = GoogleAdsClient(login_customer_id, access_token, login_customer_id, transport=transport)
+        try:
+            accounts = multi_account.resolve_accounts(
+                accounts_spec, login_customer_id,
+                primary={"customer_id": customer_id, "merchant_id": merchant_id, "gsc_site_url": gsc_site_url},
+                config=multi_account.load_accounts_config(),
+                manager_client=manager_client,
+            )
+        except Exception as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+    print("OK")
+    print()
+
+    BLOB_STORE = BlobStore(BLOB_STORE_DIR) if use_blob_store else None
+
+    if accounts:
+        print(f"Dumping {len(accounts)} accounts: {', '.join(a['customer_id'] for a in accounts)}")
+        print()
+        try:
+            dump_accounts(accounts, options, transport, access_token, account_workers or len(accounts),
+                          governor=governor)
+        finally:
+            transport.close()
+        return
+
+    account = {
+        "customer_id": customer_id,
+        "login_customer_id": login_customer_id,
+        "merchant_id": merchant_id,
+        "gsc_site_url": gsc_site_url,
+    }
+    try:
+        dump_account(account, options, transport, access_token, telemetry, governor=governor,
+                     resume=checkpoint)
+    finally:
+        transport.close()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Phase A: GAQL Field Registry
+
+Declares the SELECT fields of every Google Ads query the dump runs, and tags
+each field with the consumers that read it:
+
+    key        Row identity and parent links (ids, resource references)
+    fetch      Copied by the fetcher into a reshaped raw record
+    normalize  Read by a normalize_* function in dump_state.py
+    report     Reaches the report (core/report/) through a normalized file
+    plan       Reaches the planner rules (core/plan/) through a normalized file
+
+A field with no tags is kept in the raw files for the audit trail only.
+
+Profiles (bin/dump --profile):
+    full   Every declared field (default; raw files as before)
+    lean   Only fields with at least one consumer, which shrinks responses
+           and parse time. Normalized files are unchanged; raw files lack
+           the audit-only fields, which the manifest lists under
+           field_profile.dropped_fields.
+
+Usage (from the fetchers):
+    query = f'''
+        SELECT
+            {client.select_fields("campaigns")}
+        FROM campaign
+    '''
+"""
+
+CONSUMERS = ("key", "fetch", "normalize", "report", "plan")
+
+PROFILES = ("full", "lean")
+DEFAULT_PROFILE = "full"
+
+# query name -> [(field, consumers)], in SELECT order
+QUERY_FIELDS = {
+    "campaigns": [
+        ("campaign.resource_name", ()),
+        ("campaign.id", ("key", "normalize", "report", "plan")),
+        ("campaign.name", ("normalize", "report", "plan")),
+        ("campaign.status", ("normalize", "report", "plan")),
+        ("campaign.advertising_channel_type", ("normalize", "report")),
+        ("campaign.advertising_channel_sub_type", ()),
+        ("campaign.bidding_strategy_type", ("normalize", "report", "plan")),
+        ("campaign.bidding_strategy", ()),
+        ("campaign.target_roas.target_roas", ("normalize", "report")),
+        ("campaign.target_cpa.target_cpa_micros", ("normalize", "report")),
+        ("campaign.maximize_conversions.target_cpa_micros", ("normalize", "report")),
+        ("campaign.maximize_conversion_value.target_roas", ("normalize", "report")),
+        ("campaign.campaign_budget", ()),
+        ("campaign.start_date", ("normalize",)),
+        ("campaign.end_date", ("normalize",)),
+        ("campaign.labels", ("normalize",)),
+        ("campaign.network_settings.target_google_search", ()),
+        ("campaign.network_settings.target_search_network", ()),
+        ("campaign.network_settings.target_content_network", ()),
+        ("campaign.geo_target_type_setting.positive_geo_target_type", ()),
+        ("campaign.geo_target_type_setting.negative_geo_target_type", ()),
+        ("campaign.shopping_setting.merchant_id", ()),
+        ("campaign.shopping_setting.feed_label", ()),
+        ("campaign.url_expansion_opt_out", ()),
+        ("campaign_budget.id", ("normalize",)),
+        ("campaign_budget.amount_micros", ("normalize", "report")),
+        ("campaign_budget.delivery_method", ("normalize",)),
+    ],
+    "ad_groups": [
+        ("ad_group.resource_name", ()),
+        ("ad_group.id", ("key", "normalize")),
+        ("ad_group.name", ("normalize",)),
+        ("ad_group.campaign", ("key", "normalize")),
+        ("ad_group.status", ("normalize",)),
+        ("ad_group.type", ("normalize",)),
+        ("ad_group.cpc_bid_micros", ("normalize",)),
+        ("ad_group.target_cpa_micros", ()),
+        ("ad_group.target_roas", ()),
+        ("ad_group.labels", ("normalize",)),
+    ],
+    "keywords": [
+        ("ad_group_criterion.resource_name", ()),
+        ("ad_group_criterion.criterion_id", ("key", "normalize", "report", "plan")),
+        ("ad_group_criterion.ad_group", ("key", "normalize", "plan")),
+        ("ad_group_criterion.keyword.text", ("normalize", "report", "plan")),
+        ("ad_group_criterion.keyword.match_type", ("normalize", "report", "plan")),
+        ("ad_group_criterion.status", ("normalize", "report", "plan")),
+        ("ad_group_criterion.cpc_bid_micros", ("normalize",)),
+        ("ad_group_criterion.quality_info.quality_score", ("normalize",)),
+        ("ad_group_criterion.quality_info.creative_quality_score", ("normalize",)),
+        ("ad_group_criterion.quality_info.post_click_quality_score", ("normalize",)),
+        ("ad_group_criterion.quality_info.search_predicted_ctr", ("normalize",)),
+        ("ad_group_criterion.labels", ()),
+    ],
+    "campaign_negatives": [
+        ("campaign_criterion.resource_name", ()),
+        ("campaign_criterion.criterion_id", ("key", "normalize")),
+        ("campaign_criterion.campaign", ("key", "normalize", "report")),
+        ("campaign_criterion.keyword.text", ("normalize", "report", "plan")),
+        ("campaign_criterion.keyword.match_type", ("normalize", "plan")),
+        ("campaign_criterion.negative", ()),
+    ],
+    "adgroup_negatives": [
+        ("ad_group_criterion.resource_name", ()),
+        ("ad_group_criterion.criterion_id", ("key", "normalize")),
+        ("ad_group_criterion.ad_group", ("key", "normalize")),
+        ("ad_group_criterion.keyword.text", ("normalize", "plan")),
+        ("ad_group_criterion.keyword.match_type", ("normalize", "plan")),
+        ("ad_group_criterion.negative", ()),
+    ],
+    "ads": [
+        ("ad_group_ad.resource_name", ()),
+        ("ad_group_ad.ad.id", ("key", "normalize")),
+        ("ad_group_ad.ad_group", ("key", "normalize")),
+        ("ad_group_ad.ad.type", ("normalize",)),
+        ("ad_group_ad.status", ("normalize",)),
+        ("ad_group_ad.ad.final_urls", ("normalize",)),
+        ("ad_group_ad.ad.responsive_search_ad.headlines", ("normalize",)),
+        ("ad_group_ad.ad.responsive_search_ad.descriptions", ("normalize",)),
+        ("ad_group_ad.policy_summary.approval_status", ("normalize",)),
+        ("ad_group_ad.policy_summary.review_status", ()),
+    ],
+    "assets": [
+        ("asset.resource_name", ()),
+        ("asset.id", ("key", "normalize", "plan")),
+        ("asset.type", ("normalize", "plan")),
+        ("asset.name", ("normalize",)),
+        ("asset.sitelink_asset.link_text", ("normalize", "plan")),
+        ("asset.sitelink_asset.description1", ("normalize", "plan")),
+        ("asset.sitelink_asset.description2", ()),
+        ("asset.callout_asset.callout_text", ("normalize", "plan")),
+        ("asset.structured_snippet_asset.header", ("normalize", "plan")),
+        ("asset.structured_snippet_asset.values", ("normalize", "plan")),
+        ("asset.call_asset.phone_number", ("normalize",)),
+        ("asset.policy_summary.approval_status", ("normalize", "plan")),
+    ],
+    "campaign_asset_links": [
+        ("campaign_asset.resource_name", ()),
+        ("campaign_asset.asset", ("key", "normalize")),
+        ("campaign_asset.campaign", ("key", "normalize", "plan")),
+        ("campaign_asset.field_type", ()),
+        ("campaign_asset.status", ()),
+    ],
+    "ad_group_asset_links": [
+        ("ad_group_asset.resource_name", ()),
+        ("ad_group_asset.asset", ("key", "normalize")),
+        ("ad_group_asset.ad_group", ("key", "normalize")),
+        ("ad_group_asset.field_type", ()),
+        ("ad_group_asset.status", ()),
+    ],
+    "change_history": [
+        ("change_event.change_date_time", ("key", "normalize", "report")),
+        ("change_event.change_resource_type", ("normalize", "report")),
+        ("change_event.change_resource_name", ("key", "normalize", "report")),
+        ("change_event.resource_change_operation", ("normalize",)),
+        ("change_event.changed_fields", ("normalize",)),
+        ("change_event.old_resource", ("normalize",)),
+        ("change_event.new_resource", ("normalize",)),
+        ("change_event.user_email", ("normalize",)),
+        ("change_event.client_type", ("normalize",)),
+    ],
+    # Every metric is carried into normalized/ads/performance.json (and the
+    # performance store), so both profiles fetch the same columns
+    "performance_by_campaign": [
+        ("segments.date", ("key", "fetch", "normalize", "report")),
+        ("campaign.id", ("key", "fetch", "normalize", "report")),
+        ("campaign.name", ("fetch", "normalize")),
+        ("metrics.impressions", ("normalize", "report")),
+        ("metrics.clicks", ("normalize", "report")),
+        ("metrics.cost_micros", ("normalize", "report")),
+        ("metrics.conversions", ("normalize", "report")),
+        ("metrics.conversions_value", ("normalize", "report")),
+        ("metrics.all_conversions", ("normalize",)),
+        ("metrics.all_conversions_value", ("normalize",)),
+    ],
+    "performance_by_ad_group": [
+        ("segments.date", ("key", "fetch", "normalize")),
+        ("campaign.id", ("key", "fetch", "normalize")),
+        ("ad_group.id", ("key", "fetch", "normalize")),
+        ("ad_group.name", ("fetch", "normalize")),
+        ("metrics.impressions", ("normalize",)),
+        ("metrics.clicks", ("normalize",)),
+        ("metrics.cost_micros", ("normalize",)),
+        ("metrics.conversions", ("normalize",)),
+        ("metrics.conversions_value", ("normalize",)),
+    ],
+    "pmax_campaigns": [
+        ("campaign.resource_name", ()),
+        ("campaign.id", ("key", "normalize", "report", "plan")),
+        ("campaign.name", ("normalize", "report", "plan")),
+        ("campaign.status", ("normalize", "report", "plan")),
+        ("campaign.bidding_strategy_type", ("normalize", "report", "plan")),
+        ("campaign.target_roas.target_roas", ("normalize",)),
+        ("campaign.maximize_conversion_value.target_roas", ("normalize",)),
+        ("campaign.campaign_budget", ()),
+        ("campaign.shopping_setting.merchant_id", ("normalize", "report", "plan")),
+        ("campaign.shopping_setting.feed_label", ()),
+        ("campaign.url_expansion_opt_out", ("normalize",)),
+        ("campaign_budget.amount_micros", ("normalize", "report")),
+    ],
+    "asset_groups": [
+        ("asset_group.resource_name", ()),
+        ("asset_group.id", ("key", "normalize")),
+        ("asset_group.campaign", ("key", "normalize")),
+        ("asset_group.name", ("normalize",)),
+        ("asset_group.status", ("normalize",)),
+        ("asset_group.final_urls", ("normalize",)),
+        ("asset_group.final_mobile_urls", ()),
+        ("asset_group.path1", ()),
+        ("asset_group.path2", ()),
+        ("asset_group.ad_strength", ("normalize",)),
+    ],
+    "asset_group_assets": [
+        ("asset_group_asset.resource_name", ()),
+        ("asset_group_asset.asset_group", ("key", "normalize")),
+        ("asset_group_asset.asset", ("key", "normalize")),
+        ("asset_group_asset.field_type", ("normalize",)),
+        ("asset_group_asset.status", ("normalize",)),
+    ],
+    "listing_groups": [
+        ("asset_group_listing_group_filter.resource_name", ()),
+        ("asset_group_listing_group_filter.asset_group", ("key", "normalize", "report")),
+        ("asset_group_listing_group_filter.id", ("key", "normalize")),
+        ("asset_group_listing_group_filter.type", ("normalize", "report")),
+        ("asset_group_listing_group_filter.case_value.product_brand.value", ("normalize", "report")),
+        ("asset_group_listing_group_filter.case_value.product_category.category_id", ("normalize",)),
+        ("asset_group_listing_group_filter.case_value.product_custom_attribute.value", ("normalize",)),
+        ("asset_group_listing_group_filter.case_value.product_type.value", ("normalize", "report")),
+        ("asset_group_listing_group_filter.parent_listing_group_filter", ("key", "normalize")),
+    ],
+    # No normalized file reads raw/pmax/campaign_assets.json
+    "pmax_campaign_assets": [
+        ("campaign_asset.resource_name", ()),
+        ("campaign_asset.asset", ("key",)),
+        ("campaign_asset.campaign", ("key",)),
+        ("campaign_asset.field_type", ()),
+        ("campaign_asset.status", ()),
+        ("campaign.advertising_channel_type", ()),
+    ],
+    "url_expansion": [
+        ("campaign.resource_name", ()),
+        ("campaign.id", ("key", "fetch")),
+        ("campaign.name", ("fetch",)),
+        ("campaign.url_expansion_opt_out", ("fetch",)),
+    ],
+    "brand_lists": [
+        ("shared_set.resource_name", ()),
+        ("shared_set.id", ("key", "normalize")),
+        ("shared_set.name", ("normalize",)),
+        ("shared_set.type", ("normalize",)),
+        ("shared_set.status", ("normalize",)),
+        ("shared_set.member_count", ("normalize",)),
+    ],
+    "pmax_brand_exclusions": [
+        ("campaign_criterion.resource_name", ("fetch",)),
+        ("campaign_criterion.campaign", ()),
+        ("campaign_criterion.criterion_id", ("key", "fetch", "normalize")),
+        ("campaign_criterion.negative", ("fetch", "normalize")),
+        ("campaign_criterion.type", ("fetch", "normalize")),
+        ("campaign.id", ("key", "fetch", "normalize", "plan")),
+        ("campaign.name", ("fetch", "normalize")),
+        ("campaign.advertising_channel_type", ()),
+    ],
+}
+
+
+def select_fields(query: str, profile: str = DEFAULT_PROFILE) -> list:
+    """Fields to SELECT for a registered query under a profile."""
+    if profile not in PROFILES:
+        raise Exception(f"Field profile must be one of: {', '.join(PROFILES)}")
+    fields = QUERY_FIELDS[query]
+    if profile == "lean":
+        return [field for field, consumers in fields if consumers]
+    return [field for field, _ in fields]
+
+
+def select_clause(query: str, profile: str = DEFAULT_PROFILE) -> str:
+    """SELECT list laid out like the queries in dump_state.py (one field per line)."""
+    return ",\n            ".join(select_fields(query, profile))
+
+
+def fields_for(consumer: str) -> dict:
+    """{query: [fields]} read by one consumer (e.g. everything the report depends on)."""
+    if consumer not in CONSUMERS:
+        raise Exception(f"Unknown consumer: {consumer} (expected one of: {', '.join(CONSUMERS)})")
+    return {
+        query: [field for field, consumers in fields if consumer in consumers]
+        for query, fields in QUERY_FIELDS.items()
+    }
+
+
+def manifest_section(profile: str) -> dict:
+    """Profile used and the fields it left out, for _manifest.json."""
+    selected = {query: set(select_fields(query, profile)) for query in QUERY_FIELDS}
+    dropped = {
+        query: [field for field, _ in fields if field not in selected[query]]
+        for query, fields in QUERY_FIELDS.items()
+    }
+    return {
+        "profile": profile,
+        "dropped_fields": {query: fields for query, fields in dropped.items() if fields},
+    }
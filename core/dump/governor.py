@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Phase A: Rate Governor for Dump API Requests
+
+Concurrent and multi-account dumps can exceed per-minute quotas and get
+429 / RESOURCE_EXHAUSTED responses. The governor sits in HttpTransport and
+paces every request attempt before it is sent:
+
+- Token buckets per API (developer token / project level) and per
+  (API, customer) cap the request rate, allowing short bursts.
+- An adaptive concurrency limit per (API, customer) halves on a throttled
+  response and grows by one after a full window of successes (AIMD), so
+  throughput settles just under the ceiling instead of failing the dump.
+- A server retry delay (Google Ads quotaErrorDetails.retryDelay) pauses that
+  customer's bucket, so other threads stop piling on while it cools down.
+
+Throttled responses are retried by the transport; only a response that is
+still throttled after every retry reaches the client as an error.
+
+Requests are keyed from the URL:
+    google_ads       googleads.googleapis.com/.../customers/{customer_id}/...
+    merchant_center  shoppingcontent.googleapis.com/content/{version}/{merchant_id}/...
+    search_console   www.googleapis.com/webmasters/v3/sites/{site_url}/...
+
+Limits (requests per second, burst, concurrency) default to DEFAULT_LIMITS
+and can be overridden in core/configs/rate_limits.json (or the file named by
+DUMP_RATE_LIMITS_CONFIG):
+
+    {
+      "google_ads": {"rate": 10, "burst": 20, "customer_rate": 5, "max_concurrency": 16},
+      "customers": {"1234567890": {"customer_rate": 2}}
+    }
+
+Usage:
+    governor = RateGovernor.from_config()
+    transport = HttpTransport(governor=governor)
+    ...
+    manifest["quota"] = governor.summary()
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+RATE_LIMITS_PATH = PROJECT_ROOT / "core" / "configs" / "rate_limits.json"
+
+DEFAULT_LIMITS = {
+    "google_ads": {"rate": 20.0, "burst": 40, "customer_rate": 10.0, "customer_burst": 20,
+                   "concurrency": 8, "min_concurrency": 1, "max_concurrency": 32},
+    "merchant_center": {"rate": 10.0, "burst": 20, "customer_rate": 10.0, "customer_burst": 20,
+                        "concurrency": 4, "min_concurrency": 1, "max_concurrency": 16},
+    "search_console": {"rate": 10.0, "burst": 20, "customer_rate": 5.0, "customer_burst": 10,
+                       "concurrency": 4, "min_concurrency": 1, "max_concurrency": 16},
+}
+
+# Cool-down applied to a throttled key when the server gives no retry delay
+DEFAULT_THROTTLE_PAUSE_SECONDS = 1.0
+
+QUOTA_ERROR_MARKERS = ("RESOURCE_EXHAUSTED", "rateLimitExceeded", "userRateLimitExceeded", "quotaExceeded")
+RETRY_DELAY_PATTERN = re.compile(r'"retryDelay"\s*:\s*"(\d+(?:\.\d+)?)s"')
+
+ADS_PATTERN = re.compile(r"/customers/(\d+)")
+MERCHANT_PATTERN = re.compile(r"/content/v[\d.]+/(\d+)")
+GSC_PATTERN = re.compile(r"/webmasters/v3/sites/([^/]+)")
+
+
+def request_key(url: str):
+    """(api, customer) for a dump request URL, or None for ungoverned hosts."""
+    parts = urlsplit(url)
+    if parts.netloc == "googleads.googleapis.com":
+        match = ADS_PATTERN.search(parts.path)
+        return ("google_ads", match.group(1) if match else "*")
+    if parts.netloc == "shoppingcontent.googleapis.com":
+        match = MERCHANT_PATTERN.search(parts.path)
+        return ("merchant_center", match.group(1) if match else "*")
+    if parts.netloc == "www.googleapis.com" and "/webmasters/" in parts.path:
+        match = GSC_PATTERN.search(parts.path)
+        return ("search_console", unquote(match.group(1)) if match else "*")
+    return None
+
+
+def quota_error(response) -> tuple:
+    """(is_throttled, server retry delay or None) for a response."""
+    if response.status_code == 429:
+        throttled = True
+    elif response.status_code == 403:
+        # Search Console and Merchant report some quota errors as 403
+        throttled = any(marker in response.text for marker in QUOTA_ERROR_MARKERS)
+    else:
+        return False, None
+    if not throttled:
+        return False, None
+    match = RETRY_DELAY_PATTERN.search(response.text or "")
+    return True, float(match.group(1)) if match else None
+
+
+class TokenBucket:
+    """Classic token bucket; acquire() blocks until a token is available."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float):
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def acquire(self) -> float:
+        """Take one token; returns seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now < self.paused_until:
+                    delay = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class AdaptiveLimit:
+    """Concurrency limit that halves on throttling and grows back on success."""
+
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.limit = min(max(int(initial), self.minimum), self.maximum)
+        self.low = self.high = self.limit
+        self.in_use = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> float:
+        started = time.monotonic()
+        with self._cond:
+            while self.in_use >= self.limit:
+                self._cond.wait()
+            self.in_use += 1
+        return time.monotonic() - started
+
+    def release(self, throttled: bool):
+        with self._cond:
+            self.in_use -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+            self.low = min(self.low, self.limit)
+            self.high = max(self.high, self.limit)
+            self._cond.notify_all()
+
+
+class _Lease:
+    """One governed request attempt; the transport reports its response here."""
+
+    def __init__(self):
+        self.throttled = False
+        self.retry_delay = None
+
+    def observe(self, response):
+        self.throttled, self.retry_delay = quota_error(response)
+
+
+class RateGovernor:
+    """Per-API and per-customer pacing shared by every thread of a dump run."""
+
+    def __init__(self, limits: dict = None, customer_limits: dict = None):
+        self.limits = {api: dict(values) for api, values in DEFAULT_LIMITS.items()}
+        for api, values in (limits or {}).items():
+            self.limits.setdefault(api, dict(DEFAULT_LIMITS["google_ads"])).update(values)
+        self.customer_limits = customer_limits or {}
+        self._api_buckets = {}
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, path: Path = None):
+        """Defaults overlaid with core/configs/rate_limits.json, if present."""
+        path = Path(path or os.getenv("DUMP_RATE_LIMITS_CONFIG") or RATE_LIMITS_PATH)
+        if not path.exists():
+            return cls()
+        with open(path, "r") as f:
+            config = json.load(f)
+        customers = {str(cid).replace("-", ""): values for cid, values in config.pop("customers", {}).items()}
+        return cls(config, customers)
+
+    def _state(self, key: tuple) -> dict:
+        with self._lock:
+            state = self._keys.get(key)
+            if state is None:
+                api, customer = key
+                limits = {**self.limits[api], **self.customer_limits.get(customer, {})}
+                if api not in self._api_buckets:
+                    self._api_buckets[api] = TokenBucket(self.limits[api]["rate"], self.limits[api]["burst"])
+                state = self._keys[key] = {
+                    "api_bucket": self._api_buckets[api],
+                    "bucket": TokenBucket(limits["customer_rate"], limits["customer_burst"]),
+                    "concurrency": AdaptiveLimit(limits["concurrency"], limits["min_concurrency"],
+                                                 limits["max_concurrency"]),
+                    "requests": 0, "throttled": 0, "wait_seconds": 0.0, "server_delays": 0,
+                }
+            return state
+
+    @contextmanager
+    def request(self, url: str):
+        """Hold a governed slot for one request attempt.
+
+        Yields a lease (or None for ungoverned URLs); call lease.observe(response)
+        before leaving the block so throttling adjusts the limits.
+        """
+        key = request_key(url)
+        if key is None:
+            yield None
+            return
+
+        state = self._state(key)
+        waited = state["concurrency"].acquire()
+        lease = _Lease()
+        try:
+            waited += state["api_bucket"].acquire()
+            waited += state["bucket"].acquire()
+            yield lease
+        finally:
+            state["concurrency"].release(lease.throttled)
+            if lease.throttled:
+                state["bucket"].pause(lease.retry_delay or DEFAULT_THROTTLE_PAUSE_SECONDS)
+            with self._lock:
+                state["requests"] += 1
+                state["wait_seconds"] += waited
+                state["throttled"] += 1 if lease.throttled else 0
+                state["server_delays"] += 1 if lease.retry_delay else 0
+
+    def summary(self, customers: set = None) -> dict:
+        """Quota consumed, for _manifest.json (optionally only the given customers)."""
+        apis, keys = {}, {}
+        with self._lock:
+            items = sorted(self._keys.items())
+        for (api, customer), state in items:
+            if customers is not None and customer not in customers:
+                continue
+            limit = state["concurrency"]
+            keys[f"{api}:{customer}"] = {
+                "requests": state["requests"],
+                "throttled": state["throttled"],
+                "server_retry_delays": state["server_delays"],
+                "wait_seconds": round(state["wait_seconds"], 3),
+                "concurrency": {"final": limit.limit, "min": limit.low, "max": limit.high},
+            }
+            totals = apis.setdefault(api, {"requests": 0, "throttled": 0, "wait_seconds": 0.0})
+            totals["requests"] += state["requests"]
+            totals["throttled"] += state["throttled"]
+            totals["wait_seconds"] = round(totals["wait_seconds"] + state["wait_seconds"], 3)
+        return {
+            "limits": {api: self.limits[api] for api in apis},
+            "apis": apis,
+            "keys": keys,
+        }
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Phase A: Partitioned Search Console Extraction
+
+A single Search Analytics request returns at most 25,000 rows, which
+silently truncates 30 days of query x page x device x country x date data.
+The dump instead splits the date range into partitions (one per day, or one
+per day and device) and fetches them concurrently, paging each with startRow
+until the API returns a short page.
+
+Rows are streamed to disk as each page arrives, one JSONL file per partition
+under the snapshot's checkpoint folder:
+
+    snapshots/{TIMESTAMP}/_partial/gsc/{partition}.jsonl.tmp   # being fetched
+    snapshots/{TIMESTAMP}/_partial/gsc/{partition}.jsonl       # complete
+
+so the full dataset is never held in memory, and `bin/dump --resume` skips
+partitions that already completed. raw/gsc/search_analytics.json keeps its
+format ("records" is written by streaming the partition files back) and
+lists every partition with its row count, page count and completeness.
+
+Partitioning is set with DUMP_GSC_PARTITION (date | date_device, default
+date) and concurrency with DUMP_GSC_WORKERS (default 4).
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from core.dump.spool import PartitionSpool, SpooledRecords
+
+GSC_ROW_LIMIT = 25000  # API maximum per request
+GSC_DIMENSIONS = ["query", "page", "device", "country", "date"]
+GSC_DEVICES = ("DESKTOP", "MOBILE", "TABLET")
+
+PARTITION_MODES = ("date", "date_device")
+DEFAULT_PARTITION = "date"
+DEFAULT_GSC_WORKERS = 4
+
+
+def build_partitions(start_date: str, end_date: str, partition_by: str = DEFAULT_PARTITION) -> list:
+    """Partitions covering [start_date, end_date], oldest first.
+
+    Returns:
+        [{"key", "date", "device"}]; device is None unless partitioned by device
+    """
+    if partition_by not in PARTITION_MODES:
+        raise Exception(f"DUMP_GSC_PARTITION must be one of: {', '.join(PARTITION_MODES)}")
+    day = date.fromisoformat(start_date)
+    last = date.fromisoformat(end_date)
+    partitions = []
+    while day <= last:
+        day_str = day.isoformat()
+        if partition_by == "date_device":
+            partitions.extend({"key": f"{day_str}_{device}", "date": day_str, "device": device}
+                              for device in GSC_DEVICES)
+        else:
+            partitions.append({"key": day_str, "date": day_str, "device": None})
+        day += timedelta(days=1)
+    return partitions
+
+
+def device_filter(device: str) -> list:
+    """dimensionFilterGroups restricting a query to one device."""
+    return [{"filters": [{"dimension": "device", "operator": "equals", "expression": device}]}]
+
+
+def extract_search_analytics(client, start_date: str, end_date: str, spool_dir=None,
+                             partition_by: str = None, workers: int = None) -> tuple:
+    """Fetch every Search Analytics row in the range, partition by partition.
+
+    Args:
+        client: GoogleSearchConsoleClient
+        start_date / end_date: YYYY-MM-DD, inclusive
+        spool_dir: Folder for partition JSONL files; None keeps rows in memory
+        partition_by: "date" or "date_device" (default: DUMP_GSC_PARTITION or "date")
+        workers: Partitions fetched at once (default: DUMP_GSC_WORKERS or 4)
+
+    Returns:
+        (records, partitions): records in partition order (a SpooledRecords
+        when spooling); partitions as [{"key", "date", "device", "rows",
+        "pages", "complete", "resumed", "error"}]
+    """
+    partition_by = partition_by or os.getenv("DUMP_GSC_PARTITION") or DEFAULT_PARTITION
+    workers = workers or int(os.getenv("DUMP_GSC_WORKERS") or DEFAULT_GSC_WORKERS)
+    partitions = build_partitions(start_date, end_date, partition_by)
+    in_memory = {}
+    lock = threading.Lock()
+
+    def fetch(partition):
+        status = {**partition, "rows": 0, "pages": 0, "complete": False, "resumed": False, "error": None}
+        spool = PartitionSpool(spool_dir, partition["key"]) if spool_dir else None
+        if spool:
+            done_rows = spool.completed_rows()
+            if done_rows is not None:
+                status.update(rows=done_rows, complete=True, resumed=True)
+                return status
+        filters = device_filter(partition["device"]) if partition["device"] else None
+        out = spool.open() if spool else None
+        rows_kept = []
+
+        def on_page(rows):
+            if out:
+                out.write("".join(json.dumps(row) + "\n" for row in rows))
+            else:
+                rows_kept.extend(rows)
+            status["rows"] += len(rows)
+            status["pages"] += 1
+
+        try:
+            client.page_search_analytics(partition["date"], partition["date"], GSC_DIMENSIONS,
+                                         on_page, row_limit=GSC_ROW_LIMIT, dimension_filter_groups=filters)
+            status["complete"] = True
+        except Exception as e:
+            status["error"] = str(e)[:200]
+        finally:
+            if out:
+                out.close()
+        if status["complete"]:
+            if spool:
+                spool.commit()
+            else:
+                with lock:
+                    in_memory[partition["key"]] = rows_kept
+        return status
+
+    # Pool threads inherit the calling fetcher for telemetry attribution
+    fetch_bound = client.telemetry.bind(client.telemetry.current_fetcher(), fetch)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="gsc") as pool:
+        statuses = list(pool.map(fetch_bound, partitions))
+
+    complete = [s for s in statuses if s["complete"]]
+    if spool_dir:
+        records = SpooledRecords([PartitionSpool(spool_dir, s["key"]).path for s in complete],
+                                 sum(s["rows"] for s in complete))
+    else:
+        records = [row for s in complete for row in in_memory[s["key"]]]
+    return records, statuses
+
+
+def manifest_section(raw_analytics: dict) -> dict:
+    """Per-partition completeness for _manifest.json (None for pre-partition raw files)."""
+    partitions = raw_analytics.get("partitions")
+    if partitions is None:
+        return None
+    return {
+        "partition_by": raw_analytics.get("partition_by"),
+        "partitions": len(partitions),
+        "complete": sum(1 for p in partitions if p["complete"]),
+        "resumed": sum(1 for p in partitions if p.get("resumed")),
+        "rows": sum(p["rows"] for p in partitions),
+        "pages": sum(p["pages"] for p in partitions),
+        "incomplete": [p["key"] for p in partitions if not p["complete"]],
+        "by_partition": {p["key"]: {"rows": p["rows"], "pages": p["pages"], "complete": p["complete"]}
+                         for p in partitions},
+    }
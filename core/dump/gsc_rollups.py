@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Phase A: Columnar GSC Rollups
+
+Search analytics rows ([query, page, device, country, date] keys) used to be
+walked twice at normalize time (queries, then pages) and twice more by the
+report (devices, countries), which reloaded raw/gsc/search_analytics.json.
+They are now read once: each row's keys are encoded to integer codes per
+rollup (first-seen order) and its metrics appended to compact columns. Every
+rollup is then a group-by over those codes with NumPy's bincount (NumPy is in
+requirements.txt; without it a plain loop gives the same results).
+
+Rollups (normalized/gsc/{name}.json):
+    queries       by query
+    pages         by page
+    devices       by device
+    countries     by country
+    dates         by date (sorted by date; the others by impressions, descending)
+    query_pages   by query x page
+
+Each record has clicks, impressions, ctr (clicks / impressions) and position
+weighted by impressions.
+"""
+
+from array import array
+from operator import itemgetter
+
+ROLLUPS = {
+    "queries": ("query",),
+    "pages": ("page",),
+    "devices": ("device",),
+    "countries": ("country",),
+    "dates": ("date",),
+    "query_pages": ("query", "page"),
+}
+
+# Position of each dimension in a row's "keys" (GSC_DIMENSIONS in gsc_extract.py)
+KEY_POSITIONS = {"query": 0, "page": 1, "device": 2, "country": 3, "date": 4}
+
+SORT_BY_KEY = ("dates",)
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _key_getter(dimensions: tuple):
+    """keys -> the rollup's key (a string, or a tuple for multi-dimension rollups)."""
+    return itemgetter(*(KEY_POSITIONS[d] for d in dimensions))
+
+
+def _group_sums(codes: array, columns: tuple, groups: int, np) -> list:
+    """Per-code sums of each column, in row order (float sums match a plain loop)."""
+    if np is not None:
+        codes = np.frombuffer(codes, dtype=np.int64)
+        return [np.bincount(codes, weights=np.frombuffer(column, dtype=np.float64), minlength=groups).tolist()
+                for column in columns]
+    sums = [[0.0] * groups for _ in columns]
+    clicks, impressions, positions = sums
+    for code, row_clicks, row_impressions, row_position in zip(codes, *columns):
+        clicks[code] += row_clicks
+        impressions[code] += row_impressions
+        positions[code] += row_position
+    return sums
+
+
+def aggregate_rows(rows) -> dict:
+    """One pass over search analytics rows; returns {rollup name: records}.
+
+    Rows with fewer than five keys are skipped as malformed.
+    """
+    np = _import_numpy()
+    encoders = [{} for _ in ROLLUPS]
+    codes = [array("q") for _ in ROLLUPS]
+    clicks, impressions, weighted_position = array("d"), array("d"), array("d")
+    getters = [_key_getter(dimensions) for dimensions in ROLLUPS.values()]
+
+    for row in rows:
+        keys = row.get("keys", [])
+        if len(keys) < 5:
+            continue
+        for getter, encoder, column in zip(getters, encoders, codes):
+            key = getter(keys)
+            column.append(encoder.setdefault(key, len(encoder)))
+        row_impressions = row.get("impressions", 0)
+        clicks.append(row.get("clicks", 0))
+        impressions.append(row_impressions)
+        weighted_position.append(row.get("position", 0) * row_impressions)
+
+    rollups = {}
+    for (name, dimensions), encoder, column in zip(ROLLUPS.items(), encoders, codes):
+        group_clicks, group_impressions, group_positions = _group_sums(
+            column, (clicks, impressions, weighted_position), len(encoder), np)
+        records = []
+        for key, code in encoder.items():
+            record_clicks = int(group_clicks[code])
+            record_impressions = int(group_impressions[code])
+            record = dict(zip(dimensions, key)) if len(dimensions) > 1 else {dimensions[0]: key}
+            record.update({
+                "clicks": record_clicks,
+                "impressions": record_impressions,
+                "ctr": round(record_clicks / record_impressions, 4) if record_impressions > 0 else 0,
+                "position": round(group_positions[code] / record_impressions, 1) if record_impressions > 0 else 0,
+            })
+            records.append(record)
+        if name in SORT_BY_KEY:
+            records.sort(key=lambda r: r[dimensions[0]])
+        else:
+            records.sort(key=lambda r: r["impressions"], reverse=True)
+        rollups[name] = records
+    return rollups
+
+
+def summarize(queries: list) -> dict:
+    """Overall totals from the query rollup."""
+    total_clicks = sum(q["clicks"] for q in queries)
+    total_impressions = sum(q["impressions"] for q in queries)
+    avg_ctr = total_clicks / total_impressions if total_impressions > 0 else 0
+    avg_position = sum(q["position"] * q["impressions"] for q in queries) / total_impressions if total_impressions > 0 else 0
+    return {
+        "total_clicks": total_clicks,
+        "total_impressions": total_impressions,
+        "avg_ctr": round(avg_ctr, 4),
+        "avg_position": round(avg_position, 1),
+    }
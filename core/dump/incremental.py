@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Phase A: Incremental Dumps Driven by change_event
+
+An incremental dump starts from the most recent complete snapshot (the
+"base"), asks Google Ads which resource types changed since the base was
+extracted, refetches only the raw files those types feed, and carries every
+other Google Ads raw file forward from the base unchanged. Normalization and
+indexing then run over the merged raw set exactly as in a full dump.
+
+Always refetched (not tracked by change_event, or time-windowed):
+    change_history, performance, brand_lists, Merchant Center, GSC
+
+A carried file keeps the base's payload, including its own extracted_at, so
+a chain of incremental dumps can carry one fetch forward many times. Each
+carried file is therefore refetched once its extracted_at is older than:
+    SYSTEM_MANAGED_MAX_CARRY_HOURS  keywords, ads, assets, asset_groups -
+                                    their quality_info.*, policy_summary.
+                                    approval_status and ad_strength fields
+                                    are updated by Google without a
+                                    change_event
+    MAX_CARRY_AGE_DAYS              every other tracked fetcher
+
+Falls back to refetching everything when:
+    - no usable base snapshot exists (missing, other customer, too old,
+      other field profile)
+    - the change_event scan fails or hits its row limit
+    - a change_event resource type has no known file mapping
+
+Usage (from dump_state.main):
+    incremental = IncrementalDump.from_previous(SNAPSHOTS_DIR, customer_id, RAW_FILE_PATHS)
+    incremental.attach(scheduler, ads_client)
+    ...
+    manifest["incremental"] = incremental.manifest_section(written_raw_files)
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from core.snapshot.codec import read_json
+
+# change_event only covers the last 30 days; leave a day of headroom
+MAX_BASE_AGE_DAYS = 29
+
+# Re-scan a little before the base started to absorb change_event ingestion lag
+CHANGE_EVENT_OVERLAP_MINUTES = 15
+
+# API maximum for change_event queries; hitting it means the scan is incomplete
+CHANGE_EVENT_LIMIT = 10000
+
+# change_event.change_resource_type -> fetchers whose raw files it can affect
+RESOURCE_TYPE_FETCHERS = {
+    "CAMPAIGN": ["campaigns", "pmax_campaigns", "url_expansion"],
+    "CAMPAIGN_BUDGET": ["campaigns", "pmax_campaigns"],
+    "AD_GROUP": ["ad_groups"],
+    "AD_GROUP_AD": ["ads"],
+    "AD": ["ads"],
+    "AD_GROUP_CRITERION": ["keywords", "adgroup_negatives"],
+    "AD_GROUP_BID_MODIFIER": ["ad_groups"],
+    "CAMPAIGN_CRITERION": ["campaign_negatives", "pmax_brand_exclusions"],
+    "ASSET": ["assets"],
+    "CUSTOMER_ASSET": ["assets"],
+    "CAMPAIGN_ASSET": ["asset_links", "pmax_campaign_assets"],
+    "AD_GROUP_ASSET": ["asset_links"],
+    "ASSET_SET": ["assets"],
+    "CAMPAIGN_ASSET_SET": ["asset_links"],
+    "ASSET_GROUP": ["asset_groups"],
+    "ASSET_GROUP_ASSET": ["asset_group_assets"],
+    "ASSET_GROUP_LISTING_GROUP_FILTER": ["listing_groups"],
+    "ASSET_GROUP_SIGNAL": ["asset_groups"],
+    "CAMPAIGN_SHARED_SET": ["pmax_brand_exclusions"],
+}
+
+# Fetchers eligible for carry-forward (everything change_event can vouch for)
+TRACKED_FETCHERS = sorted({name for names in RESOURCE_TYPE_FETCHERS.values() for name in names})
+
+# Fetchers with system-managed fields that change without a change_event
+# (quality_info.*, policy_summary.approval_status, ad_strength)
+SYSTEM_MANAGED_FETCHERS = {"keywords", "ads", "assets", "asset_groups"}
+
+# Oldest extracted_at a carried file may have before it is refetched
+SYSTEM_MANAGED_MAX_CARRY_HOURS = 24
+MAX_CARRY_AGE_DAYS = 7
+
+
+def max_carry_age(name: str) -> timedelta:
+    """How old a fetcher's carried raw file may be (by its own extracted_at)."""
+    if name in SYSTEM_MANAGED_FETCHERS:
+        return timedelta(hours=SYSTEM_MANAGED_MAX_CARRY_HOURS)
+    return timedelta(days=MAX_CARRY_AGE_DAYS)
+
+
+def find_previous_snapshot(snapshots_dir: Path, exclude: Path = None):
+    """Return the newest snapshot directory that has a _manifest.json, or None."""
+    if not snapshots_dir.exists():
+        return None
+    candidates = sorted(
+        (d for d in snapshots_dir.iterdir()
+         if d.is_dir() and d.name[0].isdigit() and (d / "_manifest.json").exists()),
+        key=lambda d: d.name,
+        reverse=True,
+    )
+    for d in candidates:
+        if exclude is None or d.resolve() != exclude.resolve():
+            return d
+    return None
+
+
+def parse_manifest_time(ts: str) -> datetime:
+    """Parse a manifest timestamp like 2026-01-19T19:46:19.430482Z (naive UTC)."""
+    return datetime.fromisoformat(ts.rstrip("Z"))
+
+
+def scan_change_events(client, since: datetime, until: datetime) -> dict:
+    """Return the resource types changed between two UTC datetimes."""
+    query = f"""
+        SELECT
+            change_event.change_date_time,
+            change_event.change_resource_type,
+            change_event.change_resource_name
+        FROM change_event
+        WHERE change_event.change_date_time >= '{since.strftime("%Y-%m-%d %H:%M:%S")}'
+            AND change_event.change_date_time <= '{until.strftime("%Y-%m-%d %H:%M:%S")}'
+        ORDER BY change_event.change_date_time DESC
+        LIMIT {CHANGE_EVENT_LIMIT}
+    """
+    results = client.search(query)
+    types = {}
+    for r in results:
+        rtype = r.get("changeEvent", {}).get("changeResourceType", "UNKNOWN")
+        types[rtype] = types.get(rtype, 0) + 1
+    return {
+        "count": len(results),
+        "saturated": len(results) >= CHANGE_EVENT_LIMIT,
+        "resource_types": types,
+    }
+
+
+class IncrementalDump:
+    """Plans and applies carry-forward of unchanged raw files from a base snapshot."""
+
+    def __init__(self, raw_paths: dict, base_dir: Path = None, base_manifest: dict = None,
+                 unusable_reason: str = None):
+        """
+        Args:
+            raw_paths: {fetcher_name: path relative to the snapshot root}
+            base_dir: Base snapshot directory (None if no usable base)
+            base_manifest: Parsed _manifest.json of the base
+            unusable_reason: Why no base could be used (forces a full refetch)
+        """
+        self.raw_paths = raw_paths
+        self.base_dir = base_dir
+        self.base_manifest = base_manifest or {}
+        self.since = None
+        self.scan = None
+        self.refresh = set(TRACKED_FETCHERS)
+        self.full_refresh_reason = unusable_reason
+        self.carried_over = []
+        self.carry_expired = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_previous(cls, snapshots_dir: Path, customer_id: str, raw_paths: dict, exclude: Path = None,
+                      field_profile: str = "full"):
+        """Select the latest snapshot as base, validating that it can be reused."""
+        base_dir = find_previous_snapshot(snapshots_dir, exclude=exclude)
+        if base_dir is None:
+            return cls(raw_paths, unusable_reason="No previous snapshot with _manifest.json")
+
+        with open(base_dir / "_manifest.json", "r") as f:
+            manifest = json.load(f)
+
+        base_customer = (manifest.get("accounts", {}).get("google_ads") or {}).get("customer_id")
+        if base_customer != customer_id.replace("-", ""):
+            return cls(raw_paths, base_dir, manifest,
+                       unusable_reason=f"Base snapshot is for customer {base_customer}")
+
+        # Carried raw files must have the same fields as refetched ones
+        base_profile = (manifest.get("field_profile") or {}).get("profile", "full")
+        if base_profile != field_profile:
+            return cls(raw_paths, base_dir, manifest,
+                       unusable_reason=f"Base snapshot used field profile {base_profile}, this dump {field_profile}")
+
+        started = manifest.get("extraction_started_utc")
+        if not started:
+            return cls(raw_paths, base_dir, manifest, unusable_reason="Base manifest has no extraction_started_utc")
+
+        if datetime.utcnow() - parse_manifest_time(started) > timedelta(days=MAX_BASE_AGE_DAYS):
+            return cls(raw_paths, base_dir, manifest,
+                       unusable_reason=f"Base snapshot older than {MAX_BASE_AGE_DAYS} days (change_event window)")
+
+        return cls(raw_paths, base_dir, manifest)
+
+    @property
+    def base_snapshot_id(self):
+        return self.base_manifest.get("snapshot_id") or (self.base_dir.name if self.base_dir else None)
+
+    def attach(self, scheduler, ads_client):
+        """Add the change scan task and route tracked fetchers through it.
+
+        Each tracked fetcher gains a dependency on "change_scan" and either
+        carries its raw file forward or runs its original fetch.
+        """
+        scheduler.add("change_scan", lambda up: self.run_scan(ads_client), deps=[],
+                      label="Change Scan (incremental)", default=dict)
+
+        for name in TRACKED_FETCHERS:
+            task = scheduler.tasks.get(name)
+            if task is None:
+                continue
+            task.deps.append("change_scan")
+            task.fn = self._wrap(name, task.fn)
+
+    def run_scan(self, ads_client) -> dict:
+        """Query change_event since the base and decide which fetchers to refresh."""
+        if self.full_refresh_reason:
+            return {"full_refresh_reason": self.full_refresh_reason}
+
+        # Through the next midnight: covers every change so far, and the query
+        # text stays the same all day (cassettes key dates by day offset)
+        until = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        self.since = (parse_manifest_time(self.base_manifest["extraction_started_utc"])
+                      - timedelta(minutes=CHANGE_EVENT_OVERLAP_MINUTES))
+        try:
+            self.scan = scan_change_events(ads_client, self.since, until)
+        except Exception as e:
+            self.full_refresh_reason = f"change_event scan failed: {e}"
+            return {"full_refresh_reason": self.full_refresh_reason}
+
+        if self.scan["saturated"]:
+            self.full_refresh_reason = f"change_event scan hit the {CHANGE_EVENT_LIMIT} row limit"
+            return {"full_refresh_reason": self.full_refresh_reason, **self.scan}
+
+        unknown = sorted(t for t in self.scan["resource_types"] if t not in RESOURCE_TYPE_FETCHERS)
+        if unknown:
+            self.full_refresh_reason = f"Unmapped change_event resource types: {', '.join(unknown)}"
+            return {"full_refresh_reason": self.full_refresh_reason, **self.scan}
+
+        refresh = set()
+        for rtype in self.scan["resource_types"]:
+            refresh.update(RESOURCE_TYPE_FETCHERS[rtype])
+
+        # Anything that errored in the base (and so was written empty) is refetched
+        for err in self.base_manifest.get("errors", []):
+            if err.get("file") in TRACKED_FETCHERS:
+                refresh.add(err["file"])
+
+        self.refresh = refresh
+        return {"refresh": sorted(refresh), **self.scan}
+
+    def _wrap(self, name: str, fetch):
+        def resolve(upstream):
+            if self.full_refresh_reason is None and name not in self.refresh:
+                carried = self.load_carried(name)
+                if carried is not None:
+                    with self._lock:
+                        self.carried_over.append(self.raw_paths[name])
+                    return carried
+            return fetch(upstream)
+        return resolve
+
+    def load_carried(self, name: str):
+        """Load a raw file from the base snapshot, or None if it is missing or too old.
+
+        The payload is returned unmodified so the rewritten file is
+        byte-identical to the base and deduplicates in the blob store.
+        """
+        path = self.base_dir / self.raw_paths[name]
+        if not path.exists():
+            return None
+        payload = read_json(path)
+        extracted_at = payload.get("extracted_at")
+        if not extracted_at or datetime.utcnow() - parse_manifest_time(extracted_at) > max_carry_age(name):
+            with self._lock:
+                self.carry_expired.append(self.raw_paths[name])
+            return None
+        return payload
+
+    def manifest_section(self, written: list) -> dict:
+        """Summary of the incremental run for _manifest.json.
+
+        Args:
+            written: Fetcher names whose raw files were written to the snapshot
+        """
+        carried = set(self.carried_over)
+        refreshed = [self.raw_paths[n] for n in written if self.raw_paths[n] not in carried]
+        return {
+            "base_snapshot_id": self.base_snapshot_id,
+            "since_utc": self.since.isoformat() + "Z" if self.since else None,
+            "change_events": (self.scan or {}).get("count"),
+            "changed_resource_types": (self.scan or {}).get("resource_types", {}),
+            "full_refresh_reason": self.full_refresh_reason,
+            "carried_over": sorted(self.carried_over),
+            "carry_expired": sorted(self.carry_expired),
+            "refreshed": sorted(refreshed),
+        }
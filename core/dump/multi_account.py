@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Phase A: Multi-Account Dumps
+
+`bin/dump --accounts ...` dumps several Google Ads client accounts under one
+login (manager) customer in a single run instead of one cron job per
+account. Accounts are dumped concurrently on an account worker pool; each
+runs its own fetch scheduler, and all of them share the process's OAuth
+token and pooled HTTP transport. The transport's in-flight request cap is the
+run-wide quota, so total time is bounded by the largest account rather than
+the sum of all of them.
+
+Output:
+    snapshots/customers/{customer_id}/{TIMESTAMP}/   # one regular snapshot per account
+    snapshots/runs/{TIMESTAMP}.json                  # combined run manifest
+
+Accounts:
+    --accounts 1234567890,234-567-8901   Explicit customer IDs
+    --accounts all-under-mcc             Every enabled, non-manager client of
+                                         GOOGLE_ADS_LOGIN_CUSTOMER_ID
+
+Merchant Center and Search Console IDs per account come from
+core/configs/accounts.json (optional, override with DUMP_ACCOUNTS_CONFIG):
+
+    {"1234567890": {"name": "...", "merchant_id": "...", "gsc_site_url": "..."}}
+
+The account in GOOGLE_ADS_CUSTOMER_ID falls back to MERCHANT_CENTER_ID and
+GSC_SITE_URL; other accounts without an entry dump Google Ads only.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ACCOUNTS_CONFIG_PATH = PROJECT_ROOT / "core" / "configs" / "accounts.json"
+
+ALL_UNDER_MCC = "all-under-mcc"
+
+CUSTOMER_CLIENT_QUERY = """
+    SELECT
+        customer_client.id,
+        customer_client.descriptive_name,
+        customer_client.level,
+        customer_client.manager,
+        customer_client.status
+    FROM customer_client
+    WHERE customer_client.manager = FALSE
+        AND customer_client.status = 'ENABLED'
+"""
+
+
+def clean_customer_id(customer_id) -> str:
+    return str(customer_id).replace("-", "").strip()
+
+
+def load_accounts_config(path: Path = None) -> dict:
+    """{customer_id: {"name", "merchant_id", "gsc_site_url"}}; empty if no config file."""
+    path = Path(path or os.getenv("DUMP_ACCOUNTS_CONFIG") or ACCOUNTS_CONFIG_PATH)
+    if not path.exists():
+        return {}
+    with open(path, "r") as f:
+        config = json.load(f)
+    return {clean_customer_id(cid): entry or {} for cid, entry in config.items()}
+
+
+def list_client_accounts(manager_client) -> list:
+    """Enabled non-manager accounts under the manager customer, as [{customer_id, name}]."""
+    accounts = []
+    for row in manager_client.search(CUSTOMER_CLIENT_QUERY):
+        client = row.get("customerClient", {})
+        accounts.append({
+            "customer_id": clean_customer_id(client.get("id", "")),
+            "name": client.get("descriptiveName"),
+        })
+    return sorted(accounts, key=lambda a: a["customer_id"])
+
+
+def resolve_accounts(spec: str, login_customer_id: str, primary: dict, config: dict = None,
+                     manager_client=None) -> list:
+    """Expand an --accounts value into per-account dump settings.
+
+    Args:
+        spec: Comma-separated customer IDs or "all-under-mcc"
+        login_customer_id: Manager customer every account is accessed through
+        primary: {"customer_id", "merchant_id", "gsc_site_url"} from the environment
+        config: Per-account Merchant / GSC settings (load_accounts_config)
+        manager_client: GoogleAdsClient for the login customer (all-under-mcc only)
+    """
+    config = config or {}
+    if spec == ALL_UNDER_MCC:
+        if not login_customer_id or manager_client is None:
+            raise Exception(f"--accounts {ALL_UNDER_MCC} requires GOOGLE_ADS_LOGIN_CUSTOMER_ID")
+        listed = list_client_accounts(manager_client)
+    else:
+        listed = [{"customer_id": clean_customer_id(cid), "name": None} for cid in spec.split(",") if cid.strip()]
+
+    primary_id = clean_customer_id(primary.get("customer_id") or "")
+    accounts, seen = [], set()
+    for entry in listed:
+        customer_id = entry["customer_id"]
+        if customer_id in seen:
+            continue
+        seen.add(customer_id)
+        settings = config.get(customer_id, {})
+        fallback = primary if customer_id == primary_id else {}
+        accounts.append({
+            "customer_id": customer_id,
+            "name": settings.get("name") or entry.get("name"),
+            "login_customer_id": login_customer_id,
+            "merchant_id": settings.get("merchant_id") or fallback.get("merchant_id"),
+            "gsc_site_url": settings.get("gsc_site_url") or fallback.get("gsc_site_url"),
+        })
+    if not accounts:
+        raise Exception(f"No accounts to dump for --accounts {spec}")
+    return accounts
+
+
+class AccountOutput:
+    """sys.stdout proxy that prefixes each line with the printing thread's account.
+
+    Concurrent account dumps print through the same progress code as a single
+    dump; whole lines are written under a lock so they never interleave.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def set_label(self, label):
+        self._local.label = label
+        self._local.buffer = ""
+
+    def write(self, text: str) -> int:
+        label = getattr(self._local, "label", None)
+        if label is None:
+            with self._lock:
+                return self.stream.write(text)
+        self._local.buffer += text
+        *lines, self._local.buffer = self._local.buffer.split("\n")
+        if lines:
+            with self._lock:
+                for line in lines:
+                    self.stream.write(f"[{label}] {line}\n")
+        return len(text)
+
+    def flush(self):
+        label = getattr(self._local, "label", None)
+        if label is not None and self._local.buffer:
+            with self._lock:
+                self.stream.write(f"[{label}] {self._local.buffer}\n")
+            self._local.buffer = ""
+        self.stream.flush()
+
+
+def run_accounts(accounts: list, dump_fn, max_workers: int) -> list:
+    """Dump accounts concurrently; one account failing never stops the others.
+
+    Args:
+        accounts: Output of resolve_accounts
+        dump_fn: Callable(account) -> summary dict (dump_state.dump_account)
+        max_workers: Accounts dumped at the same time
+
+    Returns:
+        [{"customer_id", "status", "seconds", "summary" | "error"}] in account order
+    """
+    output = AccountOutput(sys.stdout)
+    run_started = time.perf_counter()
+
+    def run_one(account):
+        output.set_label(account["customer_id"])
+        started = time.perf_counter()
+        result = {"customer_id": account["customer_id"], "name": account.get("name"),
+                  "start_offset_seconds": round(started - run_started, 3)}
+        try:
+            result["summary"] = dump_fn(account)
+            result["status"] = "ERROR" if result["summary"]["errors"] else "OK"
+        except Exception as e:
+            print(f"FAILED: {e}")
+            result["status"] = "FAILED"
+            result["error"] = str(e)
+        finally:
+            output.flush()
+            output.set_label(None)
+        result["seconds"] = round(time.perf_counter() - started, 3)
+        return result
+
+    saved_stdout = sys.stdout
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="account") as pool:
+            return list(pool.map(run_one, accounts))
+    finally:
+        sys.stdout = saved_stdout
+
+
+def build_run_manifest(run_id: str, accounts: list, results: list, started_utc: str, wall_seconds: float,
+                       settings: dict, snapshots_dir: Path, project_root: Path = None) -> dict:
+    """Combined manifest for one multi-account run (snapshots/runs/{run_id}.json)."""
+    entries = []
+    totals = {"calls": 0, "pages": 0, "bytes": 0, "rows": 0, "retries": 0, "errors": 0}
+    for account, result in zip(accounts, results):
+        entry = {
+            "customer_id": account["customer_id"],
+            "name": account.get("name"),
+            "merchant_id": account.get("merchant_id"),
+            "gsc_site_url": account.get("gsc_site_url"),
+            "status": result["status"],
+            "start_offset_seconds": result["start_offset_seconds"],
+            "seconds": result["seconds"],
+        }
+        summary = result.get("summary")
+        if summary:
+            snapshot_dir = Path(summary["snapshot_dir"])
+            if project_root is not None:
+                try:
+                    snapshot_dir = snapshot_dir.resolve().relative_to(Path(project_root).resolve())
+                except ValueError:
+                    pass
+            entry.update({
+                "snapshot_id": summary["snapshot_id"],
+                "snapshot_dir": str(snapshot_dir),
+                "errors": summary["errors"],
+                "record_counts": summary["record_counts"],
+                "telemetry": summary["telemetry_totals"],
+            })
+            for key in totals:
+                totals[key] += summary["telemetry_totals"].get(key, 0)
+        else:
+            entry["error"] = result.get("error")
+        entries.append(entry)
+
+    slowest = max(results, key=lambda r: r["seconds"]) if results else None
+    return {
+        "run_id": run_id,
+        "kind": "multi_account",
+        "started_utc": started_utc,
+        "finished_utc": datetime.utcnow().isoformat() + "Z",
+        "wall_seconds": round(wall_seconds, 3),
+        "serial_seconds": round(sum(r["seconds"] for r in results), 3),
+        "slowest_account": slowest["customer_id"] if slowest else None,
+        "settings": settings,
+        "snapshots_root": str(snapshots_dir),
+        "status_counts": {s: sum(1 for r in results if r["status"] == s) for s in ("OK", "ERROR", "FAILED")},
+        "api_totals": totals,
+        "accounts": entries,
+    }
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Rebuild Normalized Files from Raw - Phase A (NO API CALLS)
+
+Re-runs the dump's normalizers over an existing snapshot's raw/ files and
+rewrites normalized/, _index.bin, errors.jsonl and the normalized record
+counts in _manifest.json. Use it after fixing a normalizer or adding a
+derived field, instead of dumping again.
+
+Each normalize job (see NORMALIZE_JOBS in dump_state.py) only reads raw
+files, so jobs run in a process pool. With --all, jobs from every snapshot
+share one pool and each snapshot's index and manifest are rebuilt as soon as
+its own jobs finish.
+
+Files are written in the snapshot's recorded encoding and, if the snapshot
+was written through the blob store, through the blob store again.
+
+Usage:
+    python core/dump/normalize.py --snapshot snapshots/2026-01-19T194619Z
+    python core/dump/normalize.py --all               # Backfill every snapshot
+    python core/dump/normalize.py --all --workers 8   # Pool size (default: CPU count)
+    python core/dump/normalize.py --all --no-dedup    # Write plain files
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CORE_DIR = SCRIPT_DIR.parent
+PROJECT_ROOT = CORE_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.dump import dump_state
+from core.dump.blob_store import BlobStore
+from core.snapshot import entity_index
+from core.snapshot.codec import read_json
+
+SNAPSHOTS_DIR = PROJECT_ROOT / "snapshots"
+
+
+def find_snapshots(snapshots_dir: Path) -> list:
+    """Every snapshot directory with a raw/ folder, oldest first.
+
+    Includes per-account snapshots of multi-account dumps
+    (snapshots/customers/{customer_id}/{TIMESTAMP}).
+    """
+    if not snapshots_dir.exists():
+        return []
+    parents = [snapshots_dir]
+    customers_dir = snapshots_dir / "customers"
+    if customers_dir.is_dir():
+        parents.extend(sorted(d for d in customers_dir.iterdir() if d.is_dir()))
+    return sorted(
+        (d for parent in parents for d in parent.iterdir()
+         if d.is_dir() and d.name[0].isdigit() and (d / "raw").is_dir()),
+        key=lambda d: d.name,
+    )
+
+
+def snapshot_label(snapshot_dir: Path) -> str:
+    """Snapshot name, with its customers/{id}/ prefix for per-account snapshots."""
+    if snapshot_dir.parent.parent.name == "customers":
+        return f"customers/{snapshot_dir.parent.name}/{snapshot_dir.name}"
+    return snapshot_dir.name
+
+
+def load_manifest(snapshot_dir: Path) -> dict:
+    path = snapshot_dir / "_manifest.json"
+    return read_json(path) if path.exists() else {}
+
+
+def write_options(manifest: dict, dedup: bool) -> tuple:
+    """(encoding, use blob store) matching how the snapshot was written."""
+    encoding = (manifest.get("encoding") or {}).get("format", "json")
+    return encoding, dedup and "blobs" in manifest
+
+
+def configure_writer(encoding: str, use_blobs: bool):
+    """Point dump_state.write_json at the snapshot's encoding / blob store."""
+    dump_state.SNAPSHOT_ENCODING = encoding
+    dump_state.BLOB_STORE = BlobStore(dump_state.BLOB_STORE_DIR) if use_blobs else None
+
+
+def available_raw(snapshot_dir: Path) -> list:
+    """Fetcher names whose raw file exists in the snapshot."""
+    return [name for name, rel_path in dump_state.RAW_FILE_PATHS.items() if (snapshot_dir / rel_path).exists()]
+
+
+def run_job(snapshot_dir: str, job: str, encoding: str, use_blobs: bool) -> dict:
+    """Pool worker: normalize one job from raw files and write its outputs."""
+    snapshot_dir = Path(snapshot_dir)
+    configure_writer(encoding, use_blobs)
+
+    inputs, _ = dump_state.NORMALIZE_JOBS[job]
+    raw = {name: read_json(snapshot_dir / dump_state.RAW_FILE_PATHS[name]) for name in inputs}
+    outputs, validation_errors = dump_state.run_normalize_job(job, raw)
+    for rel_path, data in outputs.items():
+        dump_state.write_json(snapshot_dir / rel_path, data)
+
+    return {
+        "summary": dump_state.summarize_normalized(outputs),
+        "validation_errors": validation_errors,
+        "blobs": dump_state.BLOB_STORE.refs_under(snapshot_dir) if dump_state.BLOB_STORE else {},
+    }
+
+
+def finalize_snapshot(snapshot_dir: str, encoding: str, use_blobs: bool, jobs: list, results: list) -> dict:
+    """Pool worker: rebuild _index.bin, errors.jsonl and manifest counts."""
+    snapshot_dir = Path(snapshot_dir)
+    configure_writer(encoding, use_blobs)
+
+    normalized = {}
+    for rel_path in dump_state.INDEX_INPUTS.values():
+        if (snapshot_dir / rel_path).exists():
+            normalized[rel_path] = read_json(snapshot_dir / rel_path)
+    dump_state.write_index(snapshot_dir, dump_state.build_index_from(normalized))
+    # _index.bin replaces the JSON index of older snapshots
+    (snapshot_dir / entity_index.LEGACY_INDEX_FILE).unlink(missing_ok=True)
+
+    summary, validation_errors, blobs = {}, [], {}
+    for result in results:
+        summary.update(result["summary"])
+        validation_errors.extend(result["validation_errors"])
+        blobs.update(result["blobs"])
+    if dump_state.BLOB_STORE:
+        blobs.update(dump_state.BLOB_STORE.refs_under(snapshot_dir))
+
+    # Normalized files whose job was skipped (raw input missing) keep their
+    # existing content; count them as they are on disk
+    for path in sorted((snapshot_dir / "normalized").rglob("*.json")):
+        rel_path = path.relative_to(snapshot_dir).as_posix()
+        if rel_path not in summary:
+            summary.update(dump_state.summarize_normalized({rel_path: read_json(path)}))
+    dump_state.write_errors_jsonl(snapshot_dir, validation_errors)
+
+    manifest = load_manifest(snapshot_dir)
+    if manifest:
+        counts, validation = dump_state.normalized_manifest_counts(summary)
+        manifest.setdefault("record_counts", {})["normalized"] = counts
+        manifest.setdefault("file_counts", {})["normalized"] = len(summary)  # Every normalized file on disk
+        manifest["validation"] = {**validation, "total_validation_errors": len(validation_errors)}
+        if "blobs" in manifest and blobs:
+            files = {**manifest["blobs"].get("files", {}), **blobs}
+            manifest["blobs"]["files"] = dict(sorted(files.items()))
+        manifest["renormalized"] = {
+            "normalized_utc": datetime.utcnow().isoformat() + "Z",
+            "snapshot_version": dump_state.SNAPSHOT_VERSION,
+            "jobs": jobs,
+        }
+        dump_state.write_json(snapshot_dir / "_manifest.json", manifest, dedup=False, encoding="json")
+
+    return {"validation_errors": len(validation_errors), "manifest_updated": bool(manifest)}
+
+
+def normalize_snapshots(snapshot_dirs: list, workers: int = None, dedup: bool = True) -> dict:
+    """Renormalize snapshots in one process pool.
+
+    Returns:
+        {snapshot name: {"status": "OK" | "ERROR", ...}}
+    """
+    outcomes = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        state = {}
+
+        for snapshot_dir in snapshot_dirs:
+            encoding, use_blobs = write_options(load_manifest(snapshot_dir), dedup)
+            jobs = dump_state.normalize_jobs_for(available_raw(snapshot_dir))
+            state[snapshot_dir] = {
+                "encoding": encoding, "use_blobs": use_blobs, "jobs": jobs,
+                "pending": len(jobs), "results": [], "errors": [], "started": time.time(),
+            }
+            for job in jobs:
+                future = pool.submit(run_job, str(snapshot_dir), job, encoding, use_blobs)
+                running[future] = (snapshot_dir, job)
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                snapshot_dir, job = running.pop(future)
+                entry = state[snapshot_dir]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if job is None:
+                        entry["errors"].append(f"index/manifest: {e}")
+                    else:
+                        entry["errors"].append(f"{job}: {e}")
+                        entry["pending"] -= 1
+                    result = None
+
+                if job is None:
+                    outcomes[snapshot_label(snapshot_dir)] = {
+                        "status": "ERROR" if entry["errors"] else "OK",
+                        "jobs": len(entry["jobs"]),
+                        "errors": entry["errors"],
+                        "validation_errors": (result or {}).get("validation_errors", 0),
+                        "seconds": round(time.time() - entry["started"], 2),
+                    }
+                    continue
+
+                if result is not None:
+                    entry["results"].append(result)
+                    entry["pending"] -= 1
+                if entry["pending"] == 0:
+                    if entry["errors"]:
+                        # Leave index and manifest describing the previous normalization
+                        outcomes[snapshot_label(snapshot_dir)] = {
+                            "status": "ERROR", "jobs": len(entry["jobs"]), "errors": entry["errors"],
+                            "seconds": round(time.time() - entry["started"], 2),
+                        }
+                    else:
+                        future = pool.submit(finalize_snapshot, str(snapshot_dir), entry["encoding"],
+                                             entry["use_blobs"], entry["jobs"], entry["results"])
+                        running[future] = (snapshot_dir, None)
+
+        for snapshot_dir, entry in state.items():
+            if not entry["jobs"]:
+                outcomes[snapshot_label(snapshot_dir)] = {"status": "ERROR", "jobs": 0, "errors": ["no raw files"]}
+
+    return outcomes
+
+
+def main():
+    snapshot_arg = None
+    workers = None
+    all_mode = "--all" in sys.argv
+    dedup = "--no-dedup" not in sys.argv
+    for i, arg in enumerate(sys.argv):
+        if arg == "--snapshot" and i + 1 < len(sys.argv):
+            snapshot_arg = sys.argv[i + 1]
+        if arg == "--workers" and i + 1 < len(sys.argv):
+            workers = int(sys.argv[i + 1])
+
+    if bool(snapshot_arg) == all_mode:
+        print("ERROR: Specify exactly one of --snapshot <path> or --all")
+        print()
+        print(__doc__.split("Usage:")[1])
+        sys.exit(1)
+
+    if all_mode:
+        snapshot_dirs = find_snapshots(SNAPSHOTS_DIR)
+    else:
+        snapshot_dir = Path(snapshot_arg)
+        if not snapshot_dir.is_absolute() and not snapshot_dir.exists():
+            snapshot_dir = PROJECT_ROOT / snapshot_dir
+        if not (snapshot_dir / "raw").is_dir():
+            print(f"ERROR: No raw/ folder in {snapshot_dir}")
+            sys.exit(1)
+        snapshot_dirs = [snapshot_dir]
+
+    print("=" * 60)
+    print(f"NORMALIZE FROM RAW  [v{dump_state.SNAPSHOT_VERSION}]")
+    print("=" * 60)
+    print()
+    print(f"Snapshots: {len(snapshot_dirs)}")
+    print(f"Workers: {workers or os.cpu_count()}")
+    print()
+
+    start_time = time.time()
+    outcomes = normalize_snapshots(snapshot_dirs, workers=workers, dedup=dedup)
+
+    failed = 0
+    for name in sorted(outcomes):
+        outcome = outcomes[name]
+        if outcome["status"] == "OK":
+            print(f"  {name}... OK ({outcome['jobs']} jobs, "
+                  f"{outcome['validation_errors']} validation errors, {outcome['seconds']:.1f}s)")
+        else:
+            failed += 1
+            print(f"  {name}... ERROR")
+            for err in outcome["errors"]:
+                print(f"    - {err}")
+    print()
+    print(f"Done in {time.time() - start_time:.1f}s ({len(outcomes) - failed} OK, {failed} failed)")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Phase A: Append-Only Daily Performance Store
+
+Persists campaign and ad-group daily metrics outside of snapshots, one
+partition file per (customer, date):
+
+    store/performance/{customer_id}/{YYYY-MM-DD}.json
+
+Each partition holds every row for that date, keyed by
+(date, campaign_id, ad_group_id). Daily metrics only move while conversions
+are still being attributed, so a dump refetches just the days inside the
+conversion-lag window (plus any days missing from the store) and replaces
+those partitions. Older partitions are never rewritten.
+
+Any window - 30, 90 or 365 days - can then be assembled from the store in
+the same shape as raw/ads/performance.json without further API calls.
+"""
+
+import json
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Days before yesterday whose metrics may still change (conversion lag)
+DEFAULT_LAG_DAYS = 14
+
+
+def _parse_date(value) -> date:
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _date_range(start: date, end: date):
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+class PerformanceStore:
+    """Per-day partitioned performance metrics for one Google Ads customer."""
+
+    def __init__(self, root: Path, customer_id: str, lag_days: int = DEFAULT_LAG_DAYS):
+        self.customer_id = customer_id.replace("-", "")
+        self.root = Path(root) / self.customer_id
+        self.lag_days = lag_days
+
+    def partition_path(self, day) -> Path:
+        return self.root / f"{_parse_date(day).isoformat()}.json"
+
+    def has_partition(self, day) -> bool:
+        return self.partition_path(day).exists()
+
+    def stored_dates(self) -> list:
+        """All dates with a partition, oldest first."""
+        if not self.root.exists():
+            return []
+        return sorted(_parse_date(p.stem) for p in self.root.glob("*.json"))
+
+    def dates_to_fetch(self, start, end, today: date = None) -> list:
+        """Dates in [start, end] that are missing or still inside the lag window."""
+        start, end = _parse_date(start), _parse_date(end)
+        today = today or datetime.utcnow().date()
+        settled_before = today - timedelta(days=self.lag_days)
+        return [
+            day for day in _date_range(start, end)
+            if day >= settled_before or not self.has_partition(day)
+        ]
+
+    def ranges_to_fetch(self, start, end, today: date = None) -> list:
+        """Collapse dates_to_fetch into contiguous (start, end) ISO date pairs."""
+        ranges = []
+        for day in self.dates_to_fetch(start, end, today):
+            if ranges and _parse_date(ranges[-1][1]) + timedelta(days=1) == day:
+                ranges[-1][1] = day.isoformat()
+            else:
+                ranges.append([day.isoformat(), day.isoformat()])
+        return [tuple(r) for r in ranges]
+
+    def write_partitions(self, start, end, by_campaign: list, by_ad_group: list, fetched_at: str):
+        """Replace every partition in [start, end] with the given rows.
+
+        Days in the range with no rows still get an (empty) partition so they
+        count as fetched on the next run.
+        """
+        start, end = _parse_date(start), _parse_date(end)
+        partitions = {
+            day.isoformat(): {"by_campaign": [], "by_ad_group": []}
+            for day in _date_range(start, end)
+        }
+        for row in by_campaign:
+            if row.get("date") in partitions:
+                partitions[row["date"]]["by_campaign"].append(row)
+        for row in by_ad_group:
+            if row.get("date") in partitions:
+                partitions[row["date"]]["by_ad_group"].append(row)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        for day, rows in partitions.items():
+            path = self.partition_path(day)
+            tmp_path = path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"date": day, "fetched_at": fetched_at, **rows}, f, default=str)
+            os.replace(tmp_path, path)
+
+    def read_partition(self, day) -> dict:
+        path = self.partition_path(day)
+        if not path.exists():
+            return {}
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def read_window(self, start, end) -> dict:
+        """Assemble [start, end] into the raw/ads/performance.json shape.
+
+        Rows are ordered by date then campaign / ad group ID, matching the
+        ORDER BY of the original GAQL queries.
+        """
+        start, end = _parse_date(start), _parse_date(end)
+        by_campaign, by_ad_group, missing = [], [], []
+        for day in _date_range(start, end):
+            partition = self.read_partition(day)
+            if not partition:
+                missing.append(day.isoformat())
+                continue
+            by_campaign.extend(sorted(partition.get("by_campaign", []),
+                                      key=lambda r: int(r.get("campaign_id") or 0)))
+            by_ad_group.extend(sorted(partition.get("by_ad_group", []),
+                                      key=lambda r: int(r.get("ad_group_id") or 0)))
+        return {
+            "date_range": {"start": start.isoformat(), "end": end.isoformat()},
+            "by_campaign": by_campaign,
+            "by_ad_group": by_ad_group,
+            "missing_dates": missing,
+        }
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Phase A: Normalize-While-Fetch Pipeline
+
+The dump used to fetch everything, write the raw files, and only then build
+and write every normalized file, holding raw and normalized data in memory
+at the same time. The pipeline instead starts each normalize job (see
+NORMALIZE_JOBS in dump_state.py) on a small side pool as soon as the last of
+its raw inputs has been fetched, writes its normalized files immediately,
+and accumulates record counts and validation errors for the manifest as
+jobs finish.
+
+Large outputs go through append-only record files (core/dump/spool.py):
+Merchant pages stream from the client into raw record files, the Merchant
+normalizers append to normalized record files, and validation errors are
+appended to per-job error files, so memory stays flat as the catalog grows.
+
+Usage:
+    pipeline = NormalizePipeline(NORMALIZE_JOBS, run_normalize_job, expected_raw, write_fn)
+    scheduler = DumpScheduler(on_complete=lambda task, result: pipeline.feed(task.name, result))
+    scheduler.run()
+    normalized, validation_errors = pipeline.finish()
+    manifest["normalize_timings"] = pipeline.manifest_section()
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_NORMALIZE_WORKERS = 2
+
+
+class NormalizePipeline:
+    """Runs normalize jobs as their raw inputs arrive and writes their outputs."""
+
+    def __init__(self, jobs: dict, run_job, expected_raw, write_fn, new_records=None, skip_fn=None,
+                 summarize_fn=None, chain_fn=None, max_workers: int = DEFAULT_NORMALIZE_WORKERS):
+        """
+        Args:
+            jobs: {job name: (raw input names, fn)} (NORMALIZE_JOBS)
+            run_job: Callable(job, raw, new_records) -> (outputs, validation_errors)
+            expected_raw: Raw fetcher names this dump will produce; jobs needing
+                anything else never run
+            write_fn: Callable(rel_path, data) writing one normalized file
+            new_records: Record list factory handed to the jobs
+            skip_fn: Optional callable(job, raw) -> True to skip a ready job
+            summarize_fn: Callable(outputs) -> {path: scalar fields} for the manifest
+            chain_fn: Callable(lists) -> one record sequence (for validation errors)
+            max_workers: Jobs normalized at the same time
+        """
+        self.run_job = run_job
+        self.write_fn = write_fn
+        self.new_records = new_records
+        self.skip_fn = skip_fn
+        self.summarize_fn = summarize_fn
+        self.chain_fn = chain_fn or (lambda lists: [e for errors in lists for e in errors])
+        expected = set(expected_raw)
+        self.waiting = {name: set(inputs) for name, (inputs, _) in jobs.items() if set(inputs) <= expected}
+        self.raw = {}
+        self.normalized = {}
+        self.summary = {}
+        self.error_lists = []
+        self.skipped = []
+        self.timings = {}
+        self._futures = []
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._fetch_finished = None
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="normalize")
+
+    def feed(self, name: str, result):
+        """A raw fetcher finished (scheduler on_complete); start any job it completes."""
+        self.raw[name] = result
+        for job, missing in list(self.waiting.items()):
+            missing.discard(name)
+            if missing:
+                continue
+            del self.waiting[job]
+            if self.skip_fn and self.skip_fn(job, self.raw):
+                self.skipped.append(job)
+                continue
+            self._futures.append(self._pool.submit(self._run, job))
+
+    def _run(self, job: str):
+        started = time.perf_counter()
+        outputs, validation_errors = self.run_job(job, self.raw, self.new_records)
+        for rel_path, data in outputs.items():
+            self.write_fn(rel_path, data)
+        summary = self.summarize_fn(outputs) if self.summarize_fn else {}
+        finished = time.perf_counter()
+        with self._lock:
+            self.normalized.update(outputs)
+            self.summary.update(summary)
+            self.error_lists.append(validation_errors)
+            self.timings[job] = {
+                "start_offset_seconds": round(started - self._started, 3),
+                "end_offset_seconds": round(finished - self._started, 3),
+                "duration_seconds": round(finished - started, 3),
+                "validation_errors": len(validation_errors),
+            }
+
+    def fetch_finished(self):
+        """Mark the end of fetching (for the overlap figures in the manifest)."""
+        self._fetch_finished = time.perf_counter()
+
+    def finish(self) -> tuple:
+        """Wait for every job; returns ({normalized path: data}, validation errors)."""
+        try:
+            for future in self._futures:
+                future.result()
+        finally:
+            self._pool.shutdown(wait=True)
+        return self.normalized, self.chain_fn(self.error_lists)
+
+    def manifest_section(self) -> dict:
+        fetch_end = (self._fetch_finished or time.perf_counter()) - self._started
+        return {
+            "jobs": dict(sorted(self.timings.items())),
+            "skipped": sorted(self.skipped),
+            "finished_during_fetch": sum(1 for t in self.timings.values() if t["end_offset_seconds"] <= fetch_end),
+            "fetch_end_offset_seconds": round(fetch_end, 3),
+        }
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Phase A: Concurrent Fetch Scheduler
+
+Runs the dump's fetchers on a bounded worker pool. Each fetcher declares the
+fetchers it depends on; a fetcher is submitted as soon as all of its
+dependencies have finished, so independent fetchers overlap and total dump
+time approaches the slowest dependency chain instead of the sum of all calls.
+
+A failing fetcher never aborts the run. Its error is recorded and its
+declared default (an empty raw payload) is handed to dependents, matching the
+sequential dump's behavior.
+
+Usage:
+    scheduler = DumpScheduler(max_workers=6)
+    scheduler.add("campaigns", lambda upstream: fetch_campaigns(client))
+    scheduler.add("keywords", lambda upstream: fetch_keywords(client),
+                  deps=["ad_groups"])
+    results = scheduler.run()
+    timings = scheduler.timings()
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+DEFAULT_MAX_WORKERS = 6
+
+
+class FetchTask:
+    """A single named fetcher with its declared upstream dependencies."""
+
+    def __init__(self, name: str, fn, deps: list = None, label: str = None, default=None):
+        self.name = name
+        self.fn = fn
+        self.deps = list(deps or [])
+        self.label = label or name
+        self.default = default
+
+        self.started_at = None
+        self.finished_at = None
+        self.started_utc = None
+        self.finished_utc = None
+        self.worker = None
+        self.error = None
+
+    def default_result(self):
+        """Return the fallback payload used when this fetcher fails."""
+        return self.default() if callable(self.default) else self.default
+
+
+class DumpScheduler:
+    """Dependency-aware scheduler for dump fetchers.
+
+    Fetchers are callables taking one argument: a dict mapping each declared
+    dependency name to that dependency's result.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, on_complete=None):
+        """
+        Args:
+            max_workers: Upper bound on concurrently running fetchers
+            on_complete: Optional callback(task, result) invoked on the
+                scheduler thread after each fetcher finishes (for progress output)
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.on_complete = on_complete
+        self.tasks = {}
+        self.results = {}
+        self.errors = []
+        self._run_started = None
+        self._run_finished = None
+
+    def add(self, name: str, fn, deps: list = None, label: str = None, default=None) -> FetchTask:
+        """Register a fetcher. Dependencies may be registered in any order."""
+        if name in self.tasks:
+            raise ValueError(f"Duplicate fetcher name: {name}")
+        task = FetchTask(name, fn, deps=deps, label=label, default=default)
+        self.tasks[name] = task
+        return task
+
+    def _validate(self):
+        """Reject unknown dependencies and cycles before anything runs."""
+        for task in self.tasks.values():
+            for dep in task.deps:
+                if dep not in self.tasks:
+                    raise ValueError(f"Fetcher '{task.name}' depends on unknown fetcher '{dep}'")
+
+        visiting, done = set(), set()
+
+        def visit(name, path):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+            visiting.add(name)
+            for dep in self.tasks[name].deps:
+                visit(dep, path + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.tasks:
+            visit(name, [])
+
+    def _execute(self, task: FetchTask):
+        """Run one fetcher on a worker thread, capturing timing and errors."""
+        task.worker = threading.current_thread().name
+        task.started_at = time.perf_counter()
+        task.started_utc = datetime.utcnow().isoformat() + "Z"
+        try:
+            upstream = {dep: self.results[dep] for dep in task.deps}
+            return task.fn(upstream)
+        finally:
+            task.finished_at = time.perf_counter()
+            task.finished_utc = datetime.utcnow().isoformat() + "Z"
+
+    def run(self) -> dict:
+        """Run all registered fetchers and return {name: result}."""
+        self._validate()
+        self._run_started = time.perf_counter()
+
+        pending = dict(self.tasks)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fetch") as pool:
+            while pending or running:
+                ready = [
+                    t for t in pending.values()
+                    if all(dep in self.results for dep in t.deps)
+                ]
+                for task in ready:
+                    del pending[task.name]
+                    running[pool.submit(self._execute, task)] = task
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        task.error = str(e)
+                        self.errors.append({"file": task.name, "error": str(e)})
+                        result = task.default_result()
+                    self.results[task.name] = result
+                    if self.on_complete:
+                        self.on_complete(task, result)
+
+        self._run_finished = time.perf_counter()
+        return self.results
+
+    def critical_path(self) -> list:
+        """Return the chain of fetchers that determined total wall time.
+
+        Starts at the last fetcher to finish and walks back through whichever
+        dependency finished last, i.e. the one that gated its start.
+        """
+        finished = [t for t in self.tasks.values() if t.finished_at is not None]
+        if not finished:
+            return []
+
+        path = []
+        task = max(finished, key=lambda t: t.finished_at)
+        while task is not None:
+            path.append(task.name)
+            deps = [self.tasks[d] for d in task.deps if self.tasks[d].finished_at is not None]
+            task = max(deps, key=lambda t: t.finished_at) if deps else None
+        return list(reversed(path))
+
+    def timings(self) -> dict:
+        """Per-fetcher timing summary for _manifest.json."""
+        if self._run_started is None:
+            return {}
+
+        fetchers = {}
+        for task in self.tasks.values():
+            if task.started_at is None:
+                continue
+            fetchers[task.name] = {
+                "deps": task.deps,
+                "started_utc": task.started_utc,
+                "finished_utc": task.finished_utc,
+                "start_offset_seconds": round(task.started_at - self._run_started, 3),
+                "end_offset_seconds": round(task.finished_at - self._run_started, 3),
+                "duration_seconds": round(task.finished_at - task.started_at, 3),
+                "worker": task.worker,
+                "status": "ERROR" if task.error else "OK",
+            }
+
+        path = self.critical_path()
+        return {
+            "max_workers": self.max_workers,
+            "wall_seconds": round((self._run_finished or time.perf_counter()) - self._run_started, 3),
+            "serial_seconds": round(sum(f["duration_seconds"] for f in fetchers.values()), 3),
+            "critical_path": path,
+            "critical_path_seconds": round(sum(fetchers[n]["duration_seconds"] for n in path), 3),
+            "fetchers": fetchers,
+        }
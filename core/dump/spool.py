@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Phase A: On-Disk Record Spools
+
+Fetchers that split a large result into partitions (GSC days, change
+history time slices) stream each partition's rows to a JSONL file in the
+snapshot's checkpoint folder instead of accumulating them in memory:
+
+    _partial/{fetcher}/{partition}.jsonl.tmp   # being fetched
+    _partial/{fetcher}/{partition}.jsonl       # complete (renamed into place)
+
+SpooledRecords then stands in for the fetcher's "records" list and reads the
+completed files back, in order, whenever it is iterated (when the raw file
+is written and when it is normalized). A completed partition file is reused
+by `bin/dump --resume`.
+
+SpooledRecords supports iteration, len() and truth testing only: indexing,
+slicing, sorting or concatenating it raises TypeError rather than quietly
+seeing an empty list. Snapshot files serialize it through
+core/snapshot/codec.dump_json, which streams it as a JSON array.
+
+RecordFile is the append-only form used by the streaming pipeline: Merchant
+fetchers, normalizers and validation append records to it as they are
+produced, so no record list of the size of the account is held in memory.
+"""
+
+import json
+import os
+
+
+class SpooledRecords:
+    """Rows of completed partitions, read back from their JSONL files on iteration."""
+
+    def __init__(self, paths: list, count: int):
+        self.paths = list(paths)
+        self.count = count
+
+    def __iter__(self):
+        for path in self.paths:
+            with open(path, "r") as f:
+                for line in f:
+                    yield json.loads(line)
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+
+class PartitionSpool:
+    """JSONL file of one partition's rows; renamed into place once complete."""
+
+    def __init__(self, spool_dir, key: str):
+        self.path = os.path.join(spool_dir, f"{key}.jsonl")
+        self.tmp_path = self.path + ".tmp"
+
+    def completed_rows(self):
+        """Row count of an already-complete partition (from an earlier attempt), or None."""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r") as f:
+            return sum(1 for _ in f)
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        return open(self.tmp_path, "w")
+
+    def commit(self):
+        os.replace(self.tmp_path, self.path)
+
+    def discard(self):
+        """Drop an unfinished partition (e.g. one that will be refetched in smaller pieces)."""
+        if os.path.exists(self.tmp_path):
+            os.unlink(self.tmp_path)
+
+
+class RecordFile(SpooledRecords):
+    """Append-only JSONL record list.
+
+    Fetchers and normalizers append to it as to a list (append, extend,
+    clear); records go straight to disk and are read back whenever it is
+    iterated.
+    """
+
+    def __init__(self, path):
+        super().__init__([str(path)], 0)
+        self.path = str(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, "w")
+
+    def append(self, record):
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self.count += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def clear(self):
+        """Drop every record (e.g. a paginated call restarting from its first page)."""
+        self._file.seek(0)
+        self._file.truncate()
+        self.count = 0
+
+    def flush(self):
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __iter__(self):
+        self.flush()
+        return super().__iter__()
+
+
+def chain_records(lists: list):
+    """One record sequence over several lists (streamed from disk when all are RecordFiles)."""
+    if lists and all(isinstance(records, RecordFile) for records in lists):
+        for records in lists:
+            records.flush()
+        return SpooledRecords([records.path for records in lists], sum(len(records) for records in lists))
+    return [record for records in lists for record in records]
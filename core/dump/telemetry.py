@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Phase A: Per-Fetcher and Per-Query Dump Telemetry
+
+Every API call made by the dump clients (GAQL search / searchStream,
+Merchant Center list_* / account status, GSC) is timed as one "call" made of
+one or more HTTP "pages". For each call we record wall time, page count,
+response bytes, row count and transport retries, attributed to the fetcher
+running on the current thread and to the query itself.
+
+Aggregates go into _manifest.json under "telemetry"; with a trace path, every
+page and call is also appended to a JSONL trace file as it happens.
+
+Usage:
+    telemetry = Telemetry(trace_path=snapshot_dir / "_trace.jsonl")
+    transport.on_retry = telemetry.note_retry
+    telemetry.instrument(scheduler)          # attribute calls to fetchers
+    ...
+    with telemetry.call("google_ads", "search", query) as call:
+        ...
+        call.page(num_bytes, num_rows, seconds)
+    ...
+    manifest["telemetry"] = telemetry.summary(fetch_timings)
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+FROM_PATTERN = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+DATE_PATTERN = re.compile(r"'\d{4}-\d{2}-\d{2}[^']*'")
+
+
+def query_key(api: str, operation: str, query: str = None) -> str:
+    """Stable label for a query: resource name plus a short hash of its text.
+
+    Date literals are masked so the same query groups together across the
+    performance store's per-range fetches.
+    """
+    if not query:
+        return f"{api}.{operation}"
+    text = DATE_PATTERN.sub("'<date>'", " ".join(query.split()))
+    match = FROM_PATTERN.search(text)
+    resource = match.group(1) if match else operation
+    return f"{resource}#{hashlib.sha1(text.encode('utf-8')).hexdigest()[:8]}"
+
+
+def _empty_stats() -> dict:
+    return {"calls": 0, "pages": 0, "bytes": 0, "rows": 0, "retries": 0, "errors": 0, "seconds": 0.0,
+            "max_call_seconds": 0.0}
+
+
+class CallStats:
+    """Counters for one in-flight API call."""
+
+    def __init__(self, telemetry, fetcher: str, api: str, operation: str, key: str):
+        self.telemetry = telemetry
+        self.fetcher = fetcher
+        self.api = api
+        self.operation = operation
+        self.key = key
+        self.pages = 0
+        self.bytes = 0
+        self.rows = 0
+        self.retries = 0
+
+    def page(self, num_bytes: int, num_rows: int, seconds: float):
+        """Record one HTTP page of this call."""
+        self.pages += 1
+        self.bytes += num_bytes
+        self.rows += num_rows
+        self.telemetry.trace({
+            "event": "page", "fetcher": self.fetcher, "api": self.api, "operation": self.operation,
+            "query": self.key, "page": self.pages, "bytes": num_bytes, "rows": num_rows,
+            "seconds": round(seconds, 4),
+        })
+
+
+class Telemetry:
+    """Thread-safe collector for dump API call metrics."""
+
+    def __init__(self, trace_path=None):
+        self.trace_path = trace_path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._trace_file = None
+        self.fetchers = {}
+        self.queries = {}
+
+    # -- attribution --------------------------------------------------------
+
+    def bind(self, fetcher: str, fn):
+        """Wrap a scheduler task fn so calls it makes are attributed to `fetcher`."""
+        def run(upstream):
+            previous = getattr(self._local, "fetcher", None)
+            self._local.fetcher = fetcher
+            try:
+                return fn(upstream)
+            finally:
+                self._local.fetcher = previous
+        return run
+
+    def current_fetcher(self):
+        """Fetcher the current thread's calls are attributed to (for handing to worker threads)."""
+        return getattr(self._local, "fetcher", None)
+
+    def instrument(self, scheduler):
+        """Bind every task registered on a DumpScheduler to its own name."""
+        for name, task in scheduler.tasks.items():
+            task.fn = self.bind(name, task.fn)
+
+    # -- recording ----------------------------------------------------------
+
+    @contextmanager
+    def call(self, api: str, operation: str, query: str = None):
+        """Time one API call; yields a CallStats for page-level counters."""
+        fetcher = getattr(self._local, "fetcher", None) or "(unattributed)"
+        stats = CallStats(self, fetcher, api, operation, query_key(api, operation, query))
+        previous = getattr(self._local, "call", None)
+        self._local.call = stats
+        started = time.perf_counter()
+        error = None
+        try:
+            yield stats
+        except BaseException as e:
+            error = str(e)[:200]
+            raise
+        finally:
+            seconds = time.perf_counter() - started
+            self._local.call = previous
+            self._record(stats, query, seconds, error)
+
+    def note_retry(self, *args, **kwargs):
+        """HttpTransport.on_retry hook: count a retry against the current call."""
+        stats = getattr(self._local, "call", None)
+        if stats is not None:
+            stats.retries += 1
+
+    def _record(self, stats: CallStats, query: str, seconds: float, error: str):
+        with self._lock:
+            targets = [self.fetchers.setdefault(stats.fetcher, _empty_stats())]
+            entry = self.queries.get(stats.key)
+            if entry is None:
+                entry = self.queries[stats.key] = {
+                    "fetcher": stats.fetcher,
+                    "api": stats.api,
+                    "operation": stats.operation,
+                    "query": " ".join(query.split()) if query else None,
+                    **_empty_stats(),
+                }
+            targets.append(entry)
+            for t in targets:
+                t["calls"] += 1
+                t["pages"] += stats.pages
+                t["bytes"] += stats.bytes
+                t["rows"] += stats.rows
+                t["retries"] += stats.retries
+                t["errors"] += 1 if error else 0
+                t["seconds"] += seconds
+                t["max_call_seconds"] = max(t["max_call_seconds"], seconds)
+
+        self.trace({
+            "event": "call", "fetcher": stats.fetcher, "api": stats.api, "operation": stats.operation,
+            "query": stats.key, "pages": stats.pages, "bytes": stats.bytes, "rows": stats.rows,
+            "retries": stats.retries, "seconds": round(seconds, 4), "error": error,
+        })
+
+    def trace(self, event: dict):
+        """Append one event to the JSONL trace file (if enabled)."""
+        if not self.trace_path:
+            return
+        line = json.dumps({"ts": datetime.utcnow().isoformat() + "Z", **event}) + "\n"
+        with self._lock:
+            if self._trace_file is None:
+                self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+                self._trace_file = open(self.trace_path, "a", encoding="utf-8")
+            self._trace_file.write(line)
+
+    def close(self):
+        with self._lock:
+            if self._trace_file is not None:
+                self._trace_file.close()
+                self._trace_file = None
+
+    # -- reporting ----------------------------------------------------------
+
+    def summary(self, fetch_timings: dict = None) -> dict:
+        """Aggregates for _manifest.json, slowest first.
+
+        fetch_timings (from DumpScheduler.timings) supplies each fetcher's
+        wall time, which includes work outside API calls.
+        """
+        durations = {name: f["duration_seconds"] for name, f in (fetch_timings or {}).get("fetchers", {}).items()}
+
+        def rounded(stats):
+            return {**stats, "seconds": round(stats["seconds"], 3),
+                    "max_call_seconds": round(stats["max_call_seconds"], 3)}
+
+        with self._lock:
+            fetchers = {
+                name: {"wall_seconds": durations.get(name), "api_seconds": round(s["seconds"], 3),
+                       **{k: v for k, v in rounded(s).items() if k != "seconds"}}
+                for name, s in self.fetchers.items()
+            }
+            queries = {key: rounded(q) for key, q in self.queries.items()}
+
+        totals = _empty_stats()
+        for s in fetchers.values():
+            for k in ("calls", "pages", "bytes", "rows", "retries", "errors"):
+                totals[k] += s[k]
+        totals["seconds"] = round(sum(q["seconds"] for q in queries.values()), 3)
+        del totals["max_call_seconds"]
+
+        return {
+            "totals": totals,
+            "fetchers": dict(sorted(fetchers.items(), key=lambda i: i[1]["api_seconds"], reverse=True)),
+            "queries": dict(sorted(queries.items(), key=lambda i: i[1]["seconds"], reverse=True)),
+            "trace_file": self.trace_path.name if self.trace_path else None,
+        }
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Phase A: Shared HTTP Transport for Dump API Clients
+
+One pooled keep-alive requests.Session per API host, shared by the Google
+Ads, Merchant Center and Search Console clients, so paginated and concurrent
+fetches reuse warm TLS connections instead of handshaking on every call.
+
+Every request gets a (connect, read) timeout and is retried on connection
+errors, 429 and 5xx responses with capped exponential backoff plus full
+jitter. A server-supplied Retry-After header takes precedence over the
+computed delay.
+
+All dump calls are reads, so POST requests (GAQL search, GSC query) are safe
+to retry. Do NOT use this transport for mutations.
+
+With a RateGovernor attached, every attempt is paced by per-API and
+per-customer token buckets and an adaptive concurrency limit, and quota
+errors that some APIs report as 403 are retried like 429.
+
+Configuration (environment, all optional):
+    DUMP_HTTP_POOL_SIZE       Max connections kept per host (default: 10)
+    DUMP_HTTP_MAX_RETRIES     Retries after the first attempt (default: 5)
+    DUMP_HTTP_BACKOFF_BASE    First backoff delay in seconds (default: 0.5)
+    DUMP_HTTP_BACKOFF_MAX     Backoff ceiling in seconds (default: 30)
+    DUMP_HTTP_CONNECT_TIMEOUT Connect timeout in seconds (default: 10)
+    DUMP_HTTP_READ_TIMEOUT    Read timeout in seconds (default: 120)
+    DUMP_HTTP_MAX_IN_FLIGHT   Cap on requests awaiting a response across all
+                              threads sharing the transport (default: no cap;
+                              multi-account dumps default to 2 x --workers)
+"""
+
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.dump.governor import quota_error
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _env_number(name: str, default, cast=float):
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return cast(value)
+
+
+def parse_retry_after(value: str):
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HttpTransport:
+    """Pooled, retrying HTTP transport shared by the dump API clients."""
+
+    def __init__(
+        self,
+        pool_size: int = None,
+        max_retries: int = None,
+        backoff_base: float = None,
+        backoff_max: float = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+        max_in_flight: int = None,
+        governor=None,
+    ):
+        self.pool_size = pool_size or _env_number("DUMP_HTTP_POOL_SIZE", 10, int)
+        self.max_retries = max_retries if max_retries is not None else _env_number("DUMP_HTTP_MAX_RETRIES", 5, int)
+        self.backoff_base = backoff_base or _env_number("DUMP_HTTP_BACKOFF_BASE", 0.5)
+        self.backoff_max = backoff_max or _env_number("DUMP_HTTP_BACKOFF_MAX", 30.0)
+        self.timeout = (
+            connect_timeout or _env_number("DUMP_HTTP_CONNECT_TIMEOUT", 10.0),
+            read_timeout or _env_number("DUMP_HTTP_READ_TIMEOUT", 120.0),
+        )
+        self.max_in_flight = max_in_flight or _env_number("DUMP_HTTP_MAX_IN_FLIGHT", None, int)
+        self._in_flight = threading.BoundedSemaphore(self.max_in_flight) if self.max_in_flight else None
+        # Optional RateGovernor (core/dump/governor.py) pacing every attempt
+        self.governor = governor
+        self._sessions = {}
+        self._lock = threading.Lock()
+        # Optional callback(method, url, attempt, reason) invoked before each retry
+        self.on_retry = None
+
+    def session_for(self, url: str) -> requests.Session:
+        """Return the keep-alive session for the URL's host, creating it once."""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                # Retries are handled here, not by urllib3, so Retry-After
+                # and jitter apply uniformly to every client.
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+                session.mount(host, adapter)
+                self._sessions[host] = session
+            return session
+
+    def backoff_delay(self, attempt: int, response: requests.Response = None) -> float:
+        """Delay before retry number `attempt` (1-based)."""
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None:
+                # Google Ads RESOURCE_EXHAUSTED carries its delay in the body
+                retry_after = quota_error(response)[1]
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with pooling, timeout and retry.
+
+        Returns the final response (which may still be an error status once
+        retries are exhausted); callers keep their own status handling.
+        Connection errors are re-raised after the last attempt.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.session_for(url)
+        attempt = 0
+
+        while True:
+            try:
+                response = self._send(session, method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                if self.on_retry:
+                    self.on_retry(method, url, attempt, type(e).__name__)
+                time.sleep(self.backoff_delay(attempt))
+                continue
+
+            retryable = response.status_code in RETRYABLE_STATUS_CODES or (
+                # Quota errors some APIs report as 403 are worth waiting out
+                self.governor is not None and response.status_code == 403 and quota_error(response)[0]
+            )
+            if not retryable or attempt >= self.max_retries:
+                return response
+
+            attempt += 1
+            if self.on_retry:
+                self.on_retry(method, url, attempt, f"HTTP {response.status_code}")
+            delay = self.backoff_delay(attempt, response)
+            response.close()
+            time.sleep(delay)
+
+    def _send(self, session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+        """One attempt, paced by the governor and holding an in-flight slot
+        until the response arrives (its headers, for streamed requests).
+
+        Neither is held during backoff sleeps, so a throttled request never
+        blocks other threads from using the shared limits.
+        """
+        if self.governor is None:
+            return self._send_once(session, method, url, **kwargs)
+        with self.governor.request(url) as lease:
+            response = self._send_once(session, method, url, **kwargs)
+            if lease is not None:
+                lease.observe(response)
+            return response
+
+    def _send_once(self, session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+        if self._in_flight is None:
+            return session.request(method, url, **kwargs)
+        with self._in_flight:
+            return session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        """Close all pooled sessions."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_default_transport = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> HttpTransport:
+    """Process-wide transport used when a client is not given one explicitly."""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
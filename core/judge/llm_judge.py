@@ -12,6 +12,8 @@ import os
 from pathlib import Path
 from typing import Optional
 
+from core.snapshot.entity_index import index_totals
+
 # Feature flag
 LLM_JUDGE_ENABLED = os.getenv("LLM_JUDGE_ENABLED", "false").lower() == "true"
 LLM_JUDGE_MODEL = os.getenv("LLM_JUDGE_MODEL", "claude-3-5-sonnet-20241022")
@@ -70,15 +72,12 @@ def run_llm_judge(plan_path: str, snapshot_path: str) -> dict:
         response["notes"].append(f"Failed to load snapshot manifest: {e}")
         manifest_data = {}
 
-    # Load snapshot index (optional)
-    index_path = snapshot_path / "_index.json"
+    # Load snapshot index totals (optional)
     index_data = {}
-    if index_path.exists():
-        try:
-            with open(index_path) as f:
-                index_data = json.load(f)
-        except Exception:
-            pass
+    try:
+        index_data = {"totals": index_totals(snapshot_path)}
+    except Exception:
+        pass
 
     # Build evidence bundle for LLM
     evidence = _build_evidence_bundle(plan_data, manifest_data, index_data)
@@ -117,11 +116,12 @@ def _build_evidence_bundle(plan_data: dict, manifest_data: dict, index_data: dic
 
     # Extract entity counts from index
     entity_counts = {}
-    if index_data:
+    if index_data.get("totals"):
+        totals = index_data["totals"]
         entity_counts = {
-            "campaigns": len(index_data.get("campaigns", [])),
-            "ad_groups": len(index_data.get("ad_groups", [])),
-            "keywords": len(index_data.get("keywords", []))
+            "campaigns": totals.get("campaigns", 0),
+            "ad_groups": totals.get("ad_groups", 0),
+            "keywords": totals.get("keywords", 0)
         }
 
     return {
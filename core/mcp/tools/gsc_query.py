@@ -20,11 +20,12 @@ Returns:
 - If snapshot missing or no GSC data, returns NOT_FOUND status
 """
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from core.snapshot.store import SnapshotStore
+
 
 def gsc_query(params: dict[str, Any]) -> dict[str, Any]:
     """
@@ -54,7 +55,11 @@ def gsc_query(params: dict[str, Any]) -> dict[str, Any]:
     # Resolve "latest" to actual snapshot ID
     if snapshot_id == "latest":
         try:
-            snapshot_dirs = sorted([d for d in snapshots_dir.iterdir() if d.is_dir()], reverse=True)
+            # Same rule as find_latest_snapshot in report/plan: timestamped folders with a
+            # manifest (skips snapshots/customers, snapshots/runs and in-progress dumps)
+            snapshot_dirs = sorted([d for d in snapshots_dir.iterdir()
+                                    if d.is_dir() and d.name[0].isdigit() and (d / "_manifest.json").exists()],
+                                   reverse=True)
             if not snapshot_dirs:
                 return {
                     "status": "NOT_FOUND",
@@ -83,9 +88,10 @@ def gsc_query(params: dict[str, Any]) -> dict[str, Any]:
 
     # Load requested data
     try:
+        store = SnapshotStore(snapshots_dir / snapshot_id, required_files=[])
+
         if query_type == "summary":
-            summary_path = snapshot_dir / "summary.json"
-            if not summary_path.exists():
+            if not store.exists("normalized/gsc/summary.json"):
                 return {
                     "status": "NOT_FOUND",
                     "error": "summary.json not found",
@@ -93,8 +99,7 @@ def gsc_query(params: dict[str, Any]) -> dict[str, Any]:
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
 
-            with open(summary_path) as f:
-                data = json.load(f)
+            data = store.gsc_summary
 
             return {
                 "status": "OK",
@@ -105,8 +110,7 @@ def gsc_query(params: dict[str, Any]) -> dict[str, Any]:
             }
 
         elif query_type == "queries":
-            queries_path = snapshot_dir / "queries.json"
-            if not queries_path.exists():
+            if not store.exists("normalized/gsc/queries.json"):
                 return {
                     "status": "NOT_FOUND",
                     "error": "queries.json not found",
@@ -114,10 +118,7 @@ def gsc_query(params: dict[str, Any]) -> dict[str, Any]:
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
 
-            with open(queries_path) as f:
-                data = json.load(f)
-
-            records = data.get("records", [])
+            records = store.gsc_queries.get("records", [])
 
             # Apply filter if specified
             if filter_query:
@@ -139,8 +140,7 @@ def gsc_query(params: dict[str, Any]) -> dict[str, Any]:
             }
 
         elif query_type == "pages":
-            pages_path = snapshot_dir / "pages.json"
-            if not pages_path.exists():
+            if not store.exists("normalized/gsc/pages.json"):
                 return {
                     "status": "NOT_FOUND",
                     "error": "pages.json not found",
@@ -148,10 +148,7 @@ def gsc_query(params: dict[str, Any]) -> dict[str, Any]:
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
 
-            with open(pages_path) as f:
-                data = json.load(f)
-
-            records = data.get("records", [])
+            records = store.gsc_pages.get("records", [])
 
             # Apply filter if specified (filter on page URL)
             if filter_query:
@@ -33,12 +33,17 @@ from typing import Any
 SCRIPT_DIR = Path(__file__).parent
 CORE_DIR = SCRIPT_DIR.parent
 PROJECT_ROOT = CORE_DIR.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.snapshot.codec import open_snapshot_file, read_json
+from core.snapshot.store import SnapshotStore
+
 SNAPSHOTS_DIR = PROJECT_ROOT / "snapshots"
 PLANS_DIR = PROJECT_ROOT / "plans"
 RUNS_DIR = PLANS_DIR / "runs"
 CONFIGS_DIR = CORE_DIR / "configs"
 
-# Campaign IDs (from _index.json convention)
+# Campaign IDs (from _index.bin convention)
 BRANDED_CAMPAIGN_ID = "20958985895"
 PMAX_CAMPAIGN_ID = "20815709270"
 
@@ -116,23 +121,16 @@ def load_json(path: Path) -> dict:
     """Load JSON file, return empty dict if not found."""
     if not path.exists():
         return {}
-    with open(path, "r") as f:
-        return json.load(f)
-
-
-def load_json_required(path: Path) -> dict:
-    """Load JSON file, raise error if not found."""
-    if not path.exists():
-        raise FileNotFoundError(f"Required file not found: {path}")
-    with open(path, "r") as f:
-        return json.load(f)
+    return read_json(path)
 
 
 def find_latest_snapshot() -> Path:
     """Find the most recent snapshot folder."""
     if not SNAPSHOTS_DIR.exists():
         raise FileNotFoundError(f"Snapshots directory not found: {SNAPSHOTS_DIR}")
-    snapshots = [d for d in SNAPSHOTS_DIR.iterdir() if d.is_dir() and d.name[0].isdigit()]
+    # Skip in-progress or interrupted dumps (no manifest until the snapshot is complete)
+    snapshots = [d for d in SNAPSHOTS_DIR.iterdir()
+                 if d.is_dir() and d.name[0].isdigit() and (d / "_manifest.json").exists()]
     if not snapshots:
         raise FileNotFoundError("No snapshot folders found")
     snapshots.sort(key=lambda x: x.name, reverse=True)
@@ -179,66 +177,8 @@ def risk_to_numeric(level: str) -> int:
 # =============================================================================
 
 
-class SnapshotLoader:
-    """Loads all data from a snapshot folder."""
-
-    REQUIRED_FILES = [
-        "_manifest.json",
-        "normalized/ads/campaigns.json",
-        "normalized/ads/keywords.json",
-    ]
-
-    def __init__(self, snapshot_path: Path):
-        self.snapshot_path = snapshot_path
-        self.snapshot_id = snapshot_path.name
-
-        if not self.snapshot_path.exists():
-            raise FileNotFoundError(f"Snapshot not found: {self.snapshot_path}")
-
-        # Check required files
-        missing = []
-        for rel_path in self.REQUIRED_FILES:
-            if not (self.snapshot_path / rel_path).exists():
-                missing.append(rel_path)
-        if missing:
-            raise FileNotFoundError(
-                f"Missing required files:\n" + "\n".join(f"  - {f}" for f in missing)
-            )
-
-        # Load all files
-        self.manifest = load_json_required(self.snapshot_path / "_manifest.json")
-        self.index = load_json(self.snapshot_path / "_index.json")
-
-        # Ads data
-        self.campaigns = load_json(self.snapshot_path / "normalized/ads/campaigns.json")
-        self.ad_groups = load_json(self.snapshot_path / "normalized/ads/ad_groups.json")
-        self.keywords = load_json(self.snapshot_path / "normalized/ads/keywords.json")
-        self.negatives = load_json(self.snapshot_path / "normalized/ads/negatives.json")
-        self.ads = load_json(self.snapshot_path / "normalized/ads/ads.json")
-        self.assets = load_json(self.snapshot_path / "normalized/ads/assets.json")
-
-        # PMax data
-        self.pmax_campaigns = load_json(self.snapshot_path / "normalized/pmax/campaigns.json")
-        self.asset_groups = load_json(self.snapshot_path / "normalized/pmax/asset_groups.json")
-
-        # Merchant data
-        self.merchant_products = load_json(self.snapshot_path / "normalized/merchant/products.json")
-        self.merchant_status = load_json(self.snapshot_path / "normalized/merchant/product_status.json")
-
-    def get_campaign_by_id(self, campaign_id: str) -> dict:
-        """Get campaign info by ID."""
-        for c in self.campaigns.get("records", []):
-            if str(c.get("id")) == str(campaign_id):
-                return c
-        for c in self.pmax_campaigns.get("records", []):
-            if str(c.get("id")) == str(campaign_id):
-                return c
-        return {}
-
-    def get_campaign_name(self, campaign_id: str) -> str:
-        """Get campaign name from index."""
-        by_id = self.index.get("campaigns", {}).get("by_id", {})
-        return by_id.get(str(campaign_id), "Unknown")
+class SnapshotLoader(SnapshotStore):
+    """Snapshot files the planner reads, parsed on first use (see core/snapshot/store.py)."""
 
 
 # =============================================================================
@@ -970,7 +910,7 @@ class PlanBuilder:
         try:
             brand_excl_path = self.loader.snapshot_dir / "normalized" / "pmax" / "brand_exclusions.json"
             if brand_excl_path.exists():
-                with open(brand_excl_path) as f:
+                with open_snapshot_file(brand_excl_path) as f:
                     brand_excl_data = json.load(f)
                     for crit in brand_excl_data.get("pmax_negative_criteria", []):
                         cid = str(crit.get("campaign_id", ""))
@@ -1219,6 +1159,7 @@ REQUIRED (one of):
 OPTIONAL:
     --ruleset <name>     Rule set to apply: safety|strategy|all (default: safety)
     --max-ops <n>        Maximum operations to generate (default: 50)
+    --load-trace         Print which snapshot files were parsed, with time and size
 
 Examples:
     python plans/plan_changes.py --latest
@@ -1235,6 +1176,7 @@ def parse_args():
     use_latest = False
     ruleset = "safety"
     max_ops = 50
+    load_trace = False
 
     i = 1
     while i < len(sys.argv):
@@ -1251,6 +1193,9 @@ def parse_args():
         elif arg == "--max-ops" and i + 1 < len(sys.argv):
             max_ops = int(sys.argv[i + 1])
             i += 2
+        elif arg == "--load-trace":
+            load_trace = True
+            i += 1
         elif arg in ("--help", "-h"):
             print_usage()
             sys.exit(0)
@@ -1259,7 +1204,7 @@ def parse_args():
             print_usage()
             sys.exit(1)
 
-    return snapshot_path, use_latest, ruleset, max_ops
+    return snapshot_path, use_latest, ruleset, max_ops, load_trace
 
 
 def main():
@@ -1269,7 +1214,7 @@ def main():
     print()
 
     # Parse args
-    snapshot_path, use_latest, ruleset, max_ops = parse_args()
+    snapshot_path, use_latest, ruleset, max_ops, load_trace = parse_args()
 
     # Validate: must have --snapshot or --latest
     if not snapshot_path and not use_latest:
@@ -1419,6 +1364,12 @@ def main():
             print(f"  ... and {len(builder.findings) - 5} more")
         print()
 
+    if load_trace:
+        print("Snapshot files parsed:")
+        for line in loader.trace_lines():
+            print(line)
+        print()
+
     print("Done.")
 
 
@@ -16,8 +16,13 @@ Usage:
 REQUIRES explicit --snapshot or --latest flag. Will not silently default.
 """
 
+import copy
 import json
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from collections import defaultdict
@@ -31,6 +36,11 @@ sys.path.insert(0, str(PROJECT_ROOT))
 # Phase B3.2: Google Recommendations Truth Signals
 from core.report.truth_signals_google import extract_truth_signals
 from core.report.render_truth_signals import render_truth_signals_section
+from core.report.markdown_html import MarkdownToHtml
+from core.report.perf_cube import PerformanceCube
+from core.report.section_cache import SectionCache
+from core.snapshot.entity_index import INDEX_FILE
+from core.snapshot.store import FILES as STORE_FILES, SnapshotStore
 
 # =============================================================================
 # CONFIGURATION
@@ -42,7 +52,7 @@ REPORTS_DIR = PROJECT_ROOT / "reports"
 TEMPLATE_PATH = SCRIPT_DIR / "TEMPLATE.md"
 OUT_OF_BAND_LEDGER_PATH = PROJECT_ROOT / "diag" / "out_of_band_ledger.jsonl"
 
-# Campaign IDs for key campaigns (from _index.json)
+# Campaign IDs for key campaigns (from _index.bin)
 BRANDED_CAMPAIGN_ID = "20958985895"
 PMAX_CAMPAIGN_ID = "20815709270"
 OFFENSIVE_CAMPAIGN_ID = "23445812072"
@@ -86,7 +96,9 @@ def find_latest_snapshot() -> Path:
     if not SNAPSHOTS_DIR.exists():
         raise FileNotFoundError(f"Snapshots directory not found: {SNAPSHOTS_DIR}")
 
-    snapshots = [d for d in SNAPSHOTS_DIR.iterdir() if d.is_dir() and d.name[0].isdigit()]
+    # Skip in-progress or interrupted dumps (no manifest until the snapshot is complete)
+    snapshots = [d for d in SNAPSHOTS_DIR.iterdir()
+                 if d.is_dir() and d.name[0].isdigit() and (d / "_manifest.json").exists()]
     if not snapshots:
         raise FileNotFoundError("No snapshot folders found")
 
@@ -95,22 +107,6 @@ def find_latest_snapshot() -> Path:
     return snapshots[0]
 
 
-def load_json(path: Path) -> dict:
-    """Load JSON file, return empty dict if not found."""
-    if not path.exists():
-        return {}
-    with open(path, "r") as f:
-        return json.load(f)
-
-
-def load_json_required(path: Path) -> dict:
-    """Load JSON file, raise error if not found."""
-    if not path.exists():
-        raise FileNotFoundError(f"Required file not found: {path}")
-    with open(path, "r") as f:
-        return json.load(f)
-
-
 def fmt_currency(value) -> str:
     """Format currency value."""
     if value is None:
@@ -195,92 +191,38 @@ def load_out_of_band_ledger(max_entries: int = 10) -> list:
 # =============================================================================
 
 
-class SnapshotLoader:
-    """Loads all data from a snapshot folder."""
+class SnapshotLoader(SnapshotStore):
+    """Snapshot files the report reads, parsed on first use (see core/snapshot/store.py)."""
 
-    REQUIRED_FILES = [
-        "_manifest.json",
+    # Files the report reads; missing ones are listed as data gaps
+    REPORT_FILES = [
         "normalized/ads/campaigns.json",
+        "normalized/ads/ad_groups.json",
         "normalized/ads/keywords.json",
+        "normalized/ads/negatives.json",
+        "normalized/ads/ads.json",
+        "normalized/ads/assets.json",
+        "normalized/ads/change_history.json",
+        "normalized/ads/performance.json",
+        "normalized/pmax/campaigns.json",
+        "normalized/pmax/asset_groups.json",
+        "normalized/pmax/listing_groups.json",
+        "normalized/merchant/products.json",
+        "normalized/merchant/product_status.json",
+        "normalized/gsc/queries.json",
+        "normalized/gsc/pages.json",
+        "normalized/gsc/summary.json",
     ]
 
     def __init__(self, snapshot_path: Path):
-        self.snapshot_path = snapshot_path
-        self.snapshot_id = snapshot_path.name
-        self.data_gaps = []
-        self.missing_files = []
-
-        if not self.snapshot_path.exists():
-            raise FileNotFoundError(f"Snapshot not found: {self.snapshot_path}")
-
-        # Check required files
-        for rel_path in self.REQUIRED_FILES:
-            full_path = self.snapshot_path / rel_path
-            if not full_path.exists():
-                self.missing_files.append(rel_path)
-
-        if self.missing_files:
-            raise FileNotFoundError(
-                f"Missing required files in snapshot:\n" +
-                "\n".join(f"  - {f}" for f in self.missing_files)
-            )
+        super().__init__(snapshot_path)
+        self.data_gaps = [f"File not found: {p}" for p in self.REPORT_FILES if not self.exists(p)]
 
-        # Load all files
-        self.manifest = self._load_required("_manifest.json")
-        self.index = self._load("_index.json")
-
-        # Ads data
-        self.campaigns = self._load("normalized/ads/campaigns.json")
-        self.ad_groups = self._load("normalized/ads/ad_groups.json")
-        self.keywords = self._load("normalized/ads/keywords.json")
-        self.negatives = self._load("normalized/ads/negatives.json")
-        self.ads = self._load("normalized/ads/ads.json")
-        self.assets = self._load("normalized/ads/assets.json")
-        self.change_history = self._load("normalized/ads/change_history.json")
-        self.performance = self._load("normalized/ads/performance.json")
-
-        # PMax data
-        self.pmax_campaigns = self._load("normalized/pmax/campaigns.json")
-        self.asset_groups = self._load("normalized/pmax/asset_groups.json")
-        self.listing_groups = self._load("normalized/pmax/listing_groups.json")
-
-        # Merchant data
-        self.merchant_products = self._load("normalized/merchant/products.json")
-        self.merchant_status = self._load("normalized/merchant/product_status.json")
-
-        # GSC data (Phase D2)
-        self.gsc_queries = self._load("normalized/gsc/queries.json")
-        self.gsc_pages = self._load("normalized/gsc/pages.json")
-        self.gsc_summary = self._load("normalized/gsc/summary.json")
-        self.gsc_raw_analytics = self._load("raw/gsc/search_analytics.json")
-
-    def _load(self, rel_path: str) -> dict:
-        """Load a JSON file from snapshot."""
-        path = self.snapshot_path / rel_path
-        if not path.exists():
-            self.data_gaps.append(f"File not found: {rel_path}")
-            return {}
-        return load_json(path)
-
-    def _load_required(self, rel_path: str) -> dict:
-        """Load a required JSON file from snapshot."""
-        path = self.snapshot_path / rel_path
-        return load_json_required(path)
-
-    def get_campaign_by_id(self, campaign_id: str) -> dict:
-        """Get campaign info by ID."""
-        for c in self.campaigns.get("records", []):
-            if str(c.get("id")) == str(campaign_id):
-                return c
-        for c in self.pmax_campaigns.get("records", []):
-            if str(c.get("id")) == str(campaign_id):
-                return c
-        return {}
-
-    def get_campaign_name(self, campaign_id: str) -> str:
-        """Get campaign name from index."""
-        by_id = self.index.get("campaigns", {}).get("by_id", {})
-        return by_id.get(str(campaign_id), "Unknown")
+        # GSC rollups are written at normalize time (see core/dump/gsc_rollups.py)
+        if self.gsc_summary.get("site_url"):
+            for rel_path in ("normalized/gsc/devices.json", "normalized/gsc/countries.json"):
+                if not self.exists(rel_path):
+                    self.data_gaps.append(f"File not found: {rel_path} (normalized before GSC rollups; run bin/normalize)")
 
 
 # =============================================================================
@@ -448,33 +390,138 @@ class ConfidenceComputer:
 class MetricsComputer:
     """Computes all metrics from snapshot data."""
 
-    def __init__(self, loader: SnapshotLoader, confidence: ConfidenceComputer, deep_audit: bool = False):
+    # Sections in merge order -> (inputs, attributes the section sets besides placeholders).
+    # Inputs are SnapshotStore attributes ("index" is _index.bin), other snapshot paths,
+    # UPPERCASE config constants and lowercase MetricsComputer attributes (a list of paths
+    # is hashed as files); they key the section cache (core/report/section_cache.py).
+    # None: reads the clock, never cached. Sections are independent: each writes only its
+    # own placeholders and attributes, so they can run concurrently (--jobs).
+    SECTIONS = {
+        "provenance": (["manifest"], ()),
+        "out_of_band_changes": (["manifest", OUT_OF_BAND_LEDGER_PATH], ()),
+        "confidence_section": None,
+        "metadata": None,
+        "executive_summary": (["campaigns", "pmax_campaigns", "performance", "merchant_products",
+                               "EQUIPMENT_BRANDS"], ()),
+        "campaign_overview": (["campaigns", "pmax_campaigns", "manifest",
+                               "BRANDED_CAMPAIGN_ID", "PMAX_CAMPAIGN_ID", "OFFENSIVE_CAMPAIGN_ID"], ()),
+        "performance_tables": (["performance", "index", "campaigns", "pmax_campaigns"], ()),
+        "brand_protection": (["campaigns", "pmax_campaigns", "keywords", "performance", "change_history",
+                              "manifest", "BRANDED_CAMPAIGN_ID", "BCD_BRAND_TERMS", "BRAND_CPC_THRESHOLD",
+                              "deep_audit"],
+                             ("fail_triggers", "warn_triggers", "brand_protection_triggers")),
+        "merchant_center": (["merchant_products", "EQUIPMENT_BRANDS"], ()),
+        "gsc_section": (["gsc_summary", "gsc_queries", "gsc_pages", "gsc_devices", "gsc_countries",
+                         "performance", "BCD_BRAND_TERMS"], ("gsc_data",)),
+        "bidding_status": (["campaigns", "pmax_campaigns",
+                            "BRANDED_CAMPAIGN_ID", "PMAX_CAMPAIGN_ID", "OFFENSIVE_CAMPAIGN_ID"], ()),
+        "budget_intelligence": (["campaigns", "pmax_campaigns", "performance", "listing_groups",
+                                 "merchant_products", "PMAX_CAMPAIGN_ID", "EQUIPMENT_BRANDS"], ()),
+        "change_history": (["change_history"], ()),
+        "working_items": (["campaigns", "pmax_campaigns", "performance", "merchant_products", "manifest"], ()),
+        "learning_items": (["campaigns", "pmax_campaigns", "PMAX_CAMPAIGN_ID", "OFFENSIVE_CAMPAIGN_ID"], ()),
+        "appendix": None,
+        "truth_signals": (["ads", "keywords", "normalized/ads/negative_keywords.json", "campaigns",
+                           "pmax_campaigns", "truth_sweep_path", "truth_sweep_files"], ("truth_signals",)),
+    }
+
+    def __init__(self, loader: SnapshotLoader, confidence: ConfidenceComputer, deep_audit: bool = False,
+                 cache: SectionCache = None, truth_sweep_path: Path = None, jobs: int = 1):
+        """
+        Args:
+            truth_sweep_path: Latest diag/truth_sweep output (None if there is none)
+            jobs: Sections computed concurrently (1: one after another)
+        """
         self.loader = loader
         self.confidence = confidence
         self.deep_audit = deep_audit
+        self.cache = cache or SectionCache(enabled=False)
+        self.truth_sweep_path = truth_sweep_path
+        self.truth_sweep_files = [
+            truth_sweep_path / "ads_recommendations_normalized.json",
+            truth_sweep_path / "merchant_issues_normalized.json",
+        ] if truth_sweep_path else []
         self.data_gaps = loader.data_gaps.copy()
         self.placeholders = {}
         self.brand_protection_triggers = []
         self.fail_triggers = []
         self.warn_triggers = []
-
-        # Run all computations
-        self._compute_provenance()
-        self._compute_out_of_band_changes()
-        self._compute_confidence_section()
-        self._compute_metadata()
-        self._compute_executive_summary()
-        self._compute_campaign_overview()
-        self._compute_performance_tables()
-        self._compute_brand_protection()
-        self._compute_merchant_center()
-        self._compute_gsc_section()
-        self._compute_bidding_status()
-        self._compute_budget_intelligence()
-        self._compute_change_history()
-        self._compute_working_items()
-        self._compute_learning_items()
-        self._compute_appendix()
+        self.gsc_data = {}
+        self.truth_signals = {}
+        self.snapshot_date = self._snapshot_date()
+        self._shared = {"lock": threading.Lock()}  # Lazily built state shared by section workers
+
+        # Run all computations; outputs are merged in SECTIONS order whatever the finish order
+        started = time.perf_counter()
+        if jobs > 1:
+            with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="report-section") as pool:
+                futures = {section: pool.submit(self._section_outputs, section) for section in self.SECTIONS}
+                results = {section: future.result() for section, future in futures.items()}
+        else:
+            results = {section: self._section_outputs(section) for section in self.SECTIONS}
+        self.wall_seconds = time.perf_counter() - started
+
+        self.section_status = {}
+        self.section_timings = {}
+        for section, (outputs, seconds) in results.items():
+            self.placeholders.update(outputs["placeholders"])
+            for attr, value in outputs["attrs"].items():
+                setattr(self, attr, value)
+            self.section_status[section] = self.cache.status.get(section, "uncached")
+            self.section_timings[section] = seconds
+
+    @classmethod
+    def declared_constants(cls) -> set:
+        """UPPERCASE config constants declared by any section (keyed per section, not by code version)."""
+        return {name for spec in cls.SECTIONS.values() if spec
+                for name in spec[0] if isinstance(name, str) and name.isupper()}
+
+    @property
+    def perf_cube(self) -> PerformanceCube:
+        """Performance rows bucketed once (day x campaign prefix sums) for every window query."""
+        with self._shared["lock"]:
+            if "perf_cube" not in self._shared:
+                self._shared["perf_cube"] = PerformanceCube(self.loader.performance.get("by_campaign", []))
+            return self._shared["perf_cube"]
+
+    def _section_outputs(self, section: str) -> tuple:
+        """({"placeholders", "attrs"} of one section, seconds), from the cache when its inputs are unchanged."""
+        started = time.perf_counter()
+        if self.SECTIONS[section] is None:
+            outputs = self._run_section(section, ())
+        else:
+            inputs, attrs = self.SECTIONS[section]
+            files = []
+            config = {"snapshot_id": self.loader.snapshot_id, "snapshot_date": self.snapshot_date.isoformat()}
+            for name in inputs:
+                if isinstance(name, Path):
+                    files.append(name)
+                elif name == "index":
+                    files.append(self.loader.snapshot_path / INDEX_FILE)
+                elif name in STORE_FILES:
+                    files.append(self.loader.snapshot_path / STORE_FILES[name])
+                elif "/" in name:
+                    files.append(self.loader.snapshot_path / name)
+                elif name.isupper():
+                    config[name] = globals()[name]
+                else:
+                    value = getattr(self, name)
+                    if isinstance(value, list) and all(isinstance(v, Path) for v in value):
+                        files.extend(value)
+                    else:
+                        config[name] = value
+            outputs = self.cache.fetch(section, files, config, lambda: self._run_section(section, attrs))
+        return outputs, time.perf_counter() - started
+
+    def _run_section(self, section: str, attrs: tuple) -> dict:
+        """Run _compute_<section> on a shallow copy with its own placeholders; return what it set."""
+        worker = copy.copy(self)
+        worker.placeholders = {}
+        getattr(worker, f"_compute_{section}")()
+        return {
+            "placeholders": worker.placeholders,
+            "attrs": {attr: getattr(worker, attr) for attr in attrs},
+        }
 
     def _compute_provenance(self):
         """Compute SNAPSHOT PROVENANCE block."""
@@ -735,96 +782,40 @@ class MetricsComputer:
             return "This report summarizes your Google Ads and Merchant Center status based on snapshot data."
         return " ".join(parts)
 
-    def _calc_period_spend(self, days: int) -> float:
-        """Calculate total spend over last N days."""
-        perf = self.loader.performance
-        by_campaign = perf.get("by_campaign", [])
-        if not by_campaign:
-            return 0
-
+    def _snapshot_date(self):
+        """Extraction date of the snapshot (today if the manifest lacks it)."""
         snapshot_date_str = self.loader.manifest.get("extraction_finished_utc", "")[:10]
         if snapshot_date_str:
             try:
-                today = datetime.strptime(snapshot_date_str, "%Y-%m-%d").date()
+                return datetime.strptime(snapshot_date_str, "%Y-%m-%d").date()
             except:
-                today = get_utc_now().date()
-        else:
-            today = get_utc_now().date()
+                pass
+        return get_utc_now().date()
 
-        cutoff = today - timedelta(days=days)
-        total = 0
-        for row in by_campaign:
-            date_str = row.get("date")
-            if date_str:
-                try:
-                    row_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                    if row_date >= cutoff:
-                        total += float(row.get("cost", 0) or 0)
-                except:
-                    pass
-        return total
+    def _calc_period_spend(self, days: int) -> float:
+        """Calculate total spend over last N days."""
+        return self.perf_cube.sum("cost", start=self.snapshot_date - timedelta(days=days))
 
     def _calc_branded_cpc_by_period(self) -> dict:
         """Calculate Branded campaign CPC for different time periods."""
-        perf = self.loader.performance
-        by_campaign = perf.get("by_campaign", [])
-        branded_perf = [r for r in by_campaign if str(r.get("campaign_id")) == str(BRANDED_CAMPAIGN_ID)]
-
-        if not branded_perf:
+        cube = self.perf_cube
+        if str(BRANDED_CAMPAIGN_ID) not in cube.campaign_index:
             return {"today": None, "yesterday": None, "last_7d": None, "last_30d": None}
 
-        # Get snapshot date
-        snapshot_date_str = self.loader.manifest.get("extraction_finished_utc", "")[:10]
-        if snapshot_date_str:
-            try:
-                snapshot_date = datetime.strptime(snapshot_date_str, "%Y-%m-%d").date()
-            except:
-                snapshot_date = get_utc_now().date()
-        else:
-            snapshot_date = get_utc_now().date()
-
+        snapshot_date = self.snapshot_date
         yesterday = snapshot_date - timedelta(days=1)
-        cutoff_7d = snapshot_date - timedelta(days=7)
-        cutoff_30d = snapshot_date - timedelta(days=30)
-
         periods = {
-            "today": {"cost": 0, "clicks": 0},
-            "yesterday": {"cost": 0, "clicks": 0},
-            "last_7d": {"cost": 0, "clicks": 0},
-            "last_30d": {"cost": 0, "clicks": 0},
+            "today": (snapshot_date, snapshot_date),
+            "yesterday": (yesterday, yesterday),
+            "last_7d": (snapshot_date - timedelta(days=7), None),
+            "last_30d": (snapshot_date - timedelta(days=30), None),
         }
 
-        for row in branded_perf:
-            date_str = row.get("date")
-            if not date_str:
-                continue
-            try:
-                row_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            except:
-                continue
-
-            cost = float(row.get("cost", 0) or 0)
-            clicks = float(row.get("clicks", 0) or 0)
-
-            if row_date == snapshot_date:
-                periods["today"]["cost"] += cost
-                periods["today"]["clicks"] += clicks
-            if row_date == yesterday:
-                periods["yesterday"]["cost"] += cost
-                periods["yesterday"]["clicks"] += clicks
-            if row_date >= cutoff_7d:
-                periods["last_7d"]["cost"] += cost
-                periods["last_7d"]["clicks"] += clicks
-            if row_date >= cutoff_30d:
-                periods["last_30d"]["cost"] += cost
-                periods["last_30d"]["clicks"] += clicks
-
         result = {}
-        for period, data in periods.items():
-            if data["clicks"] > 0:
-                result[period] = data["cost"] / data["clicks"]
-            else:
-                result[period] = None
+        for period, (start, end) in periods.items():
+            cost = cube.sum("cost", BRANDED_CAMPAIGN_ID, start=start, end=end)
+            clicks = cube.sum("clicks", BRANDED_CAMPAIGN_ID, start=start, end=end)
+            result[period] = cost / clicks if clicks > 0 else None
 
         return result
 
@@ -871,59 +862,23 @@ class MetricsComputer:
 
     def _compute_performance_tables(self):
         """Compute 7-day and 30-day performance tables."""
-        perf = self.loader.performance
-        by_campaign = perf.get("by_campaign", [])
-        campaign_data = defaultdict(lambda: {"7d": defaultdict(float), "30d": defaultdict(float)})
-
-        snapshot_date_str = self.loader.manifest.get("extraction_finished_utc", "")[:10]
-        if snapshot_date_str:
-            try:
-                today = datetime.strptime(snapshot_date_str, "%Y-%m-%d").date()
-            except:
-                today = get_utc_now().date()
-        else:
-            today = get_utc_now().date()
-
-        cutoff_7d = today - timedelta(days=7)
-        cutoff_30d = today - timedelta(days=30)
-
-        for row in by_campaign:
-            cid = str(row.get("campaign_id", ""))
-            date_str = row.get("date")
-            if not date_str:
-                continue
-            try:
-                row_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            except:
-                continue
-
-            metrics = {
-                "spend": float(row.get("cost", 0) or 0),
-                "clicks": float(row.get("clicks", 0) or 0),
-                "impressions": float(row.get("impressions", 0) or 0),
-                "conversions": float(row.get("conversions", 0) or 0),
-                "conv_value": float(row.get("conversionsValue", 0) or 0),
-            }
-
-            if row_date >= cutoff_7d:
-                for k, v in metrics.items():
-                    campaign_data[cid]["7d"][k] += v
-            if row_date >= cutoff_30d:
-                for k, v in metrics.items():
-                    campaign_data[cid]["30d"][k] += v
+        cutoffs = {
+            "7d": self.snapshot_date - timedelta(days=7),
+            "30d": self.snapshot_date - timedelta(days=30),
+        }
+        # Campaigns with rows in the 30-day window (the 7-day one is inside it)
+        campaign_ids = self.perf_cube.campaigns_in(start=cutoffs["30d"])
 
         def build_table(period: str) -> str:
             rows = []
-            for cid, data in campaign_data.items():
+            for cid in campaign_ids:
                 name = self.loader.get_campaign_name(cid)
                 if not name or name == "Unknown":
                     continue
-                d = data[period]
-                spend = d["spend"]
-                clicks = d["clicks"]
-                impressions = d["impressions"]
-                conversions = d["conversions"]
-                conv_value = d["conv_value"]
+                spend, clicks, impressions, conversions, conv_value = (
+                    self.perf_cube.sum(metric, cid, start=cutoffs[period])
+                    for metric in ("cost", "clicks", "impressions", "conversions", "conv_value")
+                )
                 roas = safe_div(conv_value, spend)
                 rows.append(
                     f"| {name[:30]} | {fmt_currency(spend)} | {fmt_number(int(clicks))} | "
@@ -955,13 +910,9 @@ class MetricsComputer:
         branded_keywords = [k for k in keywords if str(k.get("campaign_id")) == str(BRANDED_CAMPAIGN_ID)]
         enabled_keywords = [k for k in branded_keywords if k.get("status") == "ENABLED"]
 
-        perf = self.loader.performance
-        by_campaign = perf.get("by_campaign", [])
-        branded_perf = [r for r in by_campaign if str(r.get("campaign_id")) == str(BRANDED_CAMPAIGN_ID)]
-
-        total_cost = sum(float(row.get("cost", 0) or 0) for row in branded_perf)
-        total_clicks = sum(float(row.get("clicks", 0) or 0) for row in branded_perf)
-        total_impressions = sum(float(row.get("impressions", 0) or 0) for row in branded_perf)
+        total_cost = self.perf_cube.sum("cost", BRANDED_CAMPAIGN_ID)
+        total_clicks = self.perf_cube.sum("clicks", BRANDED_CAMPAIGN_ID)
+        total_impressions = self.perf_cube.sum("impressions", BRANDED_CAMPAIGN_ID)
         avg_cpc = safe_div(total_cost, total_clicks)
 
         # CPC by period
@@ -1219,37 +1170,8 @@ class MetricsComputer:
         summary = self.loader.gsc_summary.get("summary", {})
         queries = self.loader.gsc_queries.get("records", [])
         pages = self.loader.gsc_pages.get("records", [])
-        raw_analytics = self.loader.gsc_raw_analytics.get("records", [])
-
-        # Aggregate device breakdown from raw data
-        device_stats = defaultdict(lambda: {"clicks": 0, "impressions": 0, "position_sum": 0, "position_count": 0})
-        for row in raw_analytics:
-            keys = row.get("keys", [])
-            if len(keys) >= 3:  # [query, page, device, ...]
-                device = keys[2]
-                clicks = row.get("clicks", 0)
-                impressions = row.get("impressions", 0)
-                position = row.get("position", 0)
-
-                device_stats[device]["clicks"] += clicks
-                device_stats[device]["impressions"] += impressions
-                device_stats[device]["position_sum"] += position * impressions
-                device_stats[device]["position_count"] += impressions
-
-        # Aggregate country breakdown from raw data (top 5)
-        country_stats = defaultdict(lambda: {"clicks": 0, "impressions": 0, "position_sum": 0, "position_count": 0})
-        for row in raw_analytics:
-            keys = row.get("keys", [])
-            if len(keys) >= 4:  # [query, page, device, country, ...]
-                country = keys[3]
-                clicks = row.get("clicks", 0)
-                impressions = row.get("impressions", 0)
-                position = row.get("position", 0)
-
-                country_stats[country]["clicks"] += clicks
-                country_stats[country]["impressions"] += impressions
-                country_stats[country]["position_sum"] += position * impressions
-                country_stats[country]["position_count"] += impressions
+        device_rows = self.loader.gsc_devices.get("records", [])
+        country_rows = self.loader.gsc_countries.get("records", [])[:5]  # sorted by impressions
 
         # Run diagnostics
         diagnostic_triggers = []
@@ -1266,18 +1188,9 @@ class MetricsComputer:
         # Diagnostic 2: Organic demand vs paid spend mismatch
         # Get 7-day spend from performance data (reuse existing budget intelligence data if available)
         total_spend_7d = 0
-        perf = self.loader.performance.get("by_campaign", [])
-        date_range_perf = self.loader.performance.get("date_range", {})
-        end_date_str = date_range_perf.get("end")
-        if end_date_str:
-            try:
-                end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
-                start_7d = end_date - timedelta(days=6)
-                start_7d_str = start_7d.strftime("%Y-%m-%d")
-                perf_7d = [r for r in perf if r.get("date", "") >= start_7d_str]
-                total_spend_7d = sum(float(r.get("cost", 0) or 0) for r in perf_7d)
-            except:
-                pass
+        start_7d = self._performance_start_7d()
+        if start_7d:
+            total_spend_7d = self.perf_cube.sum("cost", start=start_7d)
 
         # Conservative thresholds to avoid false positives
         SPEND_THRESHOLD = 500  # $500/week in paid spend
@@ -1362,20 +1275,8 @@ class MetricsComputer:
         lines.append("")
         lines.append("| Device | Clicks | Impressions | CTR | Avg Position |")
         lines.append("|--------|--------|-------------|-----|--------------|")
-        device_rows = []
-        for device, stats in sorted(device_stats.items(), key=lambda x: x[1]["impressions"], reverse=True):
-            clicks = stats["clicks"]
-            impressions = stats["impressions"]
-            ctr = clicks / impressions if impressions > 0 else 0
-            avg_pos = stats["position_sum"] / stats["position_count"] if stats["position_count"] > 0 else 0
-            device_rows.append({
-                "device": device,
-                "clicks": clicks,
-                "impressions": impressions,
-                "ctr": ctr,
-                "position": avg_pos
-            })
-            lines.append(f"| {device} | {clicks:,} | {impressions:,} | {ctr:.2%} | {avg_pos:.1f} |")
+        for d in device_rows:
+            lines.append(f"| {d['device']} | {d['clicks']:,} | {d['impressions']:,} | {d['ctr']:.2%} | {d['position']:.1f} |")
         if not device_rows:
             lines.append("| (no data) | - | - | - | - |")
         lines.append("")
@@ -1385,20 +1286,8 @@ class MetricsComputer:
         lines.append("")
         lines.append("| Country | Clicks | Impressions | CTR | Avg Position |")
         lines.append("|---------|--------|-------------|-----|--------------|")
-        country_rows = []
-        for country, stats in sorted(country_stats.items(), key=lambda x: x[1]["impressions"], reverse=True)[:5]:
-            clicks = stats["clicks"]
-            impressions = stats["impressions"]
-            ctr = clicks / impressions if impressions > 0 else 0
-            avg_pos = stats["position_sum"] / stats["position_count"] if stats["position_count"] > 0 else 0
-            country_rows.append({
-                "country": country,
-                "clicks": clicks,
-                "impressions": impressions,
-                "ctr": ctr,
-                "position": avg_pos
-            })
-            lines.append(f"| {country} | {clicks:,} | {impressions:,} | {ctr:.2%} | {avg_pos:.1f} |")
+        for c in country_rows:
+            lines.append(f"| {c['country']} | {c['clicks']:,} | {c['impressions']:,} | {c['ctr']:.2%} | {c['position']:.1f} |")
         if not country_rows:
             lines.append("| (no data) | - | - | - | - |")
         lines.append("")
@@ -1480,6 +1369,17 @@ class MetricsComputer:
             rows.append(f"| {name} | {strategy} | {target} | {daily_budget} | {notes} |")
         self.placeholders["BIDDING_TABLE"] = "\n".join(rows)
 
+    def _performance_start_7d(self):
+        """First day of the last 7 days of the performance date range (None if unknown)."""
+        end_date_str = self.loader.performance.get("date_range", {}).get("end")
+        if not end_date_str:
+            return None
+        try:
+            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+        except:
+            return None
+        return end_date - timedelta(days=6)  # 6 days back + end_date = 7 days
+
     def _compute_budget_intelligence(self):
         """Compute Budget & Constraint Intelligence section."""
         lines = []
@@ -1505,22 +1405,8 @@ class MetricsComputer:
         lines.append("| Campaign | Type | Budget/day | Avg Spend/day (7d) | Utilization | Flag |")
         lines.append("|----------|------|------------|---------------------|-------------|------|")
 
-        # Get performance data
-        perf = self.loader.performance
-        by_campaign = perf.get("by_campaign", [])
-        date_range = perf.get("date_range", {})
-
-        # Calculate last 7 days from the performance end date
-        end_date_str = date_range.get("end")
-        if end_date_str:
-            try:
-                end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
-                start_7d = end_date - timedelta(days=6)  # 6 days back + end_date = 7 days
-                start_7d_str = start_7d.strftime("%Y-%m-%d")
-            except:
-                start_7d_str = None
-        else:
-            start_7d_str = None
+        # Last 7 days of the performance date range (None: use all records, less accurate)
+        start_7d = self._performance_start_7d()
 
         utilization_data = []
         seen_campaigns = set()  # Track to avoid duplicates
@@ -1545,21 +1431,8 @@ class MetricsComputer:
                 daily_budget = None
 
             # Get 7-day average spend from performance data
-            campaign_perf = [r for r in by_campaign if str(r.get("campaign_id")) == str(campaign_id)]
-
-            # Filter to last 7 days if we have date range
-            if start_7d_str:
-                campaign_perf_7d = [
-                    r for r in campaign_perf
-                    if r.get("date", "") >= start_7d_str
-                ]
-            else:
-                # Fallback: use all records (less accurate)
-                campaign_perf_7d = campaign_perf
-
-            # Sum cost over the 7-day period
-            total_cost_7d = sum(float(row.get("cost", 0) or 0) for row in campaign_perf_7d)
-            days_count = len(set(r.get("date") for r in campaign_perf_7d if r.get("date")))
+            total_cost_7d = self.perf_cube.sum("cost", campaign_id, start=start_7d)
+            days_count = self.perf_cube.active_days(campaign_id, start=start_7d)
 
             # Calculate daily average (avoid division by zero)
             spend_7d = total_cost_7d / days_count if days_count > 0 else 0
@@ -1819,47 +1692,118 @@ class MetricsComputer:
         """Compute appendix data."""
         pass
 
+    def _compute_truth_signals(self):
+        """Phase B3.2: Google recommendations truth signals (data for the JSON report, plus its section)."""
+        self.truth_signals = extract_truth_signals(self.loader.snapshot_path, self.truth_sweep_path)
+        self.placeholders["TRUTH_SIGNALS_SECTION"] = render_truth_signals_section(self.truth_signals)
+
 
 # =============================================================================
 # TEMPLATE RENDERING
 # =============================================================================
 
 
+PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Z0-9_]+)\}\}")
+END_OF_REPORT_MARKER = "## End of Report"
+
+# Template path -> (mtime_ns, size, CompiledTemplate); recompiled when the file changes
+_compiled_templates = {}
+
+
+class CompiledTemplate:
+    """Template text split once into literals and placeholder slots.
+
+    literals[0] slots[0] literals[1] slots[1] ... literals[-1]
+    """
+
+    def __init__(self, text: str):
+        parts = PLACEHOLDER_PATTERN.split(text)
+        self.literals = parts[0::2]
+        self.slots = parts[1::2]
+        self.names = set(self.slots)
+
+        # Data gaps are inserted before the first end-of-report marker in the template
+        self.gaps_at = None
+        for i, literal in enumerate(self.literals):
+            offset = literal.find(END_OF_REPORT_MARKER)
+            if offset != -1:
+                self.gaps_at = (i, offset)
+                break
+
+
+def compile_template(template_path: Path) -> CompiledTemplate:
+    """Compiled template, reused until the file's mtime or size changes."""
+    stat = template_path.stat()
+    cached = _compiled_templates.get(str(template_path))
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(template_path, "r") as f:
+        compiled = CompiledTemplate(f.read())
+    _compiled_templates[str(template_path)] = (stat.st_mtime_ns, stat.st_size, compiled)
+    return compiled
+
+
 class TemplateRenderer:
-    """Renders template with placeholders."""
+    """Renders template with placeholders in one pass over its compiled slots."""
 
     def __init__(self, template_path: Path):
         if not template_path.exists():
             raise FileNotFoundError(f"Template not found: {template_path}")
-        with open(template_path, "r") as f:
-            self.template = f.read()
-
-    def render(self, placeholders: dict, data_gaps: list) -> str:
-        """Render template with placeholder values."""
-        import re
-        result = self.template
-        missing = []
-        pattern = r"\{\{([A-Z0-9_]+)\}\}"
-        matches = re.findall(pattern, result)
-        for placeholder in set(matches):
-            value = placeholders.get(placeholder)
-            if value is None:
-                value = "UNKNOWN"
-                missing.append(placeholder)
-            result = result.replace(f"{{{{{placeholder}}}}}", str(value))
-
+        self.template_path = template_path
+        self.compiled = compile_template(template_path)
+
+    def diagnostics(self, placeholders: dict) -> dict:
+        """Template slots with no value (rendered UNKNOWN) and computed placeholders the template never uses."""
+        missing = [name for name in dict.fromkeys(self.compiled.slots) if placeholders.get(name) is None]
+        unused = sorted(name for name in placeholders if name not in self.compiled.names)
+        return {"missing": missing, "unused": unused}
+
+    def chunks(self, placeholders: dict, data_gaps: list):
+        """Rendered report as a sequence of strings (literals, values and the data gaps section)."""
+        compiled = self.compiled
+        missing = self.diagnostics(placeholders)["missing"]
+        gaps_section = None
         if data_gaps or missing:
             gaps_section = "\n\n---\n\n## Data Gaps Identified\n\n"
             gaps_section += "The following data was not available in the snapshot:\n\n"
-            all_gaps = list(set(data_gaps + [f"Placeholder not computed: {m}" for m in missing]))
+            all_gaps = list(dict.fromkeys(data_gaps + [f"Placeholder not computed: {m}" for m in missing]))
             for gap in all_gaps:
                 gaps_section += f"- {gap}\n"
             gaps_section += "\nThese gaps can be addressed by updating Phase A data extraction or manual review in Google Ads UI.\n"
-            if "## End of Report" in result:
-                result = result.replace("## End of Report", gaps_section + "\n## End of Report")
+
+        for i, literal in enumerate(compiled.literals):
+            if gaps_section is not None and compiled.gaps_at and compiled.gaps_at[0] == i:
+                offset = compiled.gaps_at[1]
+                yield literal[:offset]
+                yield gaps_section + "\n"
+                yield literal[offset:]
             else:
-                result += gaps_section
-        return result
+                yield literal
+            if i < len(compiled.slots):
+                value = placeholders.get(compiled.slots[i])
+                yield "UNKNOWN" if value is None else str(value)
+
+        if gaps_section is not None and not compiled.gaps_at:
+            yield gaps_section
+
+    def render(self, placeholders: dict, data_gaps: list) -> str:
+        """Render template with placeholder values."""
+        return "".join(self.chunks(placeholders, data_gaps))
+
+    def write(self, output_path: Path, placeholders: dict, data_gaps: list, html: bool = False) -> int:
+        """Stream the rendered report (Markdown, or HTML with html=True) to a file; returns characters written."""
+        chunks = self.chunks(placeholders, data_gaps)
+        written = 0
+        with open(output_path, "w") as f:
+            if html:
+                converter = MarkdownToHtml(title=f"Report {placeholders.get('SNAPSHOT_ID', '')}".strip())
+                for chunk in chunks:
+                    written += f.write(converter.feed(chunk))
+                written += f.write(converter.close())
+            else:
+                for chunk in chunks:
+                    written += f.write(chunk)
+        return written
 
 
 # =============================================================================
@@ -1920,6 +1864,12 @@ def build_json_report(loader: SnapshotLoader, confidence: ConfidenceComputer, me
         "out_of_band_changes": out_of_band_changes,
         "gsc": metrics.gsc_data,
         "truth_signals_google_recommendations": truth_signals,
+        # Section -> "cached" (reused from reports/.section_cache), "computed" or "uncached"
+        "section_cache": {
+            "enabled": metrics.cache.enabled,
+            "sections": metrics.section_status,
+        },
+        "section_timings_ms": {name: round(seconds * 1000, 1) for name, seconds in metrics.section_timings.items()},
     }
 
 
@@ -1939,6 +1889,10 @@ REQUIRED (one of):
 
 OPTIONAL:
     --deep-audit         Show full details even on PASS/WARN verdicts
+    --load-trace         Print which snapshot files were parsed and each section's time
+    --no-cache           Recompute every section (skip reports/.section_cache)
+    --jobs <n>           Compute up to n report sections concurrently (default: 1)
+    --html               Also write reports/latest.html
 
 Examples:
     python audit/generate_report.py --latest
@@ -1954,6 +1908,10 @@ def parse_args():
     snapshot_path = None
     use_latest = False
     deep_audit = False
+    load_trace = False
+    use_cache = True
+    jobs = 1
+    write_html = False
 
     i = 1
     while i < len(sys.argv):
@@ -1967,6 +1925,18 @@ def parse_args():
         elif arg == "--deep-audit":
             deep_audit = True
             i += 1
+        elif arg == "--load-trace":
+            load_trace = True
+            i += 1
+        elif arg == "--no-cache":
+            use_cache = False
+            i += 1
+        elif arg == "--jobs" and i + 1 < len(sys.argv):
+            jobs = max(1, int(sys.argv[i + 1]))
+            i += 2
+        elif arg == "--html":
+            write_html = True
+            i += 1
         elif arg in ("--help", "-h"):
             print_usage()
             sys.exit(0)
@@ -1975,7 +1945,7 @@ def parse_args():
             print_usage()
             sys.exit(1)
 
-    return snapshot_path, use_latest, deep_audit
+    return snapshot_path, use_latest, deep_audit, load_trace, use_cache, jobs, write_html
 
 
 # =============================================================================
@@ -1990,7 +1960,7 @@ def main():
     print()
 
     # Parse args
-    snapshot_path, use_latest, deep_audit = parse_args()
+    snapshot_path, use_latest, deep_audit, load_trace, use_cache, jobs, write_html = parse_args()
 
     # Validate: must have --snapshot or --latest
     if not snapshot_path and not use_latest:
@@ -2040,16 +2010,7 @@ def main():
     print(f"  ✓ Snapshot age: {confidence.snapshot_age_minutes} minutes")
     print()
 
-    # Compute metrics
-    print("Computing metrics...")
-    metrics = MetricsComputer(loader, confidence, deep_audit=deep_audit)
-    print(f"  ✓ Computed {len(metrics.placeholders)} placeholders")
-    if metrics.data_gaps:
-        print(f"  ⚠ {len(metrics.data_gaps)} data gaps identified")
-    print()
-
-    # Phase B3.2: Extract Google recommendations truth signals
-    print("Extracting Google recommendations truth signals...")
+    # Phase B3.2: Latest Google recommendations truth sweep (its signals are a metrics section)
     truth_sweep_dir = PROJECT_ROOT / "diag" / "truth_sweep"
     latest_truth_sweep = None
     if truth_sweep_dir.exists():
@@ -2058,20 +2019,31 @@ def main():
         if truth_sweeps:
             truth_sweeps.sort(key=lambda x: x.name, reverse=True)
             latest_truth_sweep = truth_sweeps[0]
-            print(f"  ✓ Found truth sweep: {latest_truth_sweep.name}")
 
-    truth_signals = extract_truth_signals(snapshot_path, latest_truth_sweep)
+    # Compute metrics
+    print(f"Computing metrics ({jobs} job{'s' if jobs > 1 else ''})...")
+    cache = SectionCache(enabled=use_cache, config_names=MetricsComputer.declared_constants())
+    metrics = MetricsComputer(loader, confidence, deep_audit=deep_audit, cache=cache,
+                              truth_sweep_path=latest_truth_sweep, jobs=jobs)
+    print(f"  ✓ Computed {len(metrics.placeholders)} placeholders")
+    if cache.enabled:
+        cached = [name for name, status in metrics.section_status.items() if status == "cached"]
+        print(f"  ✓ Sections from cache: {len(cached)} of {len(metrics.section_status)}")
+    slowest = max(metrics.section_timings, key=metrics.section_timings.get)
+    print(f"  ✓ Sections took {metrics.wall_seconds:.2f}s "
+          f"(sum {sum(metrics.section_timings.values()):.2f}s, slowest {slowest} "
+          f"{metrics.section_timings[slowest]:.2f}s)")
+    if latest_truth_sweep:
+        print(f"  ✓ Found truth sweep: {latest_truth_sweep.name}")
+    truth_signals = metrics.truth_signals
     total_signals = sum(
         len(truth_signals[k])
         for k in truth_signals
         if isinstance(truth_signals[k], list)
     )
     print(f"  ✓ Extracted {total_signals} truth signals")
-
-    # Render truth signals section for template
-    truth_signals_markdown = render_truth_signals_section(truth_signals)
-    metrics.placeholders["TRUTH_SIGNALS_SECTION"] = truth_signals_markdown
-    print(f"  ✓ Rendered truth signals section ({len(truth_signals_markdown)} chars)")
+    if metrics.data_gaps:
+        print(f"  ⚠ {len(metrics.data_gaps)} data gaps identified")
     print()
 
     # Load template
@@ -2084,14 +2056,21 @@ def main():
         sys.exit(1)
     print()
 
-    # Render report
-    print("Rendering report...")
-    report_md = renderer.render(metrics.placeholders, metrics.data_gaps)
-    print(f"  ✓ Report rendered ({len(report_md):,} characters)")
+    # Check placeholders against the template (the report itself is streamed to disk below)
+    print("Checking template placeholders...")
+    template_diagnostics = renderer.diagnostics(metrics.placeholders)
+    if template_diagnostics["missing"]:
+        print(f"  ⚠ {len(template_diagnostics['missing'])} not computed (rendered UNKNOWN): "
+              f"{', '.join(template_diagnostics['missing'])}")
+    if template_diagnostics["unused"]:
+        print(f"  ⚠ {len(template_diagnostics['unused'])} computed but not in template: "
+              f"{', '.join(template_diagnostics['unused'])}")
+    print(f"  ✓ {len(renderer.compiled.names)} template placeholders checked")
     print()
 
     # Build JSON report
     report_json = build_json_report(loader, confidence, metrics, truth_signals)
+    report_json["template_diagnostics"] = template_diagnostics
 
     # Ensure reports directory exists
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -2101,9 +2080,14 @@ def main():
 
     # reports/latest.md
     latest_md_path = REPORTS_DIR / "latest.md"
-    with open(latest_md_path, "w") as f:
-        f.write(report_md)
-    print(f"  ✓ {latest_md_path}")
+    written = renderer.write(latest_md_path, metrics.placeholders, metrics.data_gaps)
+    print(f"  ✓ {latest_md_path} ({written:,} characters)")
+
+    # reports/latest.html
+    if write_html:
+        latest_html_path = REPORTS_DIR / "latest.html"
+        written = renderer.write(latest_html_path, metrics.placeholders, metrics.data_gaps, html=True)
+        print(f"  ✓ {latest_html_path} ({written:,} characters)")
 
     # reports/latest.json
     latest_json_path = REPORTS_DIR / "latest.json"
@@ -2119,7 +2103,7 @@ def main():
     print(f"Snapshot Path:        {snapshot_path}")
     print(f"Confidence Verdict:   {confidence.verdict}")
     print(f"Snapshot Age:         {confidence.snapshot_age_minutes} minutes")
-    print(f"Report files:         {REPORTS_DIR}/latest.md, latest.json")
+    print(f"Report files:         {REPORTS_DIR}/latest.md, latest.json{', latest.html' if write_html else ''}")
     print(f"Data gaps:            {len(metrics.data_gaps)}")
     print()
 
@@ -2129,6 +2113,16 @@ def main():
             print(f"  - {gap}")
         print()
 
+    if load_trace:
+        print("Snapshot files parsed:")
+        for line in loader.trace_lines():
+            print(line)
+        print()
+        print("Report sections (slowest first):")
+        for name, seconds in sorted(metrics.section_timings.items(), key=lambda item: item[1], reverse=True):
+            print(f"  {seconds * 1000:8.1f} ms  {metrics.section_status[name]:<8}  {name}")
+        print()
+
     print("Done.")
 
 
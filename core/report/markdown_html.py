@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Phase B2: Streaming Markdown to HTML
+
+Converts the report's Markdown to HTML line by line, so the rendered report
+can be written straight to reports/latest.html without holding a second copy
+of it. Covers the subset TEMPLATE.md and the section renderers produce:
+
+    # .. ######         headings
+    ---                 horizontal rule
+    | a | b |           tables (first row is the header when followed by |---|)
+    - item, 1. item     lists (flat), "- [ ]" / "- [x]" task items
+    > text              blockquotes
+    ```                 fenced code
+    **bold**, *em*, `code`, [text](url)
+
+Anything else is a paragraph. No third-party Markdown package needed.
+
+    converter = MarkdownToHtml(title="Report")
+    for chunk in markdown_chunks:
+        out.write(converter.feed(chunk))
+    out.write(converter.close())
+"""
+
+import html
+import re
+
+HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+RULE = re.compile(r"^\s*(-{3,}|\*{3,}|_{3,})\s*$")
+TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+UNORDERED_ITEM = re.compile(r"^\s*[-*+]\s+(.*)$")
+ORDERED_ITEM = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+TASK = re.compile(r"^\[([ xX])\]\s+(.*)$")
+
+INLINE_CODE = re.compile(r"`([^`]+)`")
+BOLD = re.compile(r"\*\*(.+?)\*\*")
+EMPHASIS = re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])")
+LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+
+STYLE = (
+    "body{font-family:sans-serif;max-width:1100px;margin:2em auto;padding:0 1em;line-height:1.45}"
+    "table{border-collapse:collapse;margin:1em 0}th,td{border:1px solid #ccc;padding:4px 8px;text-align:left}"
+    "th{background:#f3f3f3}code{background:#f3f3f3;padding:0 3px}"
+    "blockquote{border-left:4px solid #ccc;margin:1em 0;padding:0 1em;color:#555}"
+)
+
+
+def _link(match) -> str:
+    # Text and URL were escaped with the rest of the line; only quotes remain for the attribute
+    url = match.group(2).replace('"', "&quot;")
+    return f'<a href="{url}">{match.group(1)}</a>'
+
+
+def inline(text: str) -> str:
+    """Escape text and apply inline markup (code spans are left as-is inside)."""
+    codes = []
+
+    def stash(match):
+        codes.append(match.group(1))
+        return f"\0{len(codes) - 1}\0"
+
+    text = html.escape(INLINE_CODE.sub(stash, text), quote=False)
+    text = LINK.sub(_link, text)
+    text = BOLD.sub(r"<strong>\1</strong>", text)
+    text = EMPHASIS.sub(r"<em>\1</em>", text)
+    return re.sub(r"\0(\d+)\0", lambda m: f"<code>{html.escape(codes[int(m.group(1))], quote=False)}</code>", text)
+
+
+def _cells(line: str) -> list:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|"):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split("|")]
+
+
+class MarkdownToHtml:
+    """Incremental converter: feed() text in any chunks, close() at the end."""
+
+    def __init__(self, title: str = "Report"):
+        self.title = title
+        self.pending = ""        # Text after the last newline
+        self.block = None        # "p", "ul", "ol", "table", "blockquote", "pre"
+        self.table_head = None   # First table row, held until we know if it is a header
+        self.started = False
+
+    def _open(self, block: str, tag: str) -> list:
+        out = self._close_block()
+        self.block = block
+        out.append(tag)
+        return out
+
+    def _close_block(self) -> list:
+        out = []
+        if self.block == "table":
+            if self.table_head is not None:
+                out.append(self._row(self.table_head, "td"))
+                self.table_head = None
+            out.append("</tbody></table>")
+        elif self.block in ("p", "ul", "ol", "blockquote", "pre"):
+            out.append({"p": "</p>", "ul": "</ul>", "ol": "</ol>",
+                        "blockquote": "</p></blockquote>", "pre": "</code></pre>"}[self.block])
+        self.block = None
+        return out
+
+    @staticmethod
+    def _row(cells: list, tag: str) -> str:
+        return "<tr>" + "".join(f"<{tag}>{inline(c)}</{tag}>" for c in cells) + "</tr>"
+
+    @staticmethod
+    def _item(text: str) -> str:
+        task = TASK.match(text)
+        if task:
+            box = "&#9745;" if task.group(1) in "xX" else "&#9744;"
+            return f"<li>{box} {inline(task.group(2))}</li>"
+        return f"<li>{inline(text)}</li>"
+
+    def _line(self, line: str) -> list:
+        if self.block == "pre":
+            if line.strip().startswith("```"):
+                return self._close_block()
+            return [html.escape(line, quote=False)]
+        if line.strip().startswith("```"):
+            return self._open("pre", "<pre><code>")
+        if not line.strip():
+            return self._close_block()
+
+        heading = HEADING.match(line)
+        if heading:
+            level = len(heading.group(1))
+            return self._close_block() + [f"<h{level}>{inline(heading.group(2))}</h{level}>"]
+        if RULE.match(line):
+            return self._close_block() + ["<hr>"]
+
+        if line.lstrip().startswith("|"):
+            if self.block != "table":
+                out = self._open("table", "<table>")
+                self.table_head = _cells(line)
+                return out
+            if self.table_head is not None:
+                head, self.table_head = self.table_head, None
+                if TABLE_SEPARATOR.match(line):
+                    return ["<thead>" + self._row(head, "th") + "</thead><tbody>"]
+                return ["<tbody>", self._row(head, "td"), self._row(_cells(line), "td")]
+            return [self._row(_cells(line), "td")]
+
+        for block, pattern in (("ul", UNORDERED_ITEM), ("ol", ORDERED_ITEM)):
+            item = pattern.match(line)
+            if item:
+                out = [] if self.block == block else self._open(block, f"<{block}>")
+                return out + [self._item(item.group(1))]
+
+        if line.startswith(">"):
+            text = inline(line[1:].strip())
+            if self.block == "blockquote":
+                return [text]
+            return self._open("blockquote", "<blockquote><p>") + [text]
+
+        if self.block == "p":
+            return [inline(line)]
+        return self._open("p", "<p>") + [inline(line)]
+
+    def _header(self) -> list:
+        if self.started:
+            return []
+        self.started = True
+        return ['<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">',
+                f"<title>{html.escape(self.title)}</title>",
+                f"<style>{STYLE}</style>\n</head>\n<body>"]
+
+    def feed(self, text: str) -> str:
+        """HTML for every complete line received so far."""
+        out = self._header()
+        lines = (self.pending + text).split("\n")
+        self.pending = lines.pop()
+        for line in lines:
+            out.extend(self._line(line))
+        return "\n".join(out) + "\n" if out else ""
+
+    def close(self) -> str:
+        out = self._header()
+        if self.pending:
+            out.extend(self._line(self.pending))
+            self.pending = ""
+        out.extend(self._close_block())
+        out.append("</body>\n</html>")
+        return "\n".join(out) + "\n"
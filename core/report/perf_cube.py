@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Phase B2: Performance Cube
+
+normalized/ads/performance.json "by_campaign" rows (one per campaign and
+day) bucketed once per report run into a day x campaign cube with prefix
+sums along the day axis, so every "last N days" figure is two lookups per
+campaign instead of a scan (and a strptime) per row. Report time stays flat
+as the performance history grows to 90 or 365 days.
+
+    cube = PerformanceCube(performance.get("by_campaign", []))
+    cube.sum("cost", start=today - timedelta(days=7))           # all campaigns
+    cube.sum("clicks", campaign_id="123", start=day, end=day)   # one day
+    cube.active_days("123", start=start_7d)                     # days with rows
+    cube.campaigns_in(start=cutoff_30d)                         # file order
+
+Dates are inclusive bounds; None leaves a side open. Rows without a
+parseable date only count when both bounds are None (all-time totals).
+
+Prefix sums use NumPy (in requirements.txt), falling back to plain lists
+when it is missing; both add in the same order, so the results are identical.
+"""
+
+from datetime import date, datetime
+from itertools import accumulate
+
+# Cube metric -> performance row field
+METRICS = {
+    "cost": "cost",
+    "clicks": "clicks",
+    "impressions": "impressions",
+    "conversions": "conversions",
+    "conv_value": "conversionsValue",
+}
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _parse_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def _prefix_rows(matrix: list, np) -> list:
+    """Prefix sums of each row with a leading zero: out[r][i] = sum(matrix[r][:i])."""
+    if np is None or not matrix:
+        return [list(accumulate(row, initial=0)) for row in matrix]
+    array = np.asarray(matrix)
+    zeros = np.zeros((len(matrix), 1), dtype=array.dtype)
+    return np.concatenate([zeros, np.cumsum(array, axis=1)], axis=1).tolist()
+
+
+class PerformanceCube:
+    """Day x campaign sums of the performance metrics, with prefix sums per campaign."""
+
+    def __init__(self, rows: list):
+        np = _import_numpy()
+        dates = {}  # date string -> date (each distinct string parsed once)
+        parsed = []
+        for row in rows:
+            value = row.get("date")
+            if value and value not in dates:
+                dates[value] = _parse_date(value)
+            parsed.append(dates.get(value) if value else None)
+
+        valid = [d for d in dates.values() if d is not None]
+        self.origin = min(valid) if valid else date.today()
+        self.days = (max(valid) - self.origin).days + 1 if valid else 0
+
+        self.campaign_index = {}  # campaign id -> column, in first-seen order
+        for row in rows:
+            self.campaign_index.setdefault(str(row.get("campaign_id", "")), len(self.campaign_index))
+        campaigns = len(self.campaign_index)
+
+        # Per-day cells (plus per-campaign undated totals) accumulated in row order
+        cells = {m: [[0.0] * self.days for _ in range(campaigns)] for m in METRICS}
+        undated = {m: [0.0] * campaigns for m in METRICS}
+        row_counts = [[0] * self.days for _ in range(campaigns)]
+        first_row = [[len(rows)] * self.days for _ in range(campaigns)]
+        for position, (row, row_date) in enumerate(zip(rows, parsed)):
+            column = self.campaign_index[str(row.get("campaign_id", ""))]
+            if row_date is None:
+                for metric, field in METRICS.items():
+                    undated[metric][column] += float(row.get(field, 0) or 0)
+                continue
+            day = (row_date - self.origin).days
+            for metric, field in METRICS.items():
+                cells[metric][column][day] += float(row.get(field, 0) or 0)
+            row_counts[column][day] += 1
+            if first_row[column][day] > position:
+                first_row[column][day] = position
+
+        self.undated = undated
+        self.first_row = first_row
+        # prefix[metric][campaign][i] = sum of days [0, i)
+        self.prefix = {m: _prefix_rows(cells[m], np) for m in METRICS}
+        self.active_prefix = _prefix_rows([[1 if n else 0 for n in counts] for counts in row_counts], np)
+
+    def _bounds(self, start, end) -> tuple:
+        """Day offsets [lo, hi) for inclusive date bounds, clamped to the cube."""
+        lo = 0 if start is None else min(max((start - self.origin).days, 0), self.days)
+        hi = self.days if end is None else min(max((end - self.origin).days + 1, 0), self.days)
+        return lo, max(lo, hi)
+
+    def _columns(self, campaign_id) -> list:
+        if campaign_id is None:
+            return list(self.campaign_index.values())
+        column = self.campaign_index.get(str(campaign_id))
+        return [] if column is None else [column]
+
+    def sum(self, metric: str, campaign_id=None, start: date = None, end: date = None) -> float:
+        """Total of a metric over [start, end] for one campaign (or all)."""
+        lo, hi = self._bounds(start, end)
+        total = 0.0
+        for column in self._columns(campaign_id):
+            prefix = self.prefix[metric][column]
+            total += prefix[hi] - prefix[lo]
+            if start is None and end is None:
+                total += self.undated[metric][column]
+        return total
+
+    def active_days(self, campaign_id, start: date = None, end: date = None) -> int:
+        """Days in [start, end] with at least one row for the campaign."""
+        lo, hi = self._bounds(start, end)
+        return sum(self.active_prefix[c][hi] - self.active_prefix[c][lo] for c in self._columns(campaign_id))
+
+    def campaigns_in(self, start: date = None, end: date = None) -> list:
+        """Campaign ids with rows in [start, end], ordered by their first such row."""
+        lo, hi = self._bounds(start, end)
+        first = []
+        for campaign_id, column in self.campaign_index.items():
+            if self.active_prefix[column][hi] - self.active_prefix[column][lo] > 0:
+                first.append((min(self.first_row[column][lo:hi]), campaign_id))
+        return [campaign_id for _, campaign_id in sorted(first)]
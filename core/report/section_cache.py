@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Phase B2: Report Section Cache
+
+Each report section (a MetricsComputer._compute_* method, listed in
+MetricsComputer.SECTIONS) declares the snapshot files and config values it
+reads. Its output (the placeholders it sets, plus any attributes later steps
+use) is stored under reports/.section_cache/ keyed by a SHA-256 of:
+
+    section name
+    code version    the code of every module in CODE_FILES, except the
+                    generate_report.py constants that sections declare (their
+                    values are in the declaring sections' config instead), so
+                    a threshold change only invalidates the sections that
+                    declare it
+    files           content digest of every declared file ("missing" if absent)
+    config          the declared config values (JSON)
+
+Re-rendering the same snapshot after a template edit, or after changing one
+threshold, recomputes only the sections whose inputs changed. Sections that
+read the clock (report timestamp, snapshot age) are never cached.
+
+    cache = SectionCache(config_names=MetricsComputer.declared_constants())
+    outputs = cache.fetch("gsc_section", files, config, compute)   # compute() -> JSON-able dict
+    cache.status                                                    # {"gsc_section": "cached" | "computed"}
+
+fetch() may be called from several threads at once (report --jobs).
+
+Entries are plain JSON, written atomically; each section keeps its
+MAX_ENTRIES_PER_SECTION most recent entries. The code digests are kept in
+code_digests.json and recomputed when a code file's mtime or size changes.
+Delete the directory to clear the cache.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CORE_DIR = SCRIPT_DIR.parent
+PROJECT_ROOT = CORE_DIR.parent
+
+DEFAULT_CACHE_DIR = PROJECT_ROOT / "reports" / ".section_cache"
+
+# Modules whose code shapes section output
+CODE_FILES = [
+    SCRIPT_DIR / "generate_report.py",
+    SCRIPT_DIR / "perf_cube.py",
+    SCRIPT_DIR / "section_cache.py",
+    SCRIPT_DIR / "truth_signals_google.py",
+    SCRIPT_DIR / "render_truth_signals.py",
+    CORE_DIR / "snapshot" / "store.py",
+    CORE_DIR / "snapshot" / "entity_index.py",
+    CORE_DIR / "snapshot" / "codec.py",
+]
+
+# The only module whose constants sections may declare as config
+CONFIG_MODULE = SCRIPT_DIR / "generate_report.py"
+
+MAX_ENTRIES_PER_SECTION = 20
+
+
+def _constant_name(node) -> str:
+    """NAME of a module-level `NAME = ...` with one UPPERCASE target, else ""."""
+    if isinstance(node, ast.Assign) and len(node.targets) == 1:
+        target = node.targets[0]
+    elif isinstance(node, ast.AnnAssign):
+        target = node.target
+    else:
+        return ""
+    return target.id if isinstance(target, ast.Name) and target.id.isupper() else ""
+
+
+def code_digests(paths: list = CODE_FILES) -> list:
+    """[[constant name or "", digest]] over the modules' syntax trees (comments and formatting ignored).
+
+    CONFIG_MODULE gets one entry per top-level statement, named for its
+    constant, so declared constants can be left out; every other module is a
+    single unnamed entry.
+    """
+    digests = []
+    for path in paths:
+        if not path.exists():
+            digests.append(["", hashlib.sha256(f"{path.name} missing".encode("utf-8")).hexdigest()])
+            continue
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        if path == CONFIG_MODULE:
+            for node in tree.body:
+                dump = f"{path.name}:{ast.dump(node)}"
+                digests.append([_constant_name(node), hashlib.sha256(dump.encode("utf-8")).hexdigest()])
+        else:
+            dump = f"{path.name}:{ast.dump(tree)}"
+            digests.append(["", hashlib.sha256(dump.encode("utf-8")).hexdigest()])
+    return digests
+
+
+def code_version(digests: list, declared=()) -> str:
+    """Digest of the code, leaving out the CONFIG_MODULE constants in `declared`."""
+    digest = hashlib.sha256()
+    for name, node_digest in digests:
+        if not (name and name in declared):
+            digest.update(node_digest.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SectionCache:
+    """On-disk cache of report section outputs."""
+
+    def __init__(self, cache_dir: Path = None, enabled: bool = True, config_names=()):
+        """
+        Args:
+            config_names: CONFIG_MODULE constants that sections declare as config
+        """
+        self.config_names = set(config_names)
+        self.cache_dir = Path(cache_dir or os.environ.get("REPORT_SECTION_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.enabled = enabled
+        self.status = {}  # section -> "cached" | "computed", in run order
+        self._file_digests = {}
+        self._code_digests = None
+        self._lock = threading.Lock()  # Sections may be fetched from several threads
+
+    def _file_digest(self, path: Path) -> str:
+        key = str(path)
+        if key not in self._file_digests:
+            if path.exists():
+                digest = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(chunk)
+                self._file_digests[key] = digest.hexdigest()
+            else:
+                self._file_digests[key] = "missing"
+        return self._file_digests[key]
+
+    def _current_code_digests(self) -> list:
+        """code_digests(), reused from the cache directory while the code files are untouched."""
+        stamps = [[str(p), p.stat().st_mtime_ns, p.stat().st_size] if p.exists() else [str(p)] for p in CODE_FILES]
+        path = self.cache_dir / "code_digests.json"
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+            if saved.get("files") == stamps:
+                return saved["digests"]
+        except (OSError, json.JSONDecodeError, KeyError):
+            pass
+        digests = code_digests()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"files": stamps, "digests": digests}, f)
+        os.replace(tmp_path, path)
+        return digests
+
+    def key(self, section: str, files: list, config: dict) -> str:
+        with self._lock:
+            if self._code_digests is None:
+                self._code_digests = self._current_code_digests()
+        payload = {
+            "section": section,
+            "code": code_version(self._code_digests, declared=self.config_names),
+            "files": {str(p): self._file_digest(Path(p)) for p in files},
+            "config": config,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, section: str, key: str) -> Path:
+        return self.cache_dir / f"{section}.{key[:24]}.json"
+
+    def get(self, section: str, key: str):
+        """Cached outputs, or None."""
+        path = self._entry_path(section, key)
+        if not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None  # Unreadable entry: recompute and overwrite
+        return entry.get("outputs") if entry.get("key") == key else None
+
+    def put(self, section: str, key: str, outputs: dict):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(section, key)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"section": section, "key": key, "outputs": outputs}, f)
+        os.replace(tmp_path, path)
+        self._prune(section)
+
+    def _prune(self, section: str):
+        entries = sorted(self.cache_dir.glob(f"{section}.*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in entries[MAX_ENTRIES_PER_SECTION:]:
+            stale.unlink(missing_ok=True)
+
+    def fetch(self, section: str, files: list, config: dict, compute) -> dict:
+        """Cached outputs for these inputs, else compute() (stored for next time)."""
+        if not self.enabled:
+            self.status[section] = "computed"
+            return compute()
+        key = self.key(section, files, config)
+        outputs = self.get(section, key)
+        if outputs is not None:
+            self.status[section] = "cached"
+            return outputs
+        outputs = json.loads(json.dumps(compute()))  # Same types a cache hit returns
+        self.put(section, key, outputs)
+        self.status[section] = "computed"
+        return outputs
@@ -13,6 +13,8 @@ from collections import Counter
 from pathlib import Path
 from typing import Optional
 
+from core.snapshot.codec import open_snapshot_file
+
 
 def extract_truth_signals(
     snapshot_path: Path,
@@ -98,7 +100,7 @@ def _check_rsa_asset_coverage(ads_path: Path, ads_recs: Optional[dict]) -> list:
         return signals
 
     try:
-        with open(ads_file) as f:
+        with open_snapshot_file(ads_file) as f:
             ads_data = json.load(f)
     except Exception:
         return signals
@@ -179,7 +181,7 @@ def _check_keyword_recommendations(ads_path: Path, ads_recs: Optional[dict]) ->
 
     if keywords_file.exists():
         try:
-            with open(keywords_file) as f:
+            with open_snapshot_file(keywords_file) as f:
                 kw_data = json.load(f)
                 existing_keywords = kw_data.get("keywords", [])
         except Exception:
@@ -187,7 +189,7 @@ def _check_keyword_recommendations(ads_path: Path, ads_recs: Optional[dict]) ->
 
     if negatives_file.exists():
         try:
-            with open(negatives_file) as f:
+            with open_snapshot_file(negatives_file) as f:
                 neg_data = json.load(f)
                 existing_negatives = neg_data.get("negative_keywords", [])
         except Exception:
@@ -278,7 +280,7 @@ def _check_budget_recommendations(
     ads_campaigns_file = ads_path / "campaigns.json"
     if ads_campaigns_file.exists():
         try:
-            with open(ads_campaigns_file) as f:
+            with open_snapshot_file(ads_campaigns_file) as f:
                 camp_data = json.load(f)
                 campaigns.extend(camp_data.get("campaigns", []))
         except Exception:
@@ -287,7 +289,7 @@ def _check_budget_recommendations(
     pmax_campaigns_file = pmax_path / "campaigns.json"
     if pmax_campaigns_file.exists():
         try:
-            with open(pmax_campaigns_file) as f:
+            with open_snapshot_file(pmax_campaigns_file) as f:
                 camp_data = json.load(f)
                 campaigns.extend(camp_data.get("campaigns", []))
         except Exception:
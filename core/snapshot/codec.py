@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Snapshot File Encoding
+
+Snapshot files keep their .json names whatever the on-disk encoding, so
+paths in SCHEMA.md and every existence check stay valid. The encoding is
+chosen at dump time and recorded in _manifest.json:
+
+    json   Pretty-printed UTF-8 JSON, indent=2 (default)
+    gzip   Compact JSON (no whitespace), gzip level 6, mtime 0
+    zstd   Compact JSON, zstandard level 10 (requires `pip install zstandard`)
+
+Readers never consult the manifest: open_snapshot_file() sniffs the magic
+bytes and returns a streaming binary reader that decompresses on the fly, so
+old snapshots and new ones load through the same call.
+
+Compressed output is deterministic (gzip header mtime fixed at 0) so that
+identical content still deduplicates in the blob store.
+
+_manifest.json itself is always plain JSON.
+
+Record lists the dump keeps on disk (core/dump/spool.py) are iterables, not
+lists; dump_json() writes them as JSON arrays one record at a time, with the
+same bytes json.dump would produce for the equivalent list.
+
+Usage:
+    with open_snapshot_file(path) as f:
+        data = json.load(f)
+"""
+
+import codecs
+import gzip
+import json
+
+SNAPSHOT_ENCODINGS = ("json", "gzip", "zstd")
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+COMPACT_SEPARATORS = (",", ":")
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise Exception("zstd snapshot encoding requires the zstandard package: pip install zstandard")
+    return zstandard
+
+
+def detect_encoding(path) -> str:
+    """Return 'json', 'gzip' or 'zstd' from the file's leading bytes."""
+    with open(path, "rb") as f:
+        head = f.read(4)
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(ZSTD_MAGIC):
+        return "zstd"
+    return "json"
+
+
+def open_snapshot_file(path):
+    """Open a snapshot file for reading, decompressing transparently.
+
+    Returns a binary file-like object usable as a context manager; json.load
+    accepts it directly.
+    """
+    encoding = detect_encoding(path)
+    if encoding == "gzip":
+        return gzip.open(path, "rb")
+    if encoding == "zstd":
+        zstandard = _import_zstandard()
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return open(path, "rb")
+
+
+def read_json(path):
+    """Load a snapshot JSON file in any supported encoding."""
+    with open_snapshot_file(path) as f:
+        return json.load(f)
+
+
+def _is_record_stream(value) -> bool:
+    """An iterable of records that is not a JSON container (e.g. spool.SpooledRecords)."""
+    return (hasattr(value, "__iter__") and hasattr(value, "__len__")
+            and not isinstance(value, (str, bytes, bytearray, dict, list, tuple, set, frozenset)))
+
+
+def _has_record_stream(value) -> bool:
+    if isinstance(value, dict):
+        return any(_has_record_stream(v) for v in value.values())
+    return _is_record_stream(value)
+
+
+def _json_chunks(value, indent, separators, level: int = 0):
+    """json.dump's output for value in chunks, iterating record streams element by element."""
+    if not _has_record_stream(value):
+        text = json.dumps(value, indent=indent, separators=separators, default=str)
+        yield text.replace("\n", "\n" + " " * (indent * level)) if indent else text
+        return
+    opening, closing = ("{", "}") if isinstance(value, dict) else ("[", "]")
+    item_separator, key_separator = separators
+    newline = "\n" + " " * (indent * (level + 1)) if indent else ""
+    items = iter(value.items() if isinstance(value, dict) else value)
+    first = True
+    for item in items:
+        yield (opening + newline) if first else (item_separator + newline)
+        first = False
+        if isinstance(value, dict):
+            key, item = item
+            yield json.dumps(key if isinstance(key, str) else json.dumps(key)) + key_separator
+        yield from _json_chunks(item, indent, separators, level + 1)
+    if first:
+        yield opening + closing
+    else:
+        yield ("\n" + " " * (indent * level) if indent else "") + closing
+
+
+def _write_json(data, text_file, indent=None, separators=COMPACT_SEPARATORS):
+    if _has_record_stream(data):
+        for chunk in _json_chunks(data, indent, separators):
+            text_file.write(chunk)
+    else:
+        json.dump(data, text_file, indent=indent, separators=separators, default=str)
+
+
+def dump_json(data, binary_file, encoding: str = "json"):
+    """Serialize data to a binary file object in the given encoding."""
+    if encoding == "json":
+        _write_json(data, codecs.getwriter("utf-8")(binary_file), indent=2, separators=(",", ": "))
+    elif encoding == "gzip":
+        with gzip.GzipFile(filename="", mode="wb", fileobj=binary_file, compresslevel=GZIP_LEVEL, mtime=0) as gz:
+            _write_json(data, codecs.getwriter("utf-8")(gz))
+    elif encoding == "zstd":
+        zstandard = _import_zstandard()
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        with compressor.stream_writer(binary_file, closefd=False) as zf:
+            _write_json(data, codecs.getwriter("utf-8")(zf))
+    else:
+        raise ValueError(f"Unknown snapshot encoding: {encoding} (expected one of {', '.join(SNAPSHOT_ENCODINGS)})")
+
+
+def manifest_section(encoding: str) -> dict:
+    """Encoding block recorded in _manifest.json."""
+    return {
+        "format": encoding,
+        "separators": "indent=2" if encoding == "json" else "compact",
+        "level": {"gzip": GZIP_LEVEL, "zstd": ZSTD_LEVEL}.get(encoding),
+        "excluded": ["_manifest.json", "errors.jsonl"],
+    }
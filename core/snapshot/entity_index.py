@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Snapshot Entity Index (_index.bin)
+
+Binary, memory-mapped replacement for _index.json. Readers map the file and
+binary-search it, so one lookup costs O(log n) and never parses the whole
+index.
+
+Tables (one per entity type), each holding:
+    keys      primary keys (entity ids), sorted
+    records   one compact JSON record per key, in key order
+    by_FIELD  secondary indexes: the field's distinct values, sorted, each
+              with the ascending row numbers of the records that have it
+
+    campaigns  by_status, by_type                 (whole normalized record)
+    ad_groups  by_campaign_id, by_status
+    keywords   by_campaign_id, by_ad_group_id, by_status
+    products   by_brand, by_approval_status, by_offer_id, by_sku
+
+File layout (little-endian; every section starts on an 8-byte boundary):
+
+    b"SNAPIDX1"                  magic
+    uint64                       header length
+    header                       JSON: version, totals, section offsets per table
+                                 (relative to the end of the header)
+    sections                     string arrays and postings
+
+A string array is uint64 offsets[n + 1] followed by the UTF-8 bytes of its
+n strings; postings are uint64 offsets[m + 1] followed by uint32 row numbers.
+
+Normalized files may be pretty-printed or compressed (see codec.py), so
+byte offsets into them would not be stable; each table carries compact
+copies of the fields listed in INDEX_TABLES instead.
+
+Usage:
+    index = EntityIndex.open(snapshot_dir)      # None if the snapshot has no _index.bin
+    index.get("campaigns", "123456789")         # record dict or None
+    index.find("keywords", "campaign_id", "123456789")
+    index.values("products", "brand")
+"""
+
+import json
+import mmap
+import struct
+from bisect import bisect_left
+from pathlib import Path
+
+from core.snapshot.codec import open_snapshot_file
+
+INDEX_FILE = "_index.bin"
+LEGACY_INDEX_FILE = "_index.json"
+INDEX_VERSION = 1
+
+MAGIC = b"SNAPIDX1"
+
+# table -> (secondary index fields, stored record fields; None keeps the whole record)
+INDEX_TABLES = {
+    "campaigns": (("status", "type"), None),
+    "ad_groups": (("campaign_id", "status"), ("id", "name", "campaign_id", "status", "type")),
+    "keywords": (("campaign_id", "ad_group_id", "status"),
+                 ("id", "text", "match_type", "status", "ad_group_id", "campaign_id")),
+    "products": (("brand", "approval_status", "offer_id", "sku"),
+                 ("id", "offer_id", "sku", "title", "brand", "price", "approval_status")),
+}
+
+
+def _key(value) -> str:
+    return "" if value is None else str(value)
+
+
+class _Writer:
+    """Accumulates aligned sections and their offsets."""
+
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+
+    def _add(self, data: bytes) -> int:
+        offset = self.size
+        self.chunks.append(data)
+        self.size += len(data)
+        padding = -self.size % 8
+        if padding:
+            self.chunks.append(b"\0" * padding)
+            self.size += padding
+        return offset
+
+    def strings(self, values: list) -> int:
+        encoded = [v.encode("utf-8") for v in values]
+        offsets, position = [0], 0
+        for data in encoded:
+            position += len(data)
+            offsets.append(position)
+        return self._add(struct.pack(f"<{len(offsets)}Q", *offsets) + b"".join(encoded))
+
+    def postings(self, groups: list) -> int:
+        offsets, rows = [0], []
+        for group in groups:
+            rows.extend(group)
+            offsets.append(len(rows))
+        return self._add(struct.pack(f"<{len(offsets)}Q", *offsets) + struct.pack(f"<{len(rows)}I", *rows))
+
+
+def encode_index(tables: dict, totals: dict) -> bytes:
+    """Serialize {table: [record dicts with "id"]} and totals into _index.bin bytes.
+
+    Records with no id are skipped; for a repeated id the first record wins.
+    """
+    writer = _Writer()
+    header = {"version": INDEX_VERSION, "totals": totals, "tables": {}}
+    for name, records in tables.items():
+        secondary, stored = INDEX_TABLES[name]
+        by_key = {}
+        for record in records:
+            key = _key(record.get("id"))
+            if key and key not in by_key:
+                by_key[key] = record if stored is None else {f: record.get(f) for f in stored}
+        keys = sorted(by_key)
+        table = {
+            "count": len(keys),
+            "keys": writer.strings(keys),
+            "records": writer.strings([json.dumps(by_key[k], separators=(",", ":")) for k in keys]),
+            "secondary": {},
+        }
+        for field in secondary:
+            groups = {}
+            for row, key in enumerate(keys):
+                value = by_key[key].get(field)
+                if value is not None:
+                    groups.setdefault(_key(value), []).append(row)
+            values = sorted(groups)
+            table["secondary"][field] = {
+                "count": len(values),
+                "values": writer.strings(values),
+                "rows": writer.postings([groups[v] for v in values]),
+            }
+        header["tables"][name] = table
+
+    # Section offsets in the header are relative to the end of the header
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * (-(len(MAGIC) + 8 + len(header_bytes)) % 8)
+    return MAGIC + struct.pack("<Q", len(header_bytes)) + header_bytes + b"".join(writer.chunks)
+
+
+class _StringArray:
+    """Read-only sequence over a string array section (works with bisect)."""
+
+    def __init__(self, buf, offset: int, count: int):
+        self.buf = buf
+        self.offset = offset
+        self.count = count
+        self.data = offset + 8 * (count + 1)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def span(self, i: int) -> tuple:
+        start, end = struct.unpack_from("<2Q", self.buf, self.offset + 8 * i)
+        return self.data + start, self.data + end
+
+    def __getitem__(self, i: int) -> str:
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        start, end = self.span(i)
+        return self.buf[start:end].decode("utf-8")
+
+    def find(self, key: str):
+        """Position of key, or None."""
+        i = bisect_left(self, key)
+        return i if i < self.count and self[i] == key else None
+
+
+class IndexTable:
+    """One entity table of a mapped index."""
+
+    def __init__(self, buf, base: int, info: dict):
+        self.buf = buf
+        self.base = base
+        self.count = info["count"]
+        self.keys = _StringArray(buf, base + info["keys"], self.count)
+        self.records = _StringArray(buf, base + info["records"], self.count)
+        self.secondary = info["secondary"]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, row: int) -> dict:
+        return json.loads(self.records[row])
+
+    def get(self, key) -> dict:
+        row = self.keys.find(_key(key))
+        return None if row is None else self.record(row)
+
+    def __contains__(self, key) -> bool:
+        return self.keys.find(_key(key)) is not None
+
+    def rows_where(self, field: str, value) -> list:
+        """Row numbers whose `field` equals value (secondary index lookup)."""
+        if field not in self.secondary:
+            raise Exception(f"No secondary index on {field} (indexed: {', '.join(self.secondary) or 'none'})")
+        info = self.secondary[field]
+        values = _StringArray(self.buf, self.base + info["values"], info["count"])
+        i = values.find(_key(value))
+        if i is None:
+            return []
+        offsets = self.base + info["rows"]
+        start, end = struct.unpack_from("<2Q", self.buf, offsets + 8 * i)
+        rows_at = offsets + 8 * (info["count"] + 1)
+        return list(struct.unpack_from(f"<{end - start}I", self.buf, rows_at + 4 * start))
+
+    def ids_where(self, field: str, value) -> list:
+        return [self.keys[row] for row in self.rows_where(field, value)]
+
+    def find(self, field: str, value) -> list:
+        return [self.record(row) for row in self.rows_where(field, value)]
+
+    def values(self, field: str) -> dict:
+        """{distinct value: record count} of a secondary index."""
+        info = self.secondary[field]
+        values = _StringArray(self.buf, self.base + info["values"], info["count"])
+        counts = struct.unpack_from(f"<{info['count'] + 1}Q", self.buf, self.base + info["rows"])
+        return {values[i]: counts[i + 1] - counts[i] for i in range(info["count"])}
+
+
+class EntityIndex:
+    """Memory-mapped _index.bin of one snapshot."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.buf[:len(MAGIC)] != MAGIC:
+            self.buf.close()
+            raise Exception(f"{self.path} is not a snapshot entity index")
+        (header_length,) = struct.unpack_from("<Q", self.buf, len(MAGIC))
+        start = len(MAGIC) + 8
+        self.header = json.loads(self.buf[start:start + header_length].decode("utf-8"))
+        self.base = start + header_length
+        self._tables = {}
+
+    @classmethod
+    def open(cls, snapshot_dir: Path):
+        """The snapshot's index, or None if it has no _index.bin (older snapshots)."""
+        path = Path(snapshot_dir) / INDEX_FILE
+        return cls(path) if path.exists() else None
+
+    @property
+    def totals(self) -> dict:
+        return self.header["totals"]
+
+    def table(self, name: str) -> IndexTable:
+        if name not in self._tables:
+            if name not in self.header["tables"]:
+                raise Exception(f"No {name} table in {self.path}")
+            self._tables[name] = IndexTable(self.buf, self.base, self.header["tables"][name])
+        return self._tables[name]
+
+    def has_table(self, name: str) -> bool:
+        return name in self.header["tables"]
+
+    def get(self, table: str, key) -> dict:
+        return self.table(table).get(key)
+
+    def find(self, table: str, field: str, value) -> list:
+        return self.table(table).find(field, value)
+
+    def values(self, table: str, field: str) -> dict:
+        return self.table(table).values(field)
+
+    def close(self):
+        self._tables = {}
+        self.buf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def index_totals(snapshot_dir: Path) -> dict:
+    """Entity totals from _index.bin, or from a legacy _index.json ({} if neither)."""
+    snapshot_dir = Path(snapshot_dir)
+    index = EntityIndex.open(snapshot_dir)
+    if index is not None:
+        with index:
+            return dict(index.totals)
+    legacy = snapshot_dir / LEGACY_INDEX_FILE
+    if legacy.exists():
+        with open_snapshot_file(legacy) as f:
+            return json.load(f).get("totals", {})
+    return {}
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store
+
+One read path for everything that consumes a snapshot (report, planner, MCP
+tools). Files are parsed on first attribute access and memoized, so a run
+only pays for the data it actually reads: a planner rule set that never looks
+at assets never parses the assets file.
+
+    store = SnapshotStore(snapshot_dir)
+    store.campaigns                  # normalized/ads/campaigns.json, parsed now
+    store.campaigns                  # same dict, no I/O
+    store.campaigns_by_id["123"]     # id-keyed view, built once
+    store.index                      # EntityIndex (_index.bin) or None
+    store.trace                      # [{"path", "bytes", "seconds", "records"}] per parsed file
+
+Missing files load as {} and are listed in store.missing. Attributes are
+declared in FILES (normalized and top-level files) and VIEWS (id -> record
+dicts over one or more files); anything else is an AttributeError as usual.
+
+Safe to share between threads (report --jobs): each file or view is built
+once, under its own lock, so threads reading different files do not wait
+on each other.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+from core.snapshot.codec import read_json
+from core.snapshot.entity_index import EntityIndex
+
+# attribute -> snapshot-relative path
+FILES = {
+    "manifest": "_manifest.json",
+    # Ads
+    "campaigns": "normalized/ads/campaigns.json",
+    "ad_groups": "normalized/ads/ad_groups.json",
+    "keywords": "normalized/ads/keywords.json",
+    "negatives": "normalized/ads/negatives.json",
+    "ads": "normalized/ads/ads.json",
+    "assets": "normalized/ads/assets.json",
+    "change_history": "normalized/ads/change_history.json",
+    "performance": "normalized/ads/performance.json",
+    # PMax
+    "pmax_campaigns": "normalized/pmax/campaigns.json",
+    "asset_groups": "normalized/pmax/asset_groups.json",
+    "listing_groups": "normalized/pmax/listing_groups.json",
+    "brand_exclusions": "normalized/pmax/brand_exclusions.json",
+    # Merchant
+    "merchant_products": "normalized/merchant/products.json",
+    "merchant_status": "normalized/merchant/product_status.json",
+    # GSC
+    "gsc_queries": "normalized/gsc/queries.json",
+    "gsc_pages": "normalized/gsc/pages.json",
+    "gsc_summary": "normalized/gsc/summary.json",
+    "gsc_devices": "normalized/gsc/devices.json",
+    "gsc_countries": "normalized/gsc/countries.json",
+    "gsc_dates": "normalized/gsc/dates.json",
+    "gsc_query_pages": "normalized/gsc/query_pages.json",
+}
+
+# view -> (source attributes, key field); earlier sources win on a repeated key
+VIEWS = {
+    "campaigns_by_id": (("campaigns", "pmax_campaigns"), "id"),
+    "ad_groups_by_id": (("ad_groups",), "id"),
+    "keywords_by_id": (("keywords",), "id"),
+    "products_by_id": (("merchant_products",), "id"),
+    "assets_by_id": (("assets",), "id"),
+}
+
+REQUIRED_FILES = [
+    "_manifest.json",
+    "normalized/ads/campaigns.json",
+    "normalized/ads/keywords.json",
+]
+
+
+class SnapshotStore:
+    """Lazy, memoized access to one snapshot's files."""
+
+    def __init__(self, snapshot_path: Path, required_files: list = REQUIRED_FILES):
+        """
+        Args:
+            snapshot_path: Snapshot folder
+            required_files: Paths that must exist (FileNotFoundError otherwise);
+                checked up front, parsed only when used
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.snapshot_id = self.snapshot_path.name
+        self.missing = []
+        self.trace = []
+        self._files = {}
+        self._locks = {}
+
+        if not self.snapshot_path.exists():
+            raise FileNotFoundError(f"Snapshot not found: {self.snapshot_path}")
+
+        missing_required = [p for p in required_files if not self.exists(p)]
+        if missing_required:
+            raise FileNotFoundError(
+                f"Missing required files in snapshot:\n" +
+                "\n".join(f"  - {f}" for f in missing_required)
+            )
+
+    def _lock(self, key: str) -> threading.Lock:
+        return self._locks.setdefault(key, threading.Lock())  # setdefault is atomic
+
+    def __getattr__(self, name: str):
+        # Only called for attributes not set yet: load, then memoize on the instance
+        if name not in FILES and name not in VIEWS and name != "index":
+            raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+        with self._lock(name):
+            if name in self.__dict__:  # Built by another thread while we waited
+                return self.__dict__[name]
+            if name in FILES:
+                value = self.load(FILES[name])
+            elif name in VIEWS:
+                sources, key_field = VIEWS[name]
+                value = {}
+                for source in sources:
+                    for record in getattr(self, source).get("records", []):
+                        value.setdefault(str(record.get(key_field)), record)
+            else:
+                value = EntityIndex.open(self.snapshot_path)  # None before _index.bin existed
+            setattr(self, name, value)
+        return value
+
+    def exists(self, rel_path: str) -> bool:
+        return (self.snapshot_path / rel_path).exists()
+
+    def load(self, rel_path: str) -> dict:
+        """Parse a snapshot file once ({} if missing)."""
+        if rel_path in self._files:
+            return self._files[rel_path]
+        with self._lock(rel_path):
+            if rel_path in self._files:
+                return self._files[rel_path]
+            path = self.snapshot_path / rel_path
+            if not path.exists():
+                self.missing.append(rel_path)
+                data = {}
+            else:
+                started = time.perf_counter()
+                data = read_json(path)
+                records = data.get("records") if isinstance(data, dict) else None
+                self.trace.append({
+                    "path": rel_path,
+                    "bytes": path.stat().st_size,
+                    "seconds": round(time.perf_counter() - started, 4),
+                    "records": len(records) if isinstance(records, list) else None,
+                })
+            self._files[rel_path] = data
+        return data
+
+    def get_campaign_by_id(self, campaign_id: str) -> dict:
+        """Get campaign info by ID (campaigns.json record first, then PMax)."""
+        return self.campaigns_by_id.get(str(campaign_id), {})
+
+    def get_campaign_name(self, campaign_id: str) -> str:
+        """Get campaign name from the entity index (or the campaign files without one)."""
+        if self.index is None:
+            return self.get_campaign_by_id(campaign_id).get("name", "Unknown")
+        campaign = self.index.get("campaigns", campaign_id)
+        return campaign.get("name") if campaign else "Unknown"
+
+    def trace_lines(self) -> list:
+        """Printable load trace, slowest file first."""
+        lines = []
+        for entry in sorted(self.trace, key=lambda e: e["seconds"], reverse=True):
+            records = f"{entry['records']:,} records" if entry["records"] is not None else "-"
+            lines.append(f"  {entry['seconds'] * 1000:8.1f} ms  {entry['bytes'] / 1e6:7.2f} MB  {records:>16}  {entry['path']}")
+        total_seconds = sum(e["seconds"] for e in self.trace)
+        total_bytes = sum(e["bytes"] for e in self.trace)
+        lines.append(f"  {total_seconds * 1000:8.1f} ms  {total_bytes / 1e6:7.2f} MB  "
+                     f"{len(self.trace)} of {len(FILES)} known files parsed")
+        return lines
@@ -7,6 +7,7 @@ Usage: python diag/goodman_pmax_diagnostic.py
 """
 
 import os
+import sys
 import json
 import requests
 from pathlib import Path
@@ -14,6 +15,8 @@ from dotenv import load_dotenv
 
 # Load environment
 load_dotenv(Path(__file__).parent.parent / ".env")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.auth.oauth import get_access_token as get_cached_access_token
 
 # Configuration
 CUSTOMER_ID = os.getenv("GOOGLE_ADS_CUSTOMER_ID")
@@ -29,17 +32,7 @@ PMAX_CAMPAIGN_ID = "20815709270"  # Products merchant campaign
 
 def get_access_token():
     """Exchange refresh token for access token."""
-    response = requests.post(
-        "https://oauth2.googleapis.com/token",
-        data={
-            "client_id": CLIENT_ID,
-            "client_secret": CLIENT_SECRET,
-            "refresh_token": REFRESH_TOKEN,
-            "grant_type": "refresh_token",
-        },
-    )
-    response.raise_for_status()
-    return response.json()["access_token"]
+    return get_cached_access_token(CLIENT_ID, CLIENT_SECRET, REFRESH_TOKEN)
 
 
 def google_ads_query(access_token, query):
@@ -4,12 +4,15 @@ Follow-up diagnostic: Check Goodman product types vs listing group filters.
 """
 
 import os
+import sys
 import json
 import requests
 from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv(Path(__file__).parent.parent / ".env")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.auth.oauth import get_access_token as get_cached_access_token
 
 CUSTOMER_ID = os.getenv("GOOGLE_ADS_CUSTOMER_ID")
 LOGIN_CUSTOMER_ID = os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID")
@@ -21,17 +24,7 @@ MERCHANT_CENTER_ID = os.getenv("MERCHANT_CENTER_ID")
 
 
 def get_access_token():
-    response = requests.post(
-        "https://oauth2.googleapis.com/token",
-        data={
-            "client_id": CLIENT_ID,
-            "client_secret": CLIENT_SECRET,
-            "refresh_token": REFRESH_TOKEN,
-            "grant_type": "refresh_token",
-        },
-    )
-    response.raise_for_status()
-    return response.json()["access_token"]
+    return get_cached_access_token(CLIENT_ID, CLIENT_SECRET, REFRESH_TOKEN)
 
 
 def main():
@@ -57,6 +57,9 @@ from pathlib import Path
 import requests
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from core.auth.oauth import get_access_token as get_cached_access_token
+
 API_VERSION = "v19"
 
 # =============================================================================
@@ -143,19 +146,10 @@ def get_credentials():
 
 
 def get_access_token(credentials):
-    """Exchange refresh token for access token."""
-    response = requests.post(
-        "https://oauth2.googleapis.com/token",
-        data={
-            "client_id": credentials["client_id"],
-            "client_secret": credentials["client_secret"],
-            "refresh_token": credentials["refresh_token"],
-            "grant_type": "refresh_token",
-        },
+    """Exchange refresh token for access token (shared cache, see core/auth/oauth.py)."""
+    return get_cached_access_token(
+        credentials["client_id"], credentials["client_secret"], credentials["refresh_token"]
     )
-    if response.status_code != 200:
-        raise Exception(f"Token refresh failed: {response.text}")
-    return response.json()["access_token"]
 
 
 def google_ads_query(credentials, access_token, query):
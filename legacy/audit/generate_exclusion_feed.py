@@ -46,6 +46,9 @@ from pathlib import Path
 import requests
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from core.auth.oauth import get_access_token as get_cached_access_token
+
 # =============================================================================
 # CONFIGURATION - Edit these to control what shows in Shopping ads
 # =============================================================================
@@ -80,20 +83,12 @@ def load_env():
 
 
 def get_access_token():
-    """Get OAuth access token."""
-    response = requests.post(
-        "https://oauth2.googleapis.com/token",
-        data={
-            "client_id": os.getenv("GOOGLE_ADS_CLIENT_ID"),
-            "client_secret": os.getenv("GOOGLE_ADS_CLIENT_SECRET"),
-            "refresh_token": os.getenv("GOOGLE_ADS_REFRESH_TOKEN"),
-            "grant_type": "refresh_token",
-        },
-    )
-    if response.status_code != 200:
-        print(f"ERROR: Token refresh failed: {response.text}")
+    """Get OAuth access token (shared cache, see core/auth/oauth.py)."""
+    try:
+        return get_cached_access_token()
+    except Exception as e:
+        print(f"ERROR: {e}")
         sys.exit(1)
-    return response.json()["access_token"]
 
 
 def get_all_products(merchant_id, access_token):